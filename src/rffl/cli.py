@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from typing import Any
 
 import typer
 from dotenv import load_dotenv, find_dotenv
@@ -9,12 +10,19 @@ from rich.console import Console
 
 from .core.api import ESPNCredentials
 from .core.draft import export_draft
-from .core.exceptions import RecipeLockedError
+from .core.exceptions import PathResolutionError, RecipeLockedError
 from .core.export import export_boxscores
 from .core.h2h import export_h2h
 from .core.inbox import ensure_inbox_clean, list_inbox_files
 from .core.lineup import validate_lineup_file
+from .core.tables import TABLE_FORMATS
 from .core.transactions import export_transactions
+from .core.transport import (
+    CACHE_MODES,
+    DEFAULT_RATE,
+    configure_http_cache,
+    configure_rate_limit,
+)
 from .core.validation import validate_boxscores
 from .recipes.loader import find_repo_root, resolve_output_path
 from .recipes.migrate import migrate_recipe
@@ -41,6 +49,55 @@ app.add_typer(forensic_app, name="forensic", help="Forensic commands")
 app.add_typer(utils_app, name="utils", help="Utility commands")
 
 
+def _default_cache_dir() -> Path:
+    """Return the HTTP cache directory (repo-local when run inside a checkout)."""
+    try:
+        return find_repo_root() / ".cache" / "http"
+    except PathResolutionError:
+        return Path.home() / ".cache" / "rffl" / "http"
+
+
+@app.callback()
+def main(
+    cache: str = typer.Option(
+        "on",
+        envvar="RFFL_HTTP_CACHE",
+        help="HTTP response cache mode: on, off, refresh (re-fetch and record), replay",
+    ),
+    replay: bool = typer.Option(
+        False, "--replay", help="Serve only recorded responses (shorthand for --cache replay)"
+    ),
+    cache_dir: str = typer.Option(
+        None, envvar="RFFL_HTTP_CACHE_DIR", help="HTTP cache directory (default .cache/http)"
+    ),
+    max_rps: float = typer.Option(
+        DEFAULT_RATE, min=0.1, envvar="RFFL_MAX_RPS", help="Max ESPN requests per second"
+    ),
+    pro_schedule_max_age: float | None = typer.Option(
+        None,
+        min=0.0,
+        envvar="RFFL_PRO_SCHEDULE_MAX_AGE",
+        help="Seconds a saved NFL schedule is reused before re-checking ESPN (default 12h)",
+    ),
+):
+    """RFFL Fantasy Football data toolkit."""
+    mode = "replay" if replay else cache
+    if mode not in CACHE_MODES:
+        console.print(
+            f"[red]❌ Invalid --cache mode '{mode}'. Use one of: {', '.join(CACHE_MODES)}[/red]"
+        )
+        raise typer.Exit(1)
+    configure_http_cache(
+        Path(cache_dir) if cache_dir else _default_cache_dir(),
+        mode=mode,  # type: ignore[arg-type]
+    )
+    configure_rate_limit(rate=max_rps)
+    if pro_schedule_max_age is not None:
+        from .live.report import configure_pro_schedule_cache
+
+        configure_pro_schedule_cache(pro_schedule_max_age)
+
+
 # Core commands
 @core_app.command("export")
 def cmd_export(
@@ -59,6 +116,21 @@ def cmd_export(
         0.0,
         help="Allowed |sum(starters rs_projected_pf) - team_projected_total| for --require-clean",
     ),
+    workers: int = typer.Option(
+        1, min=1, help="Weeks to fetch concurrently (1 = serial; output is identical)"
+    ),
+    engine: str = typer.Option(
+        "espn_api",
+        help="Fetch engine: espn_api (League objects) or raw (league JSON, no player pool)",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only fetch weeks missing from the CSV or still live, and merge them in place",
+    ),
+    output_format: str = typer.Option(
+        "csv", "--format", help="Output format when --out is not given: csv or parquet"
+    ),
 ):
     """Export ESPN fantasy football boxscores to CSV format."""
     league_id = league
@@ -69,6 +141,12 @@ def cmd_export(
     if league_id is None:
         console.print("[red]❌ Missing league id. Pass --league or set $LEAGUE in .env[/red]")
         raise typer.Exit(1)
+    if engine not in ("espn_api", "raw"):
+        console.print(f"[red]❌ Invalid engine: {engine}. Must be espn_api or raw[/red]")
+        raise typer.Exit(1)
+    if output_format not in TABLE_FORMATS:
+        console.print(f"[red]❌ Invalid format: {output_format}. Must be csv or parquet[/red]")
+        raise typer.Exit(1)
 
     try:
         repo_root = find_repo_root()
@@ -76,7 +154,7 @@ def cmd_export(
             espn_s2=os.getenv("ESPN_S2"),
             swid=os.getenv("SWID"),
         )
-        output_path = resolve_output_path(out or f"data/seasons/{year}/boxscores.csv")
+        output_path = resolve_output_path(out or f"data/seasons/{year}/boxscores.{output_format}")
         path = export_boxscores(
             league_id=league_id,
             year=year,
@@ -89,6 +167,9 @@ def cmd_export(
             credentials=credentials,
             public_only=True,  # Default to public-only
             repo_root=repo_root,
+            workers=workers,
+            engine=engine,  # type: ignore[arg-type]
+            incremental=incremental,
         )
     except Exception as e:
         console.print(f"[red]❌ Export failed: {e}[/red]")
@@ -139,6 +220,9 @@ def cmd_draft(
     league: int | None = typer.Option(None, help="ESPN leagueId (defaults to $LEAGUE)"),
     year: int = typer.Option(..., help="Season year"),
     out: str = typer.Option(None, help="Output CSV path"),
+    output_format: str = typer.Option(
+        "csv", "--format", help="Output format when --out is not given: csv or parquet"
+    ),
 ):
     """Export season draft results to CSV (snake or auction)."""
     league_id = league
@@ -149,10 +233,13 @@ def cmd_draft(
     if league_id is None:
         console.print("[red]❌ Missing league id. Pass --league or set $LEAGUE in .env[/red]")
         raise typer.Exit(1)
+    if output_format not in TABLE_FORMATS:
+        console.print(f"[red]❌ Invalid format: {output_format}. Must be csv or parquet[/red]")
+        raise typer.Exit(1)
 
     try:
         repo_root = find_repo_root()
-        output_path = resolve_output_path(out or f"data/seasons/{year}/draft.csv")
+        output_path = resolve_output_path(out or f"data/seasons/{year}/draft.{output_format}")
         path = export_draft(
             league_id=league_id,
             year=year,
@@ -172,6 +259,9 @@ def cmd_transactions(
     league: int | None = typer.Option(None, help="ESPN leagueId (defaults to $LEAGUE)"),
     year: int = typer.Option(..., help="Season year"),
     out: str = typer.Option(None, help="Output CSV path"),
+    output_format: str = typer.Option(
+        "csv", "--format", help="Output format when --out is not given: csv or parquet"
+    ),
 ):
     """Export transaction history."""
     league_id = league
@@ -182,10 +272,15 @@ def cmd_transactions(
     if league_id is None:
         console.print("[red]❌ Missing league id. Pass --league or set $LEAGUE in .env[/red]")
         raise typer.Exit(1)
+    if output_format not in TABLE_FORMATS:
+        console.print(f"[red]❌ Invalid format: {output_format}. Must be csv or parquet[/red]")
+        raise typer.Exit(1)
 
     try:
         repo_root = find_repo_root()
-        output_path = resolve_output_path(out or f"data/seasons/{year}/transactions.csv")
+        output_path = resolve_output_path(
+            out or f"data/seasons/{year}/transactions.{output_format}"
+        )
         # Use credentials from environment if available
         credentials = ESPNCredentials(
             espn_s2=os.getenv("ESPN_S2"),
@@ -214,8 +309,18 @@ def cmd_stat_corrections(
     year: int = typer.Option(..., help="Season year"),
     week: int | None = typer.Option(None, help="Specific week (defaults to all weeks 1-18)"),
     out: str = typer.Option(None, help="Output CSV path"),
+    workers: int = typer.Option(
+        4, min=1, help="Browser pages (scrape) or weeks fetched (diff) concurrently"
+    ),
+    mode: str = typer.Option(
+        "scrape",
+        help="scrape: render ESPN's corrections pages; diff: compare stored boxscores with ESPN",
+    ),
+    boxscores: str = typer.Option(
+        None, help="Stored boxscores CSV for --mode diff (default: season boxscores.csv)"
+    ),
 ):
-    """Export stat corrections history (requires authentication)."""
+    """Export stat corrections history (scrape mode requires authentication)."""
     league_id = league
     if league_id is None:
         env_league = os.getenv("LEAGUE")
@@ -225,6 +330,10 @@ def cmd_stat_corrections(
         console.print("[red]❌ Missing league id. Pass --league or set $LEAGUE in .env[/red]")
         raise typer.Exit(1)
 
+    if mode not in ("scrape", "diff"):
+        console.print(f"[red]❌ Invalid mode: {mode}. Must be scrape or diff[/red]")
+        raise typer.Exit(1)
+
     try:
         from .core.stat_corrections import export_stat_corrections
 
@@ -233,7 +342,7 @@ def cmd_stat_corrections(
             swid=os.getenv("SWID"),
         )
         
-        if not credentials.is_authenticated:
+        if mode == "scrape" and not credentials.is_authenticated:
             console.print(
                 "[red]❌ Stat corrections require authentication. Set ESPN_S2 and SWID in .env[/red]"
             )
@@ -252,6 +361,10 @@ def cmd_stat_corrections(
             credentials=credentials,
             start_week=start_week,
             end_week=end_week,
+            pages=workers,
+            mode=mode,  # type: ignore[arg-type]
+            boxscores_path=resolve_output_path(boxscores) if boxscores else None,
+            repo_root=repo_root,
         )
     except Exception as e:
         console.print(f"[red]❌ Stat corrections export failed: {e}[/red]")
@@ -469,6 +582,17 @@ def cmd_live_scores(
     scoring_period: int | None = typer.Option(None, help="Scoring period (defaults to current)"),
     mode: str = typer.Option("scoreboard", help="Output mode: scoreboard, boxscore, combined"),
     save_json: str | None = typer.Option(None, help="Save raw JSON to path"),
+    watch: bool = typer.Option(
+        False, "--watch", help="Keep polling and re-render only matchups that changed"
+    ),
+    interval: float = typer.Option(
+        30.0, min=5.0, help="Seconds between polls in --watch mode (live-game cadence if adaptive)"
+    ),
+    adaptive: bool = typer.Option(
+        True,
+        "--adaptive/--fixed",
+        help="In --watch mode, poll fast only while rostered players' games are live",
+    ),
 ):
     """Fetch live scores."""
     league_id = league
@@ -484,6 +608,24 @@ def cmd_live_scores(
         console.print(f"[red]❌ Invalid mode: {mode}. Must be scoreboard, boxscore, or combined[/red]")
         raise typer.Exit(1)
 
+    if watch:
+        from .live.watch import watch_live_scores
+
+        try:
+            watch_live_scores(
+                league_id=league_id,
+                season=season,
+                scoring_period=scoring_period,
+                interval=interval,
+                adaptive=adaptive,
+                espn_s2=os.getenv("ESPN_S2"),
+                swid=os.getenv("SWID"),
+            )
+        except Exception as e:
+            console.print(f"[red]❌ Live scores failed: {e}[/red]")
+            raise typer.Exit(1)
+        return
+
     try:
         from .live.scores import fetch_and_render_live_scores, LiveCommandMode
 
@@ -518,6 +660,17 @@ def cmd_live_report(
     all_matchups: bool = typer.Option(False, "--all-matchups", help="Show all matchups"),
     team_id: int | None = typer.Option(None, help="Filter by team ID"),
     matchup_id: int | None = typer.Option(None, help="Filter by matchup ID"),
+    watch: bool = typer.Option(
+        False, "--watch", help="Keep polling and re-render only matchups that changed"
+    ),
+    interval: float = typer.Option(
+        30.0, min=5.0, help="Seconds between polls in --watch mode (live-game cadence if adaptive)"
+    ),
+    adaptive: bool = typer.Option(
+        True,
+        "--adaptive/--fixed",
+        help="In --watch mode, poll fast only while rostered players' games are live",
+    ),
 ):
     """Generate live matchup report."""
     league_id = league
@@ -529,6 +682,26 @@ def cmd_live_report(
         console.print("[red]❌ Missing league id. Pass --league or set $LEAGUE in .env[/red]")
         raise typer.Exit(1)
 
+    if watch:
+        from .live.watch import watch_live_report
+
+        try:
+            watch_live_report(
+                league_id=league_id,
+                season=season,
+                scoring_period=scoring_period,
+                team_id=None if all_matchups else team_id,
+                matchup_id=None if all_matchups else matchup_id,
+                interval=interval,
+                adaptive=adaptive,
+                espn_s2=os.getenv("ESPN_S2"),
+                swid=os.getenv("SWID"),
+            )
+        except Exception as e:
+            console.print(f"[red]❌ Live report failed: {e}[/red]")
+            raise typer.Exit(1)
+        return
+
     try:
         from .live.report import generate_live_matchup_report
 
@@ -555,8 +728,14 @@ def cmd_korm(
     week: int = typer.Argument(..., help="Week number"),
     league: int | None = typer.Option(None, help="ESPN leagueId (defaults to $LEAGUE)"),
     season: int = typer.Option(..., help="Season year"),
-    history_dir: str | None = typer.Option(None, help="Path to KORM history directory"),
+    history_dir: str | None = typer.Option(
+        None, help="Directory with korm_checkpoints.json (defaults to the season directory)"
+    ),
     output: str | None = typer.Option(None, help="Output file path for report"),
+    simulate: bool = typer.Option(
+        True, "--simulate/--no-simulate", help="Add simulated KORM odds from live projections"
+    ),
+    trials: int = typer.Option(10_000, help="Number of simulated seasons for the odds table"),
 ):
     """Generate KORM (King of the Red Marks) live update report."""
     league_id = league
@@ -569,56 +748,44 @@ def cmd_korm(
         raise typer.Exit(1)
 
     try:
-        from .live.korm import KORMTracker, KORMReportGenerator, load_historical_korm_state
-        from .live.scores import LiveScoreClient
+        from .live.korm import (
+            KORMReportGenerator,
+            fetch_korm_week_scores,
+            load_historical_korm_state,
+            simulate_live_korm,
+        )
 
-        # Load historical KORM state
+        # Load KORM state going into this week
         if history_dir:
             history_path = Path(history_dir)
         else:
             repo_root = find_repo_root()
-            history_path = repo_root / "data" / "korm_history"
-            history_path.mkdir(parents=True, exist_ok=True)
+            history_path = repo_root / "data" / "seasons" / str(season)
 
-        tracker = load_historical_korm_state(history_path)
+        tracker = load_historical_korm_state(history_path, week)
 
-        # Fetch live scores for the week
-        client = LiveScoreClient(
+        # One scoreboard fetch gives live projections and minutes left for every team
+        scores = fetch_korm_week_scores(
             league_id=league_id,
             season=season,
+            week=week,
+            tracker=tracker,
             espn_s2=os.getenv("ESPN_S2"),
             swid=os.getenv("SWID"),
         )
 
-        scoring_period = week
-        data = client.fetch_scoreboard(scoring_period, include_boxscore=True, include_live=True)
-
-        # Convert to WeekScore objects
-        from .live.korm import WeekScore
-        scores = []
-        teams = data.get("teams") or []
-        for team in teams:
-            team_id = team.get("id")
-            team_name = team.get("name") or f"Team {team_id}"
-            points_by_period = team.get("pointsByScoringPeriod") or {}
-            actual_score = float(points_by_period.get(str(scoring_period)) or team.get("totalPoints") or 0.0)
-            
-            # Get projected score (simplified - would need more logic for live projections)
-            projected_score = actual_score  # Placeholder - would calculate from live player data
-            
-            scores.append(WeekScore(
-                team_name=team_name,
-                week=week,
-                actual_score=actual_score,
-                projected_score=projected_score,
-                baseline_projection=projected_score,  # Placeholder
-                completion_pct=100.0,  # Placeholder
-                players_remaining=0,  # Placeholder
-                total_players=9,  # Placeholder
-            ))
+        # Odds for the rest of the window, seeded with this week's live projections
+        simulation = None
+        if simulate:
+            try:
+                simulation = simulate_live_korm(
+                    season, week, scores, find_repo_root(), tracker=tracker, trials=trials
+                )
+            except (PathResolutionError, FileNotFoundError, ValueError) as e:
+                console.print(f"[yellow]⚠️  Skipping simulated odds: {e}[/yellow]")
 
         # Generate report
-        generator = KORMReportGenerator(tracker)
+        generator = KORMReportGenerator(tracker, simulation)
         output_path = Path(output) if output else None
         report = generator.generate_live_report(week, scores, output_path)
 
@@ -673,9 +840,10 @@ def cmd_korm_generate(
 def cmd_korm_generate_all(
     start_year: int = typer.Option(2018, help="First season to process"),
     end_year: int = typer.Option(2025, help="Last season to process"),
+    workers: int = typer.Option(4, "--workers", "-j", help="Seasons processed in parallel"),
 ):
     """Generate KORM results for all seasons (2018-2025)."""
-    from .core.korm_processor import process_and_save_korm_season, SEASON_CONFIG
+    from .core.korm_processor import process_and_save_korm_seasons, SEASON_CONFIG
 
     try:
         repo_root = find_repo_root()
@@ -683,25 +851,24 @@ def cmd_korm_generate_all(
         console.print(f"[cyan]Processing KORM for seasons {start_year}-{end_year}...[/cyan]")
         console.print()
 
-        results = []
+        years = []
         for year in range(start_year, end_year + 1):
             if year not in SEASON_CONFIG:
                 console.print(f"[yellow]⏭️  Skipping {year} (no config)[/yellow]")
                 continue
+            years.append(year)
 
-            try:
-                json_path, md_path = process_and_save_korm_season(year, repo_root)
-                console.print(f"[green]✅ {year}[/green] → {md_path.name}")
-                results.append((year, "success"))
-            except FileNotFoundError as e:
-                console.print(f"[yellow]⚠️  {year}[/yellow] - {e}")
-                results.append((year, "missing"))
-            except Exception as e:
-                console.print(f"[red]❌ {year}[/red] - {e}")
-                results.append((year, "error"))
+        results = process_and_save_korm_seasons(years, repo_root, workers=workers)
+        for year, (status, detail) in results.items():
+            if status == "success":
+                console.print(f"[green]✅ {year}[/green] → {detail}")
+            elif status == "missing":
+                console.print(f"[yellow]⚠️  {year}[/yellow] - {detail}")
+            else:
+                console.print(f"[red]❌ {year}[/red] - {detail}")
 
         console.print()
-        success = sum(1 for _, status in results if status == "success")
+        success = sum(1 for status, _ in results.values() if status == "success")
         console.print(f"[cyan]Processed {success}/{len(results)} seasons[/cyan]")
 
     except Exception as e:
@@ -715,41 +882,28 @@ def cmd_korm_standings(
     week: int | None = typer.Option(None, help="Show standings after specific week"),
 ):
     """Show KORM standings for a season."""
-    from .core.korm_processor import load_weekly_scores, process_korm_season
+    from .core.korm_processor import (
+        load_season_checkpoints,
+        load_weekly_scores,
+        process_korm_season,
+    )
 
     try:
         repo_root = find_repo_root()
-        weekly_scores = load_weekly_scores(year, repo_root)
-        result = process_korm_season(year, weekly_scores)
 
         if week:
             console.print(f"[bold]KORM Standings After Week {week} - {year}[/bold]")
-            # Find week result and validate week exists
-            week_result = next((w for w in result.weeks if w.week == week), None)
-            if not week_result:
+            # Read the saved state after this week (reprocessed only if stale)
+            checkpoint = load_season_checkpoints(year, repo_root, through_week=week).get(week)
+            if not checkpoint:
                 console.print(f"[red]Week {week} not found[/red]")
                 raise typer.Exit(1)
-            
-            # Reconstruct team state at this week
-            # Track cumulative strikes and eliminations up to this week
-            team_strikes: dict[str, int] = {team: 0 for team in result.teams}
-            eliminated_teams: set[str] = set()
-            
-            # Use week_result to ensure we process up to and including the requested week
-            for w in result.weeks:
-                if w.week > week_result.week:
-                    break
-                # Add strikes for this week
-                for team in w.strikes_given:
-                    team_strikes[team] += 1
-                # Track eliminations
-                eliminated_teams.update(w.eliminations)
-            
+
             # Build standings at this week
             week_standings = []
-            for team_code in result.teams:
-                strikes = team_strikes[team_code]
-                is_eliminated = team_code in eliminated_teams
+            for team_code, team_state in checkpoint.teams.items():
+                strikes = team_state.strike_count
+                is_eliminated = team_state.status == "eliminated"
                 
                 if is_eliminated:
                     status = "eliminated"
@@ -786,12 +940,12 @@ def cmd_korm_standings(
                 )
             
             # Show winner if competition ended early
-            active_count = sum(1 for s in week_standings if not s["eliminated"])
-            if active_count == 1:
+            if checkpoint.active_count == 1:
                 winner = next(s["team"] for s in week_standings if not s["eliminated"])
                 console.print()
                 console.print(f"[bold green]Champion: {winner} 🏆[/bold green]")
         else:
+            result = process_korm_season(year, load_weekly_scores(year, repo_root))
             console.print(f"[bold]KORM Final Standings - {year}[/bold]")
 
             console.print()
@@ -820,6 +974,49 @@ def cmd_korm_standings(
         raise typer.Exit(1)
 
 
+@korm_app.command("simulate")
+def cmd_korm_simulate(
+    year: int = typer.Argument(..., help="Season year"),
+    after_week: int = typer.Option(
+        ..., "--after-week", "-w", help="Last completed week (0 = before week 1)"
+    ),
+    trials: int = typer.Option(100_000, help="Number of simulated seasons"),
+    seed: int | None = typer.Option(None, help="Random seed for reproducible odds"),
+    history: int = typer.Option(3, help="Earlier seasons used to fit team score distributions"),
+):
+    """Simulate the rest of a KORM window and show each team's odds."""
+    if trials < 1:
+        console.print("[red]❌ --trials must be at least 1[/red]")
+        raise typer.Exit(1)
+
+    from .core.korm_simulator import simulate_korm_season
+
+    try:
+        repo_root = find_repo_root()
+        simulation = simulate_korm_season(
+            year, repo_root, after_week, trials=trials, seed=seed, history_seasons=history
+        )
+    except FileNotFoundError as e:
+        console.print(f"[red]❌ Data not found: {e}[/red]")
+        raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[bold]KORM Odds After Week {after_week} - {year}[/bold] "
+        f"({simulation.trials:,} trials, weeks {simulation.weeks[0]}-{simulation.weeks[-1]})"
+    )
+    console.print()
+    console.print("| Team | Win | Top 3 | Next Strike | Eliminated | Exp. Place |")
+    console.print("|------|-----|-------|-------------|------------|------------|")
+    for row in simulation.to_frame().itertuples(index=False):
+        console.print(
+            f"| {row.team} | {row.win:.1%} | {row.top3:.1%} | {row.next_strike:.1%} | "
+            f"{row.eliminated:.1%} | {row.expected_place:.2f} |"
+        )
+
+
 # Forensic commands
 @forensic_app.command("investigate")
 def cmd_forensic_investigate(
@@ -1118,6 +1315,169 @@ def cmd_inbox_status():
     cmd_read_inbox(preview=False)
 
 
+query_app = typer.Typer(help="Indexed queries over the local season store")
+app.add_typer(query_app, name="query", help="Season store commands")
+
+
+def _store_path(db: str | None) -> Path:
+    from .core.store import default_store_path
+
+    return Path(db) if db else default_store_path(find_repo_root())
+
+
+def _print_frame(df: Any, as_csv: bool, limit: int) -> None:
+    """Render a query result as a rich table, or as CSV for piping."""
+    import pandas as pd  # type: ignore[import-untyped]
+    from rich.table import Table
+
+    if as_csv:
+        typer.echo(df.to_csv(index=False), nl=False)
+        return
+    if df.empty:
+        console.print("[yellow]No rows[/yellow]")
+        return
+    table = Table(show_lines=False)
+    for column in df.columns:
+        table.add_column(str(column))
+    for values in df.head(limit).itertuples(index=False, name=None):
+        table.add_row(*("" if pd.isna(v) else str(v) for v in values))
+    console.print(table)
+    if len(df) > limit:
+        console.print(f"[dim]… {len(df) - limit} more rows (use --limit or --csv)[/dim]")
+
+
+@query_app.command("build")
+def cmd_query_build(
+    season: list[int] = typer.Option(None, help="Only refresh these seasons (repeatable)"),
+    force: bool = typer.Option(False, "--force", help="Reload files even if unchanged"),
+    db: str = typer.Option(None, help="Store path (default .cache/season_store.sqlite3)"),
+):
+    """Build or refresh the season store from data/seasons/*."""
+    from .core.store import build_store
+
+    try:
+        repo_root = find_repo_root()
+        path = _store_path(db)
+        loaded = build_store(repo_root, path, seasons=season or None, force=force)
+    except Exception as e:
+        console.print(f"[red]❌ Store build failed: {e}[/red]")
+        raise typer.Exit(1)
+
+    for table_name, rows in loaded.items():
+        console.print(f"  {table_name}: {rows} rows loaded")
+    console.print(f"[green]✅ Store ready: {path}[/green]")
+
+
+@query_app.command("sql")
+def cmd_query_sql(
+    statement: str = typer.Argument(..., help="SQL to run (the store is opened read-only)"),
+    db: str = typer.Option(None, help="Store path (default .cache/season_store.sqlite3)"),
+    as_csv: bool = typer.Option(False, "--csv", help="Print CSV instead of a table"),
+    limit: int = typer.Option(50, min=1, help="Rows to display in table mode"),
+):
+    """Run an SQL query against the season store."""
+    from .core.store import SeasonStore
+
+    try:
+        with SeasonStore(_store_path(db)) as store:
+            df = store.query(statement)
+    except Exception as e:
+        console.print(f"[red]❌ Query failed: {e}[/red]")
+        raise typer.Exit(1)
+    _print_frame(df, as_csv, limit)
+
+
+@query_app.command("player")
+def cmd_query_player(
+    name: str = typer.Argument(..., help="Player name as it appears in boxscores"),
+    season: int = typer.Option(None, help="Limit to one season"),
+    db: str = typer.Option(None, help="Store path (default .cache/season_store.sqlite3)"),
+    as_csv: bool = typer.Option(False, "--csv", help="Print CSV instead of a table"),
+    limit: int = typer.Option(50, min=1, help="Rows to display in table mode"),
+):
+    """Show every boxscore row for a player across seasons."""
+    from .core.store import SeasonStore
+
+    try:
+        with SeasonStore(_store_path(db)) as store:
+            df = store.player_history(name, season=season)
+    except Exception as e:
+        console.print(f"[red]❌ Query failed: {e}[/red]")
+        raise typer.Exit(1)
+    columns = ["season_year", "week", "team_code", "slot_type", "slot", "nfl_team", "rs_actual_pf"]
+    _print_frame(df[columns], as_csv, limit)
+
+
+@query_app.command("team")
+def cmd_query_team(
+    team_code: str = typer.Argument(..., help="Team code (e.g., PCX)"),
+    season: int = typer.Option(None, help="Limit to one season"),
+    week: int = typer.Option(None, help="Limit to one week"),
+    db: str = typer.Option(None, help="Store path (default .cache/season_store.sqlite3)"),
+    as_csv: bool = typer.Option(False, "--csv", help="Print CSV instead of a table"),
+    limit: int = typer.Option(50, min=1, help="Rows to display in table mode"),
+):
+    """Show a team's weekly results (teamweek rows)."""
+    from .core.store import SeasonStore
+
+    try:
+        with SeasonStore(_store_path(db)) as store:
+            df = store.team_weeks(season=season, week=week, team_code=team_code.upper())
+    except Exception as e:
+        console.print(f"[red]❌ Query failed: {e}[/red]")
+        raise typer.Exit(1)
+    columns = [
+        "season_year", "week", "team_code", "opponent_code",
+        "team_actual_total", "opp_actual_total", "result", "margin",
+    ]
+    _print_frame(df[columns], as_csv, limit)
+
+
+@app.command("build")
+def cmd_build(
+    season: list[int] = typer.Option(None, help="Only these seasons (repeatable)"),
+    target: list[str] = typer.Option(
+        None, help="Only these targets: teamweek, korm, validation (repeatable)"
+    ),
+    force: bool = typer.Option(False, "--force", help="Rebuild even if up to date"),
+    workers: int = typer.Option(4, min=1, help="Seasons to build in parallel"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only list stale targets"),
+):
+    """Rebuild derived season files (teamweek, KORM, validation) whose inputs changed."""
+    from .core.build import build
+
+    try:
+        repo_root = find_repo_root()
+        results = build(
+            repo_root,
+            seasons=season or None,
+            targets=target or None,
+            force=force,
+            workers=workers,
+            dry_run=dry_run,
+        )
+    except Exception as e:
+        console.print(f"[red]❌ Build failed: {e}[/red]")
+        raise typer.Exit(1)
+
+    icons = {"built": "[green]✅", "stale": "[yellow]•", "failed": "[red]❌"}
+    for result in results:
+        if result.status in icons:
+            detail = f" ({result.detail})" if result.detail else ""
+            console.print(f"{icons[result.status]} {result.season} {result.target}{detail}[/]")
+
+    counts = {status: sum(r.status == status for r in results) for status in icons}
+    fresh = sum(r.status == "fresh" for r in results)
+    if dry_run:
+        console.print(f"[cyan]{counts['stale']} stale, {fresh} up to date[/cyan]")
+    else:
+        console.print(
+            f"[cyan]{counts['built']} rebuilt, {fresh} up to date, {counts['failed']} failed[/cyan]"
+        )
+    if counts["failed"]:
+        raise typer.Exit(1)
+
+
 # Main entry point
 if __name__ == "__main__":
     app()
@@ -0,0 +1,146 @@
+"""Compiled team-alias resolution.
+
+``data/teams/alias_mapping.yaml`` maps historical or alternate team codes
+to canonical ones, optionally scoped to a ``start_year``/``end_year``
+window. ``AliasResolver`` parses the rules once and precomputes a
+code -> canonical table for every year where the answer can change, so a
+lookup is two dict hits. ``get_alias_resolver`` keeps one resolver per
+mapping file for the whole process and rebuilds it when the file changes.
+
+Resolution matches ``utils.resolve_canonical``: the first rule whose window
+contains the year wins; if none does, the code's first rule applies; with
+no year, the first unscoped rule (else the first rule) applies.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+import pandas as pd  # type: ignore[import-untyped]
+import yaml
+
+
+def _year(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _rule_target(rule: dict[str, Any], abbrev: str) -> str:
+    canonical = rule.get("canonical")
+    return str(canonical) if canonical else abbrev
+
+
+class AliasResolver:
+    """Resolve (team code, season) to a canonical team code."""
+
+    def __init__(self, rules: Iterable[dict[str, Any]] = ()) -> None:
+        by_alias: dict[str, list[tuple[int | None, int | None, str]]] = {}
+        for rule in rules:
+            alias = rule.get("alias")
+            if not alias:
+                continue
+            window = (_year(rule.get("start_year")), _year(rule.get("end_year")))
+            by_alias.setdefault(alias, []).append((*window, _rule_target(rule, alias)))
+
+        bounds = [
+            year for windows in by_alias.values() for s, e, _ in windows for year in (s, e) if year
+        ]
+        # Below the first bound and above the last one every answer is constant,
+        # so one table on each side covers all other years.
+        self._first_year = min(bounds) - 1 if bounds else 0
+        self._last_year = max(bounds) + 1 if bounds else 0
+        self._by_year: dict[int, dict[str, str]] = {
+            year: {alias: self._pick(windows, year) for alias, windows in by_alias.items()}
+            for year in range(self._first_year, self._last_year + 1)
+        }
+        self._undated: dict[str, str] = {
+            alias: next((c for s, e, c in windows if s is None and e is None), windows[0][2])
+            for alias, windows in by_alias.items()
+        }
+
+    @staticmethod
+    def _pick(windows: list[tuple[int | None, int | None, str]], year: int) -> str:
+        for start, end, canonical in windows:
+            if (start is None or year >= start) and (end is None or year <= end):
+                return canonical
+        return windows[0][2]
+
+    def table_for(self, year: int | None) -> Mapping[str, str]:
+        """Return the alias -> canonical table that applies to ``year``."""
+        if year is None:
+            return self._undated
+        return self._by_year[min(max(year, self._first_year), self._last_year)]
+
+    def resolve(self, abbrev: str, year: int | None) -> str:
+        """Return the canonical code for ``abbrev`` in ``year`` (unknown codes pass through)."""
+        return self.table_for(year).get(abbrev, abbrev)
+
+    def resolve_column(self, codes: pd.Series, years: pd.Series | int | None = None) -> pd.Series:
+        """
+        Resolve a whole column of team codes.
+
+        Args:
+            codes: Team codes to resolve
+            years: One season for every row, or a per-row season column
+
+        Returns:
+            Series of canonical codes aligned with ``codes``
+        """
+        if years is None or isinstance(years, int):
+            table = self.table_for(years)
+            return codes.map(lambda code: table.get(code, code))
+        resolved = codes.copy()
+        for year, index in codes.groupby(years, dropna=False).groups.items():
+            table = self.table_for(None if _is_missing(year) else int(year))
+            resolved.loc[index] = codes.loc[index].map(lambda code: table.get(code, code))
+        return resolved
+
+
+def _read_rules(mapping_path: Path) -> list[dict[str, Any]]:
+    try:
+        with open(mapping_path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    except Exception:
+        return []
+    aliases = data.get("aliases", []) if isinstance(data, dict) else []
+    return [rule for rule in aliases if isinstance(rule, dict)]
+
+
+_cache_lock = threading.Lock()
+_resolvers: dict[Path, tuple[tuple[int, int] | None, AliasResolver]] = {}
+
+
+def get_alias_resolver(mapping_path: str | Path) -> AliasResolver:
+    """
+    Return the shared resolver for ``mapping_path``.
+
+    The file is parsed on first use and again only after its mtime or size
+    changes. A missing or unreadable file yields a resolver with no aliases.
+    """
+    path = Path(mapping_path).resolve()
+    try:
+        stat = path.stat()
+        signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    with _cache_lock:
+        cached = _resolvers.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    resolver = AliasResolver(_read_rules(path) if signature else ())
+    with _cache_lock:
+        _resolvers[path] = (signature, resolver)
+    return resolver
+
+
+def alias_mapping_path(repo_root: str | Path) -> Path:
+    """Return the alias mapping file for a repository checkout."""
+    return Path(repo_root) / "data" / "teams" / "alias_mapping.yaml"
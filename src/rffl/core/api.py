@@ -6,6 +6,7 @@ from typing import Any
 from espn_api.football import League  # type: ignore[import-untyped]
 
 from .exceptions import ESPNAPIError, AuthenticationError
+from .transport import install_espn_api_transport
 
 
 @dataclass
@@ -49,6 +50,7 @@ class ESPNClient:
     def get_league(self) -> League:
         """Get League instance with proper authentication."""
         if self._league is None:
+            install_espn_api_transport()
             try:
                 if self.public_only or not self.credentials.is_authenticated:
                     self._league = League(
@@ -72,6 +74,8 @@ class ESPNClient:
         try:
             result: list[Any] = league.box_scores(week)
             return result
+        except ESPNAPIError:
+            raise
         except Exception as e:
             raise ESPNAPIError(f"Failed to fetch boxscores for week {week}: {e}") from e
 
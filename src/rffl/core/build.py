@@ -0,0 +1,360 @@
+"""Make-style rebuilds of derived season artifacts.
+
+Each season directory has a short chain of derived targets:
+
+- ``teamweek``: ``boxscores.csv`` -> ``reports/teamweek_unified.csv``
+- ``korm``: ``reports/teamweek_unified.csv`` (``h2h.csv`` for 2018) ->
+  ``korm_results.json``, ``korm_history.md`` and ``korm_checkpoints.json``
+- ``validation``: ``boxscores.csv`` -> the boxscore and lineup validation
+  reports (written only when issues are found)
+
+A manifest records, for every target built, the content hash of each input
+and a code version (package version plus a hash of the modules that produce
+the target). A target is rebuilt only when an input hash or the code version
+changed, or a recorded output went missing. Targets within a season run in
+order, so KORM reads the teamweek file rebuilt a moment earlier; seasons are
+built in parallel.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as package_version
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Sequence
+
+from .korm_processor import SEASON_CONFIG, process_and_save_korm_season
+from .lineup import validate_lineup_file
+from .tables import resolve_table, table_exists
+from .teamweek import generate_teamweek_unified
+from .validation import validate_boxscores
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "build_manifest.json"
+
+BuildStatus = Literal["built", "fresh", "stale", "missing", "failed"]
+
+
+@dataclass(frozen=True)
+class Target:
+    """One derived artifact of a season and what it is built from."""
+
+    name: str
+    # Paths relative to the season directory
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    # Modules whose source is part of the target's code version
+    modules: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class BuildResult:
+    """Outcome for one (season, target)."""
+
+    season: int
+    target: str
+    status: BuildStatus
+    detail: str = ""
+
+
+BUILD_TARGETS = ("teamweek", "korm", "validation")
+
+TEAMWEEK_OUTPUT = "reports/teamweek_unified.csv"
+VALIDATION_REPORTS = (
+    "boxscores_validation_report.csv",
+    "boxscores_lineup_validation_report.csv",
+)
+
+
+def season_targets(year: int, season_dir: Path) -> list[Target]:
+    """Return the targets that apply to a season, in build order."""
+    has_boxscores = table_exists(season_dir / "boxscores.csv")
+    targets = []
+    if has_boxscores:
+        targets.append(
+            Target(
+                "teamweek",
+                ("boxscores.csv",),
+                (TEAMWEEK_OUTPUT,),
+                ("rffl.core.teamweek", "rffl.core.tables", "rffl.core.schemas"),
+            )
+        )
+    if year in SEASON_CONFIG:
+        targets.append(
+            Target(
+                "korm",
+                ("h2h.csv",) if year == 2018 else (TEAMWEEK_OUTPUT,),
+                ("korm_results.json", "korm_history.md", "korm_checkpoints.json"),
+                ("rffl.core.korm_processor", "rffl.core.tables"),
+            )
+        )
+    if has_boxscores:
+        targets.append(
+            Target(
+                "validation",
+                ("boxscores.csv",),
+                (),
+                ("rffl.core.validation", "rffl.core.lineup", "rffl.core.tables"),
+            )
+        )
+    return targets
+
+
+def _build_teamweek(year: int, season_dir: Path, repo_root: Path) -> None:
+    generate_teamweek_unified(season_dir / "boxscores.csv", season_dir / TEAMWEEK_OUTPUT)
+
+
+def _build_korm(year: int, season_dir: Path, repo_root: Path) -> None:
+    process_and_save_korm_season(year, repo_root, season_dir)
+
+
+def _build_validation(year: int, season_dir: Path, repo_root: Path) -> None:
+    # Reports only exist when issues are found, so drop the previous ones first
+    for name in VALIDATION_REPORTS:
+        (season_dir / name).unlink(missing_ok=True)
+    validate_boxscores(season_dir / "boxscores.csv")
+    validate_lineup_file(season_dir / "boxscores.csv")
+
+
+BUILDERS: dict[str, Callable[[int, Path, Path], None]] = {
+    "teamweek": _build_teamweek,
+    "korm": _build_korm,
+    "validation": _build_validation,
+}
+
+
+def default_manifest_path(repo_root: str | Path) -> Path:
+    """Return the build manifest location for a repository checkout."""
+    return Path(repo_root) / ".cache" / MANIFEST_FILENAME
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_version(modules: tuple[str, ...]) -> str:
+    """Hash the package version and the source of ``modules``."""
+    try:
+        digest = hashlib.sha256(package_version("rffl-tools").encode())
+    except PackageNotFoundError:
+        digest = hashlib.sha256(b"unknown")
+    for name in modules:
+        source = importlib.import_module(name).__file__
+        if source:
+            digest.update(Path(source).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _current_record(target: Target, season_dir: Path) -> dict[str, Any]:
+    return {
+        "inputs": {
+            name: file_digest(resolve_table(season_dir / name)) for name in target.inputs
+        },
+        "code": code_version(target.modules),
+        "outputs": list(target.outputs),
+    }
+
+
+def stale_reason(
+    target: Target,
+    season_dir: Path,
+    entry: dict[str, Any] | None,
+    current: dict[str, Any],
+) -> str | None:
+    """Return why ``target`` needs a rebuild, or None if it is up to date."""
+    if entry is None:
+        return "never built"
+    if entry.get("code") != current["code"]:
+        return "code changed"
+    recorded = entry.get("inputs") or {}
+    for name, digest in current["inputs"].items():
+        if recorded.get(name) != digest:
+            return f"{name} changed"
+    for name in target.outputs:
+        if not (season_dir / name).exists():
+            return f"{name} missing"
+    return None
+
+
+def build_season(
+    repo_root: Path,
+    year: int,
+    entries: dict[str, dict[str, Any]],
+    only: Sequence[str] | None = None,
+    force: bool = False,
+    dry_run: bool = False,
+) -> tuple[list[BuildResult], dict[str, dict[str, Any]]]:
+    """
+    Bring one season's targets up to date.
+
+    Args:
+        repo_root: Repository root
+        year: Season year
+        entries: This season's manifest entries, keyed by target name
+        only: Restrict to these target names
+        force: Rebuild even if up to date
+        dry_run: Report what would be rebuilt without building
+
+    Returns:
+        (results, new manifest entries for the targets that were built)
+    """
+    season_dir = repo_root / "data" / "seasons" / str(year)
+    results: list[BuildResult] = []
+    updated: dict[str, dict[str, Any]] = {}
+    rebuilt: set[str] = set()
+    failed: set[str] = set()
+
+    for target in season_targets(year, season_dir):
+        if only and target.name not in only:
+            continue
+        if failed.intersection(target.inputs):
+            failed.update(target.outputs)
+            results.append(BuildResult(year, target.name, "failed", "upstream failed"))
+            continue
+        missing = [name for name in target.inputs if not table_exists(season_dir / name)]
+        if missing and not (dry_run and rebuilt.issuperset(missing)):
+            results.append(BuildResult(year, target.name, "missing", ", ".join(missing)))
+            continue
+
+        upstream = sorted(rebuilt.intersection(target.inputs))
+        if dry_run and upstream:
+            rebuilt.update(target.outputs)
+            results.append(BuildResult(year, target.name, "stale", f"{upstream[0]} rebuilt"))
+            continue
+
+        current = _current_record(target, season_dir)
+        reason = "forced" if force else stale_reason(
+            target, season_dir, entries.get(target.name), current
+        )
+        if reason is None:
+            results.append(BuildResult(year, target.name, "fresh"))
+            continue
+        if dry_run:
+            rebuilt.update(target.outputs)
+            results.append(BuildResult(year, target.name, "stale", reason))
+            continue
+
+        try:
+            BUILDERS[target.name](year, season_dir, repo_root)
+        except Exception as e:
+            failed.update(target.outputs)
+            results.append(BuildResult(year, target.name, "failed", str(e)))
+            continue
+        current["built_at"] = datetime.now().isoformat(timespec="seconds")
+        updated[target.name] = current
+        rebuilt.update(target.outputs)
+        results.append(BuildResult(year, target.name, "built", reason))
+
+    return results, updated
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    """Read the build manifest, starting fresh if it is missing or outdated."""
+    try:
+        manifest: dict[str, Any] = json.loads(path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "targets": {}}
+    return manifest
+
+
+def _save_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    os.replace(tmp_path, path)
+
+
+def _season_years(repo_root: Path, seasons: Iterable[int] | None) -> list[int]:
+    wanted = set(seasons) if seasons is not None else None
+    years = [
+        int(season_dir.name)
+        for season_dir in (repo_root / "data" / "seasons").glob("*")
+        if season_dir.is_dir() and season_dir.name.isdigit()
+    ]
+    return sorted(year for year in years if wanted is None or year in wanted)
+
+
+def build(
+    repo_root: str | Path,
+    seasons: Iterable[int] | None = None,
+    targets: Sequence[str] | None = None,
+    force: bool = False,
+    workers: int = 1,
+    dry_run: bool = False,
+    manifest_path: str | Path | None = None,
+) -> list[BuildResult]:
+    """
+    Rebuild stale derived artifacts across seasons.
+
+    Args:
+        repo_root: Repository root containing ``data/seasons``
+        seasons: Only these seasons (default: every season directory)
+        targets: Only these targets (see ``BUILD_TARGETS``)
+        force: Rebuild everything selected, even if up to date
+        workers: Seasons built concurrently in separate processes
+        dry_run: Report stale targets without building or touching the manifest
+        manifest_path: Manifest file (defaults to ``.cache/build_manifest.json``)
+
+    Returns:
+        One BuildResult per applicable (season, target), in season order
+
+    Raises:
+        ValueError: If an unknown target name is given
+    """
+    unknown = sorted(set(targets or ()) - set(BUILD_TARGETS))
+    if unknown:
+        raise ValueError(f"Unknown build target(s): {', '.join(unknown)}")
+
+    repo_root = Path(repo_root)
+    manifest_path = Path(manifest_path) if manifest_path else default_manifest_path(repo_root)
+    manifest = load_manifest(manifest_path)
+    recorded: dict[str, dict[str, Any]] = manifest["targets"]
+
+    years = _season_years(repo_root, seasons)
+    jobs = [
+        (
+            repo_root,
+            year,
+            {
+                name: recorded[f"{year}/{name}"]
+                for name in BUILD_TARGETS
+                if f"{year}/{name}" in recorded
+            },
+            targets,
+            force,
+            dry_run,
+        )
+        for year in years
+    ]
+
+    if workers <= 1 or len(jobs) <= 1:
+        outcomes = [build_season(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            outcomes = list(pool.map(build_season, *zip(*jobs)))
+
+    results: list[BuildResult] = []
+    for year, (season_results, updated) in zip(years, outcomes):
+        results.extend(season_results)
+        for name, entry in updated.items():
+            recorded[f"{year}/{name}"] = entry
+
+    if not dry_run and any(updated for _, updated in outcomes):
+        _save_manifest(manifest_path, manifest)
+    return results
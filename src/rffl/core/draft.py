@@ -1,14 +1,16 @@
 """Draft export logic."""
 
 import csv
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, astuple, dataclass
 from pathlib import Path
 
 import pandas as pd  # type: ignore[import-untyped]
 
 from .api import ESPNCredentials, ESPNClient
 from .exceptions import ESPNAPIError
+from .schemas import DRAFT_SCHEMA
 from .utils import get_team_abbrev
+from .writers import open_row_writer
 
 
 @dataclass
@@ -39,7 +41,7 @@ def export_draft(
     Args:
         league_id: ESPN league ID
         year: Season year
-        output_path: Output CSV file path
+        output_path: Output file path (``.parquet`` writes Parquet, otherwise CSV)
         credentials: Optional ESPN authentication credentials
         public_only: If True, ignore credentials (public league mode)
 
@@ -91,6 +93,11 @@ def export_draft(
 
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    if out_path.suffix.lower() == ".parquet":
+        with open_row_writer(out_path, list(DRAFT_SCHEMA), schema=DRAFT_SCHEMA) as writer:
+            for r in rows:
+                writer.write(astuple(r))
+        return out_path
     pd.DataFrame([asdict(r) for r in rows]).to_csv(
         out_path, index=False, quoting=csv.QUOTE_MINIMAL
     )
@@ -21,6 +21,11 @@ class RateLimitError(ESPNAPIError):
     pass
 
 
+class CacheMissError(ESPNAPIError):
+    """Replay mode requested a response that was never recorded."""
+    pass
+
+
 class ValidationError(RFFLError):
     """Data validation errors."""
     pass
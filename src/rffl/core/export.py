@@ -1,24 +1,35 @@
 """Boxscore export logic."""
 
 import csv
-from dataclasses import asdict, dataclass
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from .aliases import AliasResolver, alias_mapping_path, get_alias_resolver
 from .api import ESPNCredentials, ESPNClient
 from .constants import FLEX_ELIGIBLE_POSITIONS, RFFL_LINEUP_REQUIREMENTS
-from .exceptions import ESPNAPIError, ValidationError
+from .exceptions import CacheMissError, ESPNAPIError, RateLimitError, ValidationError
+from .schemas import BOXSCORE_SCHEMA
 from .utils import (
     get_team_abbrev,
     is_starter,
-    load_alias_index,
     load_canonical_meta,
     norm_slot,
-    resolve_canonical,
     safe_float,
 )
+from .writers import open_row_writer
+
+if TYPE_CHECKING:
+    from ..live.scores import LiveScoreClient
+
+# Sidecar recording which weeks an incremental export has merged
+CHECKPOINT_SUFFIX = ".checkpoint.json"
 
 
 @dataclass
@@ -45,18 +56,476 @@ class Row:
     rs_actual_pf: float
 
 
-def iter_weeks(client: ESPNClient, start: int | None, end: int | None):
-    """Iterate over weeks, yielding (week, boxscores) tuples."""
+# Output header names that differ from Row field names
+RENAME_MAP = {
+    "is_co_owned": "is_co_owned?",
+}
+EXPORT_COLUMNS = [RENAME_MAP.get(f.name, f.name) for f in fields(Row)]
+# Row -> tuple of values in EXPORT_COLUMNS order
+row_values = attrgetter(*(f.name for f in fields(Row)))
+
+
+def _fetch_week(client: ESPNClient, week: int) -> list[Any] | None:
+    """
+    Fetch one week of boxscores, returning None if ESPN rejects the week.
+
+    Rate limits that outlast the transport's retries and replay-mode cache
+    misses are re-raised: skipping those weeks would write a short export.
+    """
+    try:
+        return client.get_boxscores(week)
+    except (RateLimitError, CacheMissError):
+        raise
+    except ESPNAPIError:
+        return None
+
+
+def iter_weeks(
+    client: ESPNClient,
+    start: int | None,
+    end: int | None,
+    workers: int = 1,
+    weeks: Iterable[int] | None = None,
+):
+    """
+    Iterate over weeks, yielding (week, boxscores) tuples.
+
+    With workers > 1, weeks are fetched concurrently through a bounded thread
+    pool. Results are still yielded in week order, so callers see the same
+    stream as the serial path. ``weeks`` fetches exactly those weeks instead
+    of the start..end range.
+    """
     lo = start or 1
     hi = end or 18
+    # Initialize the shared League once, before any worker threads use it
     league = client.get_league()
-    for wk in range(lo, hi + 1):
-        try:
-            b = client.get_boxscores(wk)
+    weeks = sorted(weeks) if weeks is not None else list(range(lo, hi + 1))
+    if not weeks:
+        return
+
+    if workers <= 1 or len(weeks) <= 1:
+        for wk in weeks:
+            b = _fetch_week(client, wk)
+            if b:
+                yield wk, b
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(weeks))) as pool:
+        results = pool.map(lambda wk: _fetch_week(client, wk), weeks)
+        for wk, b in zip(weeks, results):
             if b:
                 yield wk, b
-        except ESPNAPIError:
-            continue
+
+
+def _team_rows(
+    year: int,
+    week: int,
+    m_idx: int,
+    src_abbrev: str,
+    lineup: Iterable[Any],
+    aliases: AliasResolver,
+    canon_meta: dict[tuple[int, str], dict],
+    fill_missing_slots: bool,
+) -> list[Row]:
+    """Build the ordered starter and bench rows for one team in one matchup.
+
+    ``lineup`` items only need the BoxPlayer attributes read below, so espn_api
+    ``BoxPlayer`` objects and ``RawBoxPlayer`` rows are interchangeable.
+    """
+    rows: list[Row] = []
+
+    # Resolve canonical team_code
+    team_code = aliases.resolve(src_abbrev, year)
+
+    # Owners/co-owned from canonical meta
+    meta = canon_meta.get((year, team_code), {})
+    is_co_owned = meta.get("is_co_owned", "")
+    owner1 = meta.get("owner_code_1", "")
+    owner2 = meta.get("owner_code_2", "")
+
+    # Build starter list
+    # Per-player rounding occurs before summing so team totals
+    # match the sum of starter rows exactly.
+    starters = []
+    stamped = []
+    for _idx, bp in enumerate(lineup):
+        slot = norm_slot(
+            getattr(bp, "slot_position", None),
+            getattr(bp, "position", None),
+        )
+        proj = round(safe_float(getattr(bp, "projected_points", 0.0)), 2)
+        act = round(safe_float(getattr(bp, "points", 0.0)), 2)
+        row = {
+            "slot": slot,
+            "slot_type": "starters" if is_starter(slot) else "bench",
+            "player_name": getattr(bp, "name", None),
+            "nfl_team": getattr(bp, "proTeam", ""),
+            "position": getattr(bp, "position", None),
+            "is_placeholder": "No",
+            "issue_flag": "",
+            "rs_projected_pf": proj,
+            "rs_actual_pf": act,
+            "_orig_idx": _idx,
+        }
+        # Flag invalid FLEX position on real rows (RB/WR/TE only)
+        if row["slot"] == "FLEX":
+            pos_val = row.get("position")
+            pos = (str(pos_val) if pos_val else "").upper()
+            if pos not in FLEX_ELIGIBLE_POSITIONS:
+                row["issue_flag"] = (
+                    f"INVALID_FLEX_POSITION:{pos or 'UNKNOWN'}"
+                )
+        stamped.append(row)
+        if row["slot_type"] == "starters":
+            starters.append(row)
+
+    # Fill missing required starter slots (0-pt placeholders)
+    if fill_missing_slots:
+        # Count current starters by slot
+        have_counts: dict[str, int] = {}
+        for r in starters:
+            slot_key = str(r["slot"])
+            have_counts[slot_key] = have_counts.get(slot_key, 0) + 1
+
+        for req_slot, req_count in RFFL_LINEUP_REQUIREMENTS.items():
+            have = have_counts.get(req_slot, 0)
+            missing = max(0, req_count - have)
+            for _i in range(missing):
+                placeholder = {
+                    "slot": req_slot,
+                    "slot_type": "starters",
+                    "player_name": f"EMPTY SLOT - {req_slot}",
+                    # FLEX placeholder uses a FLEX-eligible position
+                    "position": (
+                        req_slot if req_slot != "FLEX" else "WR"
+                    ),
+                    "nfl_team": "",
+                    "is_placeholder": "Yes",
+                    "issue_flag": f"MISSING_SLOT:{req_slot}",
+                    "rs_projected_pf": 0.0,
+                    "rs_actual_pf": 0.0,
+                    "_orig_idx": 1000,
+                }
+                starters.append(placeholder)
+                stamped.append(placeholder)
+
+    team_proj = round(sum(float(r["rs_projected_pf"] or 0) for r in starters), 2)
+    team_act = round(sum(float(r["rs_actual_pf"] or 0) for r in starters), 2)
+
+    # Order rows: starters in fixed slot sequence, then bench (original order)
+    desired_order = [
+        "QB",
+        "RB",
+        "RB",
+        "WR",
+        "WR",
+        "TE",
+        "FLEX",
+        "D/ST",
+        "K",
+    ]
+    # Build starters by desired sequence
+    starters_by_slot: dict[str, list[dict[str, Any]]] = {}
+    for r in starters:
+        slot_key = str(r["slot"])
+        starters_by_slot.setdefault(slot_key, []).append(r)
+    # Maintain original order within same slot
+    for lst in starters_by_slot.values():
+        lst.sort(key=lambda x: x.get("_orig_idx", 0))
+    starters_sorted: list[dict] = []
+    for s in desired_order:
+        if s in starters_by_slot and starters_by_slot[s]:
+            starters_sorted.append(starters_by_slot[s].pop(0))
+    # Append any leftover starters just in case (stable by slot then orig idx)
+    leftovers = [r for lst in starters_by_slot.values() for r in lst]
+    slot_rank = {
+        "QB": 0,
+        "RB": 1,
+        "WR": 2,
+        "TE": 3,
+        "FLEX": 4,
+        "D/ST": 5,
+        "K": 6,
+    }
+    leftovers.sort(
+        key=lambda x: (
+            slot_rank.get(x.get("slot", ""), 99),
+            x.get("_orig_idx", 0),
+        )
+    )
+    starters_sorted.extend(leftovers)
+    bench_sorted = [r for r in stamped if r["slot_type"] != "starters"]
+    bench_sorted.sort(key=lambda x: int(x.get("_orig_idx") or 0))
+    ordered = starters_sorted + bench_sorted
+
+    for r in ordered:
+        r.pop("_orig_idx", None)
+        rows.append(
+            Row(
+                season_year=year,
+                week=week,
+                matchup=m_idx,
+                team_code=team_code,
+                is_co_owned=is_co_owned,
+                team_owner_1=owner1,
+                team_owner_2=owner2,
+                team_projected_total=team_proj,
+                team_actual_total=team_act,
+                **r,
+            )
+        )
+    return rows
+
+
+def _iter_weeks_espn(
+    client: ESPNClient,
+    start: int | None,
+    end: int | None,
+    workers: int = 1,
+    weeks: Iterable[int] | None = None,
+) -> Iterator[tuple[int, list[list[tuple[str | None, list[Any]]]]]]:
+    """Adapt iter_weeks' BoxScore objects to (team abbrev, lineup) pairs."""
+    for week, boxscores in iter_weeks(client, start, end, workers=workers, weeks=weeks):
+        matchups = []
+        for bs in boxscores:
+            sides: list[tuple[str | None, list[Any]]] = []
+            for side in ("home", "away"):
+                team = getattr(bs, f"{side}_team", None)
+                lineup = getattr(bs, f"{side}_lineup", None) or []
+                sides.append((get_team_abbrev(team) if team else None, lineup))
+            matchups.append(sides)
+        yield week, matchups
+
+
+def rows_for_weeks(
+    weeks: Iterable[tuple[int, list[list[tuple[str | None, list[Any]]]]]],
+    year: int,
+    aliases: AliasResolver,
+    canon_meta: dict[tuple[int, str], dict],
+    fill_missing_slots: bool = False,
+) -> Iterator[Row]:
+    """Yield export rows for a (week, matchups) stream from either engine."""
+    for week, matchups in weeks:
+        for m_idx, sides in enumerate(matchups, start=1):
+            for src_abbrev, lineup in sides:
+                if src_abbrev is None:
+                    continue
+                yield from _team_rows(
+                    year,
+                    week,
+                    m_idx,
+                    src_abbrev,
+                    lineup,
+                    aliases,
+                    canon_meta,
+                    fill_missing_slots,
+                )
+
+
+def _live_client(
+    league_id: int, year: int, client: ESPNClient, public_only: bool
+) -> "LiveScoreClient":
+    from ..live.scores import LiveScoreClient
+
+    return LiveScoreClient(
+        league_id=league_id,
+        season=year,
+        espn_s2=None if public_only else client.credentials.espn_s2,
+        swid=None if public_only else client.credentials.swid,
+    )
+
+
+def _week_stream(
+    engine: Literal["espn_api", "raw"],
+    league_id: int,
+    year: int,
+    client: ESPNClient,
+    public_only: bool,
+    start_week: int | None,
+    end_week: int | None,
+    workers: int,
+    weeks: Iterable[int] | None = None,
+) -> Iterator[tuple[int, list[list[tuple[str | None, list[Any]]]]]]:
+    """Return the (week, matchups) stream for the selected engine."""
+    if engine == "raw":
+        from .raw_boxscores import iter_weeks_raw
+
+        raw_client = _live_client(league_id, year, client, public_only)
+        return iter_weeks_raw(raw_client, year, start_week, end_week, workers=workers, weeks=weeks)
+    return _iter_weeks_espn(client, start_week, end_week, workers=workers, weeks=weeks)
+
+
+def _rows_frame(rows: Iterable[Row]) -> pd.DataFrame:
+    """Build the output DataFrame with final header names."""
+    return pd.DataFrame([row_values(r) for r in rows], columns=EXPORT_COLUMNS)
+
+
+def _fetch_errors_as_api_errors(rows: Iterator[Row]) -> Iterator[Row]:
+    """Re-raise anything that fails while fetching/assembling rows as ESPNAPIError."""
+    try:
+        yield from rows
+    except ESPNAPIError:
+        raise
+    except Exception as e:
+        raise ESPNAPIError(f"Failed fetching box scores: {e}") from e
+
+
+class CleanCheck:
+    """
+    Running ``--require-clean`` check over a stream of export rows.
+
+    A team's rows arrive together, so each team-week's starters are summed as
+    they stream past and only the counts of bad team-weeks are kept. The
+    result matches grouping all starter rows by (week, matchup, team_code).
+    """
+
+    def __init__(self, tolerance: float = 0.0):
+        self.tolerance = tolerance
+        self.bad_proj = 0
+        self.bad_act = 0
+        self.bad_count = 0
+        self._key: tuple[int, int, str] | None = None
+        self._team_proj = 0.0
+        self._team_act = 0.0
+        self._proj_sum = 0.0
+        self._act_sum = 0.0
+        self._count = 0
+
+    def add(self, row: Row) -> None:
+        """Account for one export row (bench rows are ignored)."""
+        if row.slot_type != "starters":
+            return
+        key = (row.week, row.matchup, row.team_code)
+        if key != self._key:
+            self._finish_team()
+            self._key = key
+            self._team_proj = float(row.team_projected_total)
+            self._team_act = float(row.team_actual_total)
+        self._proj_sum += float(row.rs_projected_pf)
+        self._act_sum += float(row.rs_actual_pf)
+        self._count += 1
+
+    def _finish_team(self) -> None:
+        if self._key is None:
+            return
+        if abs(round(self._proj_sum - self._team_proj, 2)) > self.tolerance:
+            self.bad_proj += 1
+        if abs(round(self._act_sum - self._team_act, 2)) > self.tolerance:
+            self.bad_act += 1
+        if self._count != 9:
+            self.bad_count += 1
+        self._key = None
+        self._proj_sum = self._act_sum = 0.0
+        self._count = 0
+
+    def raise_if_unclean(self) -> None:
+        """Raise ValidationError if any team-week seen so far is not clean."""
+        self._finish_team()
+        if self.bad_proj or self.bad_act or self.bad_count:
+            raise ValidationError(
+                (
+                    f"Export not clean: proj={self.bad_proj}, act={self.bad_act}, "
+                    f"bad_count={self.bad_count}."
+                )
+            )
+
+
+def _write_csv_atomic(df: pd.DataFrame, out_path: Path) -> None:
+    """Write via a temp file so an interrupted run never leaves a torn CSV."""
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    df.to_csv(tmp_path, index=False, quoting=csv.QUOTE_MINIMAL)
+    os.replace(tmp_path, out_path)
+
+
+def checkpoint_path(output_path: str | Path) -> Path:
+    """Return the incremental-export checkpoint stored next to a boxscores CSV."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + CHECKPOINT_SUFFIX)
+
+
+@dataclass
+class ExportCheckpoint:
+    """
+    Weeks an incremental export has merged into its CSV.
+
+    Each week records whether its scores were final when fetched and how many
+    matchups it had. The checkpoint is rewritten after every week, right
+    after the CSV, so an interrupted backfill resumes where it stopped.
+    """
+
+    league_id: int
+    year: int
+    fill_missing_slots: bool
+    weeks: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, path: Path, league_id: int, year: int, fill_missing_slots: bool
+    ) -> "ExportCheckpoint | None":
+        """Load a checkpoint, or None if missing, unreadable or for another export."""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        key = (data.get("league_id"), data.get("year"), data.get("fill_missing_slots"))
+        if key != (league_id, year, fill_missing_slots):
+            return None
+        weeks = {int(week): dict(info) for week, info in (data.get("weeks") or {}).items()}
+        return cls(league_id, year, fill_missing_slots, weeks)
+
+    def record(self, week: int, final: bool, matchups: int) -> None:
+        self.weeks[week] = {"final": final, "matchups": matchups}
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "league_id": self.league_id,
+            "year": self.year,
+            "fill_missing_slots": self.fill_missing_slots,
+            "weeks": {str(week): self.weeks[week] for week in sorted(self.weeks)},
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2) + "\n")
+        os.replace(tmp_path, path)
+
+
+def weeks_to_refresh(
+    requested: Iterable[int],
+    existing_matchups: dict[int, int],
+    checkpoint: ExportCheckpoint | None,
+    current_week: int,
+    last_completed_week: int,
+) -> list[int]:
+    """
+    Return the requested weeks an incremental export still has to fetch.
+
+    A week already in the CSV is kept only if it was final when written and
+    none of its matchups are missing. Without a checkpoint (a CSV from a full
+    export) every week up to the last completed one is trusted except the
+    latest, which may have been captured mid-week. Weeks after the current
+    scoring period have nothing to fetch yet.
+
+    Args:
+        requested: Weeks the export covers
+        existing_matchups: Week -> number of matchups present in the CSV
+        checkpoint: Loaded checkpoint, if any
+        current_week: Current scoring period
+        last_completed_week: Last scoring period with final stats
+    """
+    if checkpoint is None:
+        latest = max(existing_matchups, default=0)
+        trusted = {
+            week
+            for week in existing_matchups
+            if week != latest and week <= last_completed_week
+        }
+    else:
+        trusted = {
+            week
+            for week, info in checkpoint.weeks.items()
+            if info.get("final")
+            and existing_matchups.get(week, 0) >= int(info.get("matchups") or 0) > 0
+        }
+    return [week for week in requested if week <= current_week and week not in trusted]
 
 
 def export_boxscores(
@@ -71,14 +540,22 @@ def export_boxscores(
     credentials: ESPNCredentials | None = None,
     public_only: bool = True,
     repo_root: Path | None = None,
+    workers: int = 1,
+    engine: Literal["espn_api", "raw"] = "espn_api",
+    incremental: bool = False,
 ) -> Path:
     """
     Export ESPN fantasy football boxscores to CSV format.
 
+    Rows stream from the fetch through per-team assembly straight into the
+    writer, so memory does not grow with the number of weeks exported. The
+    file is replaced only once every row is written (and, with
+    ``require_clean``, validated).
+
     Args:
         league_id: ESPN league ID
         year: Season year
-        output_path: Output CSV file path
+        output_path: Output file path (``.parquet`` writes Parquet, otherwise CSV)
         start_week: Start week (default: 1)
         end_week: End week (default: 18)
         fill_missing_slots: Insert 0-pt placeholders for missing required starters
@@ -87,6 +564,11 @@ def export_boxscores(
         credentials: Optional ESPN authentication credentials
         public_only: If True, ignore credentials (public league mode)
         repo_root: Repository root path (for loading team mappings)
+        workers: Number of weeks to fetch concurrently (1 = serial)
+        engine: "espn_api" walks League/BoxScore objects; "raw" reads the league
+            JSON directly (no player-pool download) and produces identical rows
+        incremental: Keep weeks already final in the existing CSV, fetch only
+            missing or live weeks, and merge them in place (see weeks_to_refresh)
 
     Returns:
         Path to written CSV file
@@ -112,207 +594,147 @@ def export_boxscores(
         public_only=public_only,
     )
 
-    rows: list[Row] = []
+    # Shared compiled resolver for canonical team_code resolution
+    aliases = get_alias_resolver(alias_mapping_path(repo_root))
+    canon_meta = load_canonical_meta(repo_root)
 
-    try:
-        # Load alias index once for canonical team_code resolution
-        mapping_path = repo_root / "data" / "teams" / "alias_mapping.yaml"
-        alias_idx = load_alias_index(mapping_path)
-        canon_meta = load_canonical_meta(repo_root)
-
-        for week, boxscores in iter_weeks(client, start_week, end_week):
-            for m_idx, bs in enumerate(boxscores, start=1):
-                for side in ("home", "away"):
-                    team = getattr(bs, f"{side}_team", None)
-                    lineup = getattr(bs, f"{side}_lineup", None) or []
-                    if not team:
-                        continue
-
-                    # Resolve canonical team_code
-                    src_abbrev = get_team_abbrev(team)
-                    team_code = resolve_canonical(src_abbrev, year, alias_idx)
-
-                    # Owners/co-owned from canonical meta
-                    meta = canon_meta.get((year, team_code), {})
-                    is_co_owned = meta.get("is_co_owned", "")
-                    owner1 = meta.get("owner_code_1", "")
-                    owner2 = meta.get("owner_code_2", "")
-
-                    # Build starter list
-                    # Per-player rounding occurs before summing so team totals
-                    # match the sum of starter rows exactly.
-                    starters = []
-                    stamped = []
-                    for _idx, bp in enumerate(lineup):
-                        slot = norm_slot(
-                            getattr(bp, "slot_position", None),
-                            getattr(bp, "position", None),
-                        )
-                        proj = round(safe_float(getattr(bp, "projected_points", 0.0)), 2)
-                        act = round(safe_float(getattr(bp, "points", 0.0)), 2)
-                        row = {
-                            "slot": slot,
-                            "slot_type": "starters" if is_starter(slot) else "bench",
-                            "player_name": getattr(bp, "name", None),
-                            "nfl_team": getattr(bp, "proTeam", ""),
-                            "position": getattr(bp, "position", None),
-                            "is_placeholder": "No",
-                            "issue_flag": "",
-                            "rs_projected_pf": proj,
-                            "rs_actual_pf": act,
-                            "_orig_idx": _idx,
-                        }
-                        # Flag invalid FLEX position on real rows (RB/WR/TE only)
-                        if row["slot"] == "FLEX":
-                            pos_val = row.get("position")
-                            pos = (str(pos_val) if pos_val else "").upper()
-                            if pos not in FLEX_ELIGIBLE_POSITIONS:
-                                row["issue_flag"] = (
-                                    f"INVALID_FLEX_POSITION:{pos or 'UNKNOWN'}"
-                                )
-                        stamped.append(row)
-                        if row["slot_type"] == "starters":
-                            starters.append(row)
-
-                    # Fill missing required starter slots (0-pt placeholders)
-                    if fill_missing_slots:
-                        # Count current starters by slot
-                        have_counts: dict[str, int] = {}
-                        for r in starters:
-                            slot_key = str(r["slot"])
-                            have_counts[slot_key] = have_counts.get(slot_key, 0) + 1
-
-                        for req_slot, req_count in RFFL_LINEUP_REQUIREMENTS.items():
-                            have = have_counts.get(req_slot, 0)
-                            missing = max(0, req_count - have)
-                            for _i in range(missing):
-                                placeholder = {
-                                    "slot": req_slot,
-                                    "slot_type": "starters",
-                                    "player_name": f"EMPTY SLOT - {req_slot}",
-                                    # FLEX placeholder uses a FLEX-eligible position
-                                    "position": (
-                                        req_slot if req_slot != "FLEX" else "WR"
-                                    ),
-                                    "nfl_team": "",
-                                    "is_placeholder": "Yes",
-                                    "issue_flag": f"MISSING_SLOT:{req_slot}",
-                                    "rs_projected_pf": 0.0,
-                                    "rs_actual_pf": 0.0,
-                                    "_orig_idx": 1000,
-                                }
-                                starters.append(placeholder)
-                                stamped.append(placeholder)
-
-                    team_proj = round(sum(float(r["rs_projected_pf"] or 0) for r in starters), 2)
-                    team_act = round(sum(float(r["rs_actual_pf"] or 0) for r in starters), 2)
-
-                    # Order rows: starters in fixed slot sequence, then bench (original order)
-                    desired_order = [
-                        "QB",
-                        "RB",
-                        "RB",
-                        "WR",
-                        "WR",
-                        "TE",
-                        "FLEX",
-                        "D/ST",
-                        "K",
-                    ]
-                    # Build starters by desired sequence
-                    starters_by_slot: dict[str, list[dict[str, Any]]] = {}
-                    for r in starters:
-                        slot_key = str(r["slot"])
-                        starters_by_slot.setdefault(slot_key, []).append(r)
-                    # Maintain original order within same slot
-                    for lst in starters_by_slot.values():
-                        lst.sort(key=lambda x: x.get("_orig_idx", 0))
-                    starters_sorted: list[dict] = []
-                    for s in desired_order:
-                        if s in starters_by_slot and starters_by_slot[s]:
-                            starters_sorted.append(starters_by_slot[s].pop(0))
-                    # Append any leftover starters just in case (stable by slot then orig idx)
-                    leftovers = [r for lst in starters_by_slot.values() for r in lst]
-                    slot_rank = {
-                        "QB": 0,
-                        "RB": 1,
-                        "WR": 2,
-                        "TE": 3,
-                        "FLEX": 4,
-                        "D/ST": 5,
-                        "K": 6,
-                    }
-                    leftovers.sort(
-                        key=lambda x: (
-                            slot_rank.get(x.get("slot", ""), 99),
-                            x.get("_orig_idx", 0),
-                        )
-                    )
-                    starters_sorted.extend(leftovers)
-                    bench_sorted = [r for r in stamped if r["slot_type"] != "starters"]
-                    bench_sorted.sort(key=lambda x: int(x.get("_orig_idx") or 0))
-                    ordered = starters_sorted + bench_sorted
-
-                    for r in ordered:
-                        r.pop("_orig_idx", None)
-                        rows.append(
-                            Row(
-                                season_year=year,
-                                week=week,
-                                matchup=m_idx,
-                                team_code=team_code,
-                                is_co_owned=is_co_owned,
-                                team_owner_1=owner1,
-                                team_owner_2=owner2,
-                                team_projected_total=team_proj,
-                                team_actual_total=team_act,
-                                **r,
-                            )
-                        )
-    except ESPNAPIError as e:
-        raise
-    except Exception as e:
-        raise ESPNAPIError(f"Failed fetching box scores: {e}") from e
+    out_path = Path(output_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    df = pd.DataFrame([asdict(r) for r in rows])
-    # Rename columns to final header names
-    rename_map = {
-        "is_co_owned": "is_co_owned?",
-    }
-    df = df.rename(columns=rename_map)
-
-    # Optional: enforce cleanliness before writing
-    if require_clean:
-        starters = df[df["slot_type"] == "starters"].copy()
-        team_key = "team_code" if "team_code" in starters.columns else "team_abbrev"
-        agg = starters.groupby(["week", "matchup", team_key], as_index=False).agg(
-            team_projected_total=("team_projected_total", "first"),
-            team_actual_total=("team_actual_total", "first"),
-            starters_proj_sum=("rs_projected_pf", "sum"),
-            starters_actual_sum=("rs_actual_pf", "sum"),
-            starter_count=("slot", "count"),
+    if incremental:
+        if out_path.suffix.lower() == ".parquet":
+            raise ValueError("Incremental export only supports CSV output")
+        return _export_incremental(
+            league_id,
+            year,
+            out_path,
+            client,
+            public_only,
+            aliases,
+            canon_meta,
+            start_week=start_week,
+            end_week=end_week,
+            fill_missing_slots=fill_missing_slots,
+            require_clean=require_clean,
+            tolerance=tolerance,
+            workers=workers,
+            engine=engine,
         )
-        agg["proj_diff"] = (
-            agg["starters_proj_sum"] - agg["team_projected_total"]
-        ).round(2)
-        agg["act_diff"] = (agg["starters_actual_sum"] - agg["team_actual_total"]).round(
-            2
+
+    # fetch -> per-team rows -> writer, one row at a time
+    check = CleanCheck(tolerance) if require_clean else None
+    weeks = _week_stream(
+        engine, league_id, year, client, public_only, start_week, end_week, workers
+    )
+    rows = _fetch_errors_as_api_errors(
+        rows_for_weeks(weeks, year, aliases, canon_meta, fill_missing_slots)
+    )
+    # The writer only replaces out_path if the block completes (clean, no errors)
+    with open_row_writer(out_path, EXPORT_COLUMNS, schema=BOXSCORE_SCHEMA) as writer:
+        for row in rows:
+            if check is not None:
+                check.add(row)
+            writer.write(row_values(row))
+        if check is not None:
+            check.raise_if_unclean()
+
+    # A full rewrite supersedes any incremental progress recorded for this file
+    checkpoint_path(out_path).unlink(missing_ok=True)
+    return out_path
+
+
+def _export_incremental(
+    league_id: int,
+    year: int,
+    out_path: Path,
+    client: ESPNClient,
+    public_only: bool,
+    aliases: AliasResolver,
+    canon_meta: dict[tuple[int, str], dict],
+    *,
+    start_week: int | None,
+    end_week: int | None,
+    fill_missing_slots: bool,
+    require_clean: bool,
+    tolerance: float,
+    workers: int,
+    engine: Literal["espn_api", "raw"],
+) -> Path:
+    """Fetch only missing or live weeks and merge them into the existing CSV."""
+    from ..live.scores import LiveScoringError
+    from .raw_boxscores import SeasonStatus
+
+    # Existing rows are kept verbatim (as strings) so untouched weeks round-trip exactly
+    blocks: dict[int, pd.DataFrame] = {}
+    if out_path.exists() and out_path.stat().st_size > 0:
+        existing = pd.read_csv(out_path, dtype=str, keep_default_na=False)
+        if list(existing.columns) == EXPORT_COLUMNS:
+            for week, block in existing.groupby(existing["week"].astype(int), sort=True):
+                blocks[int(week)] = block
+
+    ckpt_path = checkpoint_path(out_path)
+    checkpoint = ExportCheckpoint.load(ckpt_path, league_id, year, fill_missing_slots)
+
+    try:
+        status = SeasonStatus.from_settings(
+            _live_client(league_id, year, client, public_only).fetch_settings(), year
         )
+    except LiveScoringError as e:
+        raise ESPNAPIError(f"Failed to connect to ESPN: {e}") from e
 
-        bad_proj = agg[agg["proj_diff"].abs() > tolerance]
-        bad_act = agg[agg["act_diff"].abs() > tolerance]
-        bad_cnt = agg[agg["starter_count"] != 9]
+    requested = range(start_week or 1, (end_week or 18) + 1)
+    existing_matchups = {week: block["matchup"].nunique() for week, block in blocks.items()}
+    refresh = weeks_to_refresh(
+        requested,
+        existing_matchups,
+        checkpoint if blocks else None,
+        status.current_week,
+        status.last_completed_week,
+    )
+    if checkpoint is None or not blocks:
+        checkpoint = ExportCheckpoint(league_id, year, fill_missing_slots)
+        # Weeks already in the CSV and trusted by weeks_to_refresh count as final
+        for week in existing_matchups.keys() - set(refresh):
+            checkpoint.record(week, final=True, matchups=existing_matchups[week])
 
-        if not bad_proj.empty or not bad_act.empty or not bad_cnt.empty:
-            raise ValidationError(
-                (
-                    f"Export not clean: proj={len(bad_proj)}, act={len(bad_act)}, "
-                    f"bad_count={len(bad_cnt)}."
-                )
+    try:
+        weeks = _week_stream(
+            engine,
+            league_id,
+            year,
+            client,
+            public_only,
+            start_week,
+            end_week,
+            workers,
+            weeks=refresh,
+        )
+        for week, matchups in weeks:
+            week_rows = list(
+                rows_for_weeks([(week, matchups)], year, aliases, canon_meta, fill_missing_slots)
+            )
+            if not week_rows:
+                continue
+            if require_clean:
+                check = CleanCheck(tolerance)
+                for row in week_rows:
+                    check.add(row)
+                check.raise_if_unclean()
+            df = _rows_frame(week_rows)
+            blocks[week] = df
+            checkpoint.record(
+                week,
+                final=week <= status.last_completed_week,
+                matchups=int(df["matchup"].nunique()),
             )
+            # Merge and checkpoint after every week so a crash loses at most one week
+            _write_csv_atomic(pd.concat([blocks[w] for w in sorted(blocks)]), out_path)
+            checkpoint.save(ckpt_path)
+    except (ESPNAPIError, ValidationError):
+        raise
+    except Exception as e:
+        raise ESPNAPIError(f"Failed fetching box scores: {e}") from e
 
-    out_path = Path(output_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_path, index=False, quoting=csv.QUOTE_MINIMAL)
+    if not out_path.exists():
+        _write_csv_atomic(pd.DataFrame(columns=EXPORT_COLUMNS), out_path)
     return out_path
-
@@ -12,14 +12,19 @@ KORM Rules:
 """
 
 import csv
+import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Iterable, cast
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 
+from .tables import read_table, table_exists
+
 
 # Season configuration
 SEASON_CONFIG = {
@@ -33,6 +38,12 @@ SEASON_CONFIG = {
     2025: {"weeks": (1, 14), "entry_fee": 100, "pool": 1200},
 }
 
+CHECKPOINTS_FILENAME = "korm_checkpoints.json"
+CHECKPOINTS_VERSION = 1
+# Bump whenever strike, elimination or standings rules change, so saved
+# checkpoints computed under the old rules are no longer reused
+KORM_RULES_VERSION = 1
+
 # Payout structure (2019+)
 PAYOUTS = {
     1: 800,  # 1st place
@@ -98,6 +109,95 @@ class KORMSeasonResult:
     team_results: dict[str, KORMTeamResult]
     winner: str | None = None
     ended_early: bool = False  # True if 1 team remained before final week
+    checkpoints: list["KORMCheckpoint"] = field(default_factory=list)
+
+
+@dataclass
+class KORMCheckpoint:
+    """State of every team after a processed KORM week."""
+    week: int
+    teams: dict[str, KORMTeamResult]  # strikes, status and elimination week so far
+    points: dict[str, float]  # season points through this week (final-place tiebreak)
+    scores_digest: str = ""  # fingerprint of the week's scores, to spot corrections
+
+    @property
+    def active_count(self) -> int:
+        return sum(1 for r in self.teams.values() if r.status != "eliminated")
+
+    def team_results(self) -> dict[str, KORMTeamResult]:
+        """Return fresh team results to continue processing from this week."""
+        return _copy_team_results(self.teams)
+
+
+def _copy_team_results(team_results: dict[str, KORMTeamResult]) -> dict[str, KORMTeamResult]:
+    return {
+        code: KORMTeamResult(
+            team_code=code,
+            strikes=list(r.strikes),
+            status=r.status,
+            elimination_week=r.elimination_week,
+        )
+        for code, r in team_results.items()
+    }
+
+
+def score_matrix(
+    weeks: pd.Series,
+    teams: pd.Series,
+    scores: pd.Series,
+    max_week: int,
+) -> pd.DataFrame:
+    """
+    Pivot long (week, team, score) columns into a week x team score matrix.
+
+    Weeks after ``max_week`` are dropped. Teams keep the order in which they
+    first appear; if a (week, team) pair repeats, the last score wins. A team
+    with no score in a week is NaN.
+
+    Returns:
+        DataFrame indexed by week with one float column per team code
+    """
+    long = pd.DataFrame(
+        {
+            "week": pd.to_numeric(weeks).astype(int).to_numpy(),
+            "team": teams.astype(str).to_numpy(),
+            "score": pd.to_numeric(scores).astype(float).to_numpy(),
+        }
+    )
+    long = long[long["week"] <= max_week]
+    matrix = long.pivot_table(index="week", columns="team", values="score", aggfunc="last")
+    matrix = matrix.reindex(columns=long["team"].unique())
+    matrix.columns.name = None
+    return matrix
+
+
+def weekly_scores_from_matrix(matrix: pd.DataFrame) -> dict[int, dict[str, float]]:
+    """Convert a week x team score matrix to ``{week: {team_code: score}}``."""
+    teams = list(matrix.columns)
+    values = matrix.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    return {
+        int(week): {
+            teams[i]: float(values[row, i]) for i in np.flatnonzero(present[row])
+        }
+        for row, week in enumerate(matrix.index)
+    }
+
+
+def load_score_matrix_from_h2h(h2h_path: Path, max_week: int) -> pd.DataFrame:
+    """Load the week x team score matrix from h2h.csv format (2018)."""
+    df = read_table(h2h_path)
+    # Interleave home and away so teams keep their row order from the file
+    home = df[["week", "home_team", "home_score"]].set_axis(["week", "team", "score"], axis=1)
+    away = df[["week", "away_team", "away_score"]].set_axis(["week", "team", "score"], axis=1)
+    long = pd.concat([home, away], keys=[0, 1]).swaplevel().sort_index(kind="stable")
+    return score_matrix(long["week"], long["team"], long["score"], max_week)
+
+
+def load_score_matrix_from_teamweek(teamweek_path: Path, max_week: int) -> pd.DataFrame:
+    """Load the week x team score matrix from teamweek_unified.csv format (2019+)."""
+    df = read_table(teamweek_path)
+    return score_matrix(df["week"], df["team_code"], df["team_actual_total"], max_week)
 
 
 def load_weekly_scores_from_h2h(h2h_path: Path, max_week: int) -> dict[int, dict[str, float]]:
@@ -111,28 +211,7 @@ def load_weekly_scores_from_h2h(h2h_path: Path, max_week: int) -> dict[int, dict
     Returns:
         {week: {team_code: actual_score}}
     """
-    df = pd.read_csv(h2h_path)
-    weekly_scores: dict[int, dict[str, float]] = {}
-
-    for _, row in df.iterrows():
-        week = int(row["week"])
-        if week > max_week:
-            continue
-
-        if week not in weekly_scores:
-            weekly_scores[week] = {}
-
-        # Extract home team score
-        home_team = row["home_team"]
-        home_score = float(row["home_score"])
-        weekly_scores[week][home_team] = home_score
-
-        # Extract away team score
-        away_team = row["away_team"]
-        away_score = float(row["away_score"])
-        weekly_scores[week][away_team] = away_score
-
-    return weekly_scores
+    return weekly_scores_from_matrix(load_score_matrix_from_h2h(h2h_path, max_week))
 
 
 def load_weekly_scores_from_teamweek(
@@ -149,31 +228,35 @@ def load_weekly_scores_from_teamweek(
     Returns:
         {week: {team_code: actual_score}}
     """
-    df = pd.read_csv(teamweek_path)
-    weekly_scores: dict[int, dict[str, float]] = {}
+    return weekly_scores_from_matrix(load_score_matrix_from_teamweek(teamweek_path, max_week))
 
-    for _, row in df.iterrows():
-        week = int(row["week"])
-        if week > max_week:
-            continue
 
-        if week not in weekly_scores:
-            weekly_scores[week] = {}
+def load_weekly_scores(year: int, repo_root: Path) -> dict[int, dict[str, float]]:
+    """
+    Load weekly scores for a season from appropriate data source.
 
-        team_code = row["team_code"]
-        score = float(row["team_actual_total"])
-        weekly_scores[week][team_code] = score
+    Args:
+        year: Season year
+        repo_root: Repository root path
 
-    return weekly_scores
+    Returns:
+        {week: {team_code: actual_score}}
 
+    Raises:
+        FileNotFoundError: If data file doesn't exist
+    """
+    return load_weekly_scores_from_season_dir(year, repo_root / "data" / "seasons" / str(year))
 
-def load_weekly_scores(year: int, repo_root: Path) -> dict[int, dict[str, float]]:
+
+def load_weekly_scores_from_season_dir(
+    year: int, season_dir: Path
+) -> dict[int, dict[str, float]]:
     """
-    Load weekly scores for a season from appropriate data source.
+    Load weekly scores from a season directory (h2h.csv for 2018, else teamweek).
 
     Args:
         year: Season year
-        repo_root: Repository root path
+        season_dir: Directory holding the season's data files
 
     Returns:
         {week: {team_code: actual_score}}
@@ -181,7 +264,6 @@ def load_weekly_scores(year: int, repo_root: Path) -> dict[int, dict[str, float]
     Raises:
         FileNotFoundError: If data file doesn't exist
     """
-    season_dir = repo_root / "data" / "seasons" / str(year)
     config = SEASON_CONFIG.get(year, {"weeks": (1, 14), "entry_fee": 100, "pool": 1200})
     weeks_tuple = cast(tuple[int, int], config["weeks"])
     max_week = weeks_tuple[1]
@@ -189,13 +271,13 @@ def load_weekly_scores(year: int, repo_root: Path) -> dict[int, dict[str, float]
     if year == 2018:
         # Use h2h.csv format
         h2h_path = season_dir / "h2h.csv"
-        if not h2h_path.exists():
+        if not table_exists(h2h_path):
             raise FileNotFoundError(f"h2h.csv not found for {year}")
         return load_weekly_scores_from_h2h(h2h_path, max_week)
     else:
         # Use teamweek_unified.csv format
         teamweek_path = season_dir / "reports" / "teamweek_unified.csv"
-        if not teamweek_path.exists():
+        if not table_exists(teamweek_path):
             raise FileNotFoundError(f"teamweek_unified.csv not found for {year}")
         return load_weekly_scores_from_teamweek(teamweek_path, max_week)
 
@@ -288,13 +370,23 @@ def process_korm_week(
     )
 
 
-def process_korm_season(year: int, weekly_scores: dict[int, dict[str, float]]) -> KORMSeasonResult:
+def process_korm_season(
+    year: int,
+    weekly_scores: dict[int, dict[str, float]],
+    previous: KORMSeasonResult | None = None,
+) -> KORMSeasonResult:
     """
     Process complete KORM season.
 
+    With ``previous`` (e.g. from ``load_korm_season``), processing resumes
+    from its last checkpoint whose week scores are unchanged, so adding a
+    week costs one ``process_korm_week`` call. A corrected week restarts
+    processing from that week.
+
     Args:
         year: Season year
         weekly_scores: {week: {team_code: actual_score}}
+        previous: Earlier result for the same season to resume from
 
     Returns:
         KORMSeasonResult with complete season results
@@ -313,17 +405,30 @@ def process_korm_season(year: int, weekly_scores: dict[int, dict[str, float]]) -
 
     teams = list(weekly_scores[1].keys())
 
+    # Reuse checkpoints up to the first week whose scores changed
+    checkpoints: list[KORMCheckpoint] = []
+    if previous is not None and previous.teams == teams:
+        for checkpoint in previous.checkpoints:
+            scores = weekly_scores.get(checkpoint.week)
+            if scores is None or checkpoint.scores_digest != scores_digest(scores):
+                break
+            checkpoints.append(checkpoint)
+    resume_week = checkpoints[-1].week if checkpoints else 0
+
     # Initialize team results
-    team_results: dict[str, KORMTeamResult] = {
-        team: KORMTeamResult(team_code=team)
-        for team in teams
-    }
+    team_results: dict[str, KORMTeamResult] = (
+        checkpoints[-1].team_results() if checkpoints
+        else {team: KORMTeamResult(team_code=team) for team in teams}
+    )
+    points = dict(checkpoints[-1].points) if checkpoints else dict.fromkeys(teams, 0.0)
 
     # Process each week
-    week_results: list[KORMWeekResult] = []
+    week_results: list[KORMWeekResult] = [
+        w for w in (previous.weeks if previous else []) if w.week <= resume_week
+    ]
     ended_early = False
 
-    for week in range(start_week, end_week + 1):
+    for week in range(max(start_week, resume_week + 1), end_week + 1):
         if week not in weekly_scores:
             continue
 
@@ -337,6 +442,16 @@ def process_korm_season(year: int, weekly_scores: dict[int, dict[str, float]]) -
 
         week_result = process_korm_week(week, weekly_scores[week], team_results)
         week_results.append(week_result)
+        for team in points:
+            points[team] += weekly_scores[week].get(team, 0)
+        checkpoints.append(
+            KORMCheckpoint(
+                week=week,
+                teams=_copy_team_results(team_results),
+                points=dict(points),
+                scores_digest=scores_digest(weekly_scores[week]),
+            )
+        )
 
     # Determine final standings
     _assign_final_standings(team_results, weekly_scores, year)
@@ -358,9 +473,16 @@ def process_korm_season(year: int, weekly_scores: dict[int, dict[str, float]]) -
         team_results=team_results,
         winner=winner,
         ended_early=ended_early,
+        checkpoints=checkpoints,
     )
 
 
+def scores_digest(scores: dict[str, float]) -> str:
+    """Fingerprint one week's scores (team order included, as it breaks ties)."""
+    payload = json.dumps(list(scores.items()), separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
 def _assign_final_standings(
     team_results: dict[str, KORMTeamResult],
     weekly_scores: dict[int, dict[str, float]],
@@ -408,6 +530,22 @@ def _assign_final_standings(
         place += 1
 
 
+def _strike_counts_by_week(result: KORMSeasonResult) -> dict[int, dict[str, int]]:
+    """Strike count of every team after each week, from the checkpoints if present."""
+    if result.checkpoints:
+        return {
+            cp.week: {code: r.strike_count for code, r in cp.teams.items()}
+            for cp in result.checkpoints
+        }
+    counts: dict[int, dict[str, int]] = {}
+    cumulative = {team: 0 for team in result.teams}
+    for week in result.weeks:
+        for team in week.strikes_given:
+            cumulative[team] = cumulative.get(team, 0) + 1
+        counts[week.week] = dict(cumulative)
+    return counts
+
+
 def generate_korm_markdown(result: KORMSeasonResult) -> str:
     """
     Generate markdown report for a KORM season.
@@ -433,8 +571,7 @@ def generate_korm_markdown(result: KORMSeasonResult) -> str:
 
     lines.extend(["", "---", "", "## Week-by-Week Results"])
 
-    # Track cumulative strikes for each team as we iterate through weeks
-    cumulative_strikes: dict[str, int] = {team: 0 for team in result.teams}
+    strikes_after = _strike_counts_by_week(result)
 
     # Week-by-week results
     for week in result.weeks:
@@ -447,10 +584,6 @@ def generate_korm_markdown(result: KORMSeasonResult) -> str:
             "|------|------|-------|--------|",
         ])
 
-        # Update cumulative strikes for this week's strikes
-        for team in week.strikes_given:
-            cumulative_strikes[team] += 1
-
         for i, score_entry in enumerate(week.scores, 1):
             team = score_entry["team"]
             score = score_entry["score"]
@@ -458,7 +591,7 @@ def generate_korm_markdown(result: KORMSeasonResult) -> str:
             if team in week.eliminations:
                 status = "☠️ ELIMINATED"
             elif team in week.strikes_given:
-                strike_num = cumulative_strikes[team]
+                strike_num = strikes_after[week.week][team]
                 if strike_num == 1:
                     status = "⚠️ Strike 1"
                 else:
@@ -570,18 +703,231 @@ def generate_korm_json(result: KORMSeasonResult) -> dict[str, Any]:
     }
 
 
+def generate_korm_checkpoints_json(result: KORMSeasonResult) -> dict[str, Any]:
+    """
+    Generate the per-week state snapshots for a KORM season.
+
+    Args:
+        result: KORMSeasonResult to format
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    return {
+        "version": CHECKPOINTS_VERSION,
+        "rules": KORM_RULES_VERSION,
+        "season": result.season,
+        "teams": result.teams,
+        "checkpoints": [
+            {
+                "week": cp.week,
+                "active_count": cp.active_count,
+                "scores_digest": cp.scores_digest,
+                "teams": {
+                    code: {
+                        "status": r.status,
+                        "strikes": [[s.week, s.score] for s in r.strikes],
+                        "elimination_week": r.elimination_week,
+                        "points": cp.points.get(code, 0.0),
+                    }
+                    for code, r in cp.teams.items()
+                },
+            }
+            for cp in result.checkpoints
+        ],
+    }
+
+
+def load_korm_checkpoints(path: Path) -> list[KORMCheckpoint]:
+    """
+    Read per-week KORM state snapshots written by ``process_and_save_korm_season``.
+
+    Args:
+        path: Path to korm_checkpoints.json
+
+    Returns:
+        Checkpoints in week order
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is not a supported checkpoints file, or was
+            written by a different version of the KORM rules
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != CHECKPOINTS_VERSION:
+        raise ValueError(f"Unsupported KORM checkpoints file: {path}")
+    if data.get("rules") != KORM_RULES_VERSION:
+        raise ValueError(f"KORM checkpoints were written under different rules: {path}")
+
+    checkpoints = []
+    for entry in data["checkpoints"]:
+        teams = {
+            code: KORMTeamResult(
+                team_code=code,
+                strikes=[KORMStrike(int(week), float(score)) for week, score in state["strikes"]],
+                status=state["status"],
+                elimination_week=state["elimination_week"],
+            )
+            for code, state in entry["teams"].items()
+        }
+        checkpoints.append(
+            KORMCheckpoint(
+                week=int(entry["week"]),
+                teams=teams,
+                points={code: float(state["points"]) for code, state in entry["teams"].items()},
+                scores_digest=entry.get("scores_digest", ""),
+            )
+        )
+    return checkpoints
+
+
+def load_korm_season(season_dir: Path) -> KORMSeasonResult | None:
+    """
+    Load a previously saved KORM season to resume processing from.
+
+    Returns None if the results or checkpoints are missing, unreadable, or
+    were written by a different version of the KORM rules.
+    """
+    try:
+        with open(season_dir / "korm_results.json", encoding="utf-8") as f:
+            data = json.load(f)
+        checkpoints = load_korm_checkpoints(season_dir / CHECKPOINTS_FILENAME)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    active_after = {cp.week: cp.active_count for cp in checkpoints}
+    weeks = [
+        KORMWeekResult(
+            week=w["week"],
+            active_count_start=w["active_count"],
+            strike_mode=w["strike_mode"],
+            scores=w["scores"],
+            strikes_given=w["strikes"],
+            eliminations=w["eliminations"],
+            active_count_end=active_after.get(w["week"], w["active_count"]),
+        )
+        for w in data.get("weeks", [])
+    ]
+    final = checkpoints[-1].team_results() if checkpoints else {}
+    for standing in data.get("final_standings", []):
+        if standing["team"] in final:
+            final[standing["team"]].final_place = standing["place"]
+            final[standing["team"]].payout = standing["payout"]
+
+    return KORMSeasonResult(
+        season=data["season"],
+        korm_window=(data["korm_window"]["start"], data["korm_window"]["end"]),
+        entry_fee=data["entry_fee"],
+        pool=data["pool"],
+        teams=data["teams"],
+        weeks=weeks,
+        team_results=final,
+        winner=data.get("winner"),
+        ended_early=data.get("ended_early", False),
+        checkpoints=checkpoints,
+    )
+
+
+def _checkpoints_match_scores(
+    year: int,
+    checkpoints: list[KORMCheckpoint],
+    weekly_scores: dict[int, dict[str, float]],
+    through_week: int | None,
+) -> bool:
+    """Return True if ``checkpoints`` cover every played week up to ``through_week`` as-is."""
+    config = SEASON_CONFIG.get(year, {"weeks": (1, 14)})
+    start_week, end_week = cast(tuple[int, int], config["weeks"])
+    last_week = end_week if through_week is None else min(end_week, through_week)
+    played = [week for week in sorted(weekly_scores) if start_week <= week <= last_week]
+    kept = [cp for cp in checkpoints if cp.week <= last_week]
+
+    if [cp.week for cp in kept] != played[: len(kept)]:
+        return False
+    if any(cp.scores_digest != scores_digest(weekly_scores[cp.week]) for cp in kept):
+        return False
+    # Weeks after the competition ended have no checkpoint
+    return len(kept) == len(played) or (bool(kept) and kept[-1].active_count <= 1)
+
+
+def current_season_checkpoints(
+    season_dir: Path,
+    year: int | None = None,
+    through_week: int | None = None,
+) -> list[KORMCheckpoint]:
+    """
+    Return a season's KORM state after each week, consistent with its scores.
+
+    The saved korm_checkpoints.json is returned as-is when it was written
+    under the current ``KORM_RULES_VERSION`` and holds a checkpoint with a
+    matching scores digest for every played week up to ``through_week``.
+    Otherwise the season is processed from its scores, resuming from the
+    saved weeks that still match, so a teamweek fix or a rules change never
+    yields stale state.
+
+    Args:
+        season_dir: Season directory holding the scores and saved checkpoints
+        year: Season year (defaults to the directory name)
+        through_week: Only weeks up to this one are needed (default: all)
+
+    Returns:
+        Checkpoints in week order, up to ``through_week``
+
+    Raises:
+        FileNotFoundError: If the season has no score data
+        ValueError: If the year is unknown or the scores have no week 1
+    """
+    year = int(season_dir.name) if year is None else year
+    weekly_scores = load_weekly_scores_from_season_dir(year, season_dir)
+    try:
+        checkpoints = load_korm_checkpoints(season_dir / CHECKPOINTS_FILENAME)
+    except (OSError, ValueError, KeyError, TypeError):
+        checkpoints = []
+    if not checkpoints or not _checkpoints_match_scores(
+        year, checkpoints, weekly_scores, through_week
+    ):
+        previous = load_korm_season(season_dir)
+        checkpoints = process_korm_season(year, weekly_scores, previous).checkpoints
+    return [cp for cp in checkpoints if through_week is None or cp.week <= through_week]
+
+
+def load_season_checkpoints(
+    year: int, repo_root: Path, through_week: int | None = None
+) -> dict[int, KORMCheckpoint]:
+    """
+    Return a season's KORM state after each processed week, keyed by week.
+
+    See ``current_season_checkpoints``: saved checkpoints are read directly
+    and only recomputed when they no longer match the rules or scores.
+
+    Raises:
+        FileNotFoundError: If the season has no score data
+    """
+    season_dir = repo_root / "data" / "seasons" / str(year)
+    return {
+        cp.week: cp for cp in current_season_checkpoints(season_dir, year, through_week)
+    }
+
+
 def process_and_save_korm_season(
     year: int,
     repo_root: Path,
     output_dir: Path | None = None,
+    resume: bool = True,
 ) -> tuple[Path, Path]:
     """
     Process KORM for a season and save results.
 
+    Writes korm_results.json, korm_history.md and the per-week state
+    snapshots in korm_checkpoints.json. With ``resume``, weeks already saved
+    in the output directory are reused and only new or corrected weeks are
+    processed.
+
     Args:
         year: Season year
         repo_root: Repository root path
         output_dir: Output directory (defaults to season directory)
+        resume: Continue from the saved checkpoints when they still apply
 
     Returns:
         Tuple of (json_path, markdown_path)
@@ -592,13 +938,14 @@ def process_and_save_korm_season(
     # Load scores
     weekly_scores = load_weekly_scores(year, repo_root)
 
-    # Process KORM
-    result = process_korm_season(year, weekly_scores)
-
     # Determine output directory
     if output_dir is None:
         output_dir = repo_root / "data" / "seasons" / str(year)
 
+    # Process KORM
+    previous = load_korm_season(output_dir) if resume else None
+    result = process_korm_season(year, weekly_scores, previous)
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Save JSON
@@ -611,4 +958,48 @@ def process_and_save_korm_season(
     with open(md_path, "w", encoding="utf-8") as f:
         f.write(generate_korm_markdown(result))
 
+    # Save week checkpoints
+    with open(output_dir / CHECKPOINTS_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(generate_korm_checkpoints_json(result), f, separators=(",", ":"))
+
     return json_path, md_path
+
+
+def _korm_season_job(year: int, repo_root: Path) -> tuple[str, str]:
+    try:
+        _, md_path = process_and_save_korm_season(year, repo_root)
+    except FileNotFoundError as e:
+        return "missing", str(e)
+    except Exception as e:
+        return "error", str(e)
+    return "success", md_path.name
+
+
+def process_and_save_korm_seasons(
+    years: Iterable[int],
+    repo_root: Path,
+    workers: int = 1,
+) -> dict[int, tuple[str, str]]:
+    """
+    Process and save KORM for several seasons, optionally in parallel.
+
+    Seasons are independent, so with ``workers > 1`` they are spread across a
+    process pool. A failing season does not stop the others.
+
+    Args:
+        years: Season years to process
+        repo_root: Repository root path
+        workers: Seasons processed concurrently in separate processes
+
+    Returns:
+        {year: (status, detail)} in year order, where status is "success"
+        (detail is the markdown file name), "missing" or "error" (detail is
+        the error message)
+    """
+    years = sorted(years)
+    if workers <= 1 or len(years) <= 1:
+        outcomes = [_korm_season_job(year, repo_root) for year in years]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(years))) as pool:
+            outcomes = list(pool.map(_korm_season_job, years, [repo_root] * len(years)))
+    return dict(zip(years, outcomes))
@@ -0,0 +1,387 @@
+"""Monte Carlo KORM outcome probabilities.
+
+Starting from the KORM state after the last completed week, the remaining
+weeks of the KORM window are sampled many times from per-team normal score
+distributions. Every trial applies the same rules as ``korm_processor``:
+
+- 5+ active teams: the two lowest scores strike, otherwise the lowest
+- every active team at or below the strike threshold strikes (ties)
+- a second strike eliminates
+- the competition stops once one team is left
+- final places: active teams by fewest strikes, then eliminated teams by
+  latest elimination week, ties broken by total KORM-window points
+
+All trials advance together as ``(trials, teams)`` NumPy arrays, one week at
+a time, so 100k trials of a full window take a fraction of a second.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Sequence, cast
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
+from .korm_processor import (
+    SEASON_CONFIG,
+    KORMSeasonResult,
+    load_weekly_scores,
+    process_korm_season,
+)
+from .tables import read_table, table_exists
+
+DEFAULT_TRIALS = 100_000
+
+# Pseudo-observations of the league-wide distribution added to each team's
+# own history, so teams with only a few weeks are pulled toward the league
+PRIOR_WEEKS = 8.0
+
+
+@dataclass
+class KORMState:
+    """KORM standing of every team after a completed week."""
+
+    teams: list[str]
+    strikes: np.ndarray  # (teams,) strikes received so far
+    elimination_week: np.ndarray  # (teams,) week of elimination, 0 if still active
+    points: np.ndarray  # (teams,) KORM-window points so far (final-place tiebreak)
+    week: int  # last completed week (0 before the season)
+
+    @property
+    def active_count(self) -> int:
+        return int((self.elimination_week == 0).sum())
+
+
+@dataclass
+class ScoreModel:
+    """Normal score distribution for each team in each simulated week."""
+
+    teams: list[str]
+    weeks: list[int]
+    mean: np.ndarray  # (weeks, teams)
+    std: np.ndarray  # (weeks, teams)
+
+
+@dataclass
+class KORMSimulation:
+    """Outcome probabilities over all trials."""
+
+    teams: list[str]
+    weeks: list[int]
+    trials: int
+    next_strike: np.ndarray  # (teams,) P(strike in the first simulated week)
+    any_strike: np.ndarray  # (teams,) P(at least one more strike)
+    eliminated: np.ndarray  # (teams,) P(eliminated by the end of the window)
+    expected_strikes: np.ndarray  # (teams,) mean final strike count
+    place: np.ndarray  # (teams, places) P(finishing in each place)
+
+    @property
+    def win(self) -> np.ndarray:
+        return self.place[:, 0]
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per team, most likely winner first."""
+        places = np.arange(1, len(self.teams) + 1)
+        frame = pd.DataFrame(
+            {
+                "team": self.teams,
+                "win": self.win,
+                "top3": self.place[:, :3].sum(axis=1),
+                "next_strike": self.next_strike,
+                "any_strike": self.any_strike,
+                "eliminated": self.eliminated,
+                "expected_strikes": self.expected_strikes,
+                "expected_place": self.place @ places,
+            }
+        )
+        return frame.sort_values(["expected_place", "team"], ignore_index=True)
+
+
+def state_from_season(
+    result: KORMSeasonResult,
+    weekly_scores: Mapping[int, Mapping[str, float]],
+) -> KORMState:
+    """
+    Build the KORM state from a processed (possibly partial) season.
+
+    Args:
+        result: Output of ``process_korm_season`` for the weeks played so far
+        weekly_scores: The weekly scores that result was computed from
+    """
+    teams = list(result.teams)
+    team_results = [result.team_results[team] for team in teams]
+    return KORMState(
+        teams=teams,
+        strikes=np.array([r.strike_count for r in team_results], dtype=np.int64),
+        elimination_week=np.array(
+            [r.elimination_week or 0 for r in team_results], dtype=np.int64
+        ),
+        points=np.array(
+            [sum(scores.get(team, 0.0) for scores in weekly_scores.values()) for team in teams],
+            dtype=float,
+        ),
+        week=max(weekly_scores, default=0),
+    )
+
+
+def fit_score_model(
+    history: pd.DataFrame,
+    teams: Sequence[str],
+    weeks: Sequence[int],
+    projections: Mapping[str, float] | None = None,
+    prior_weeks: float = PRIOR_WEEKS,
+) -> ScoreModel:
+    """
+    Fit per-team weekly score distributions from teamweek history.
+
+    Each team's mean and standard deviation of ``team_actual_total`` are
+    shrunk toward the league-wide values with ``prior_weeks`` pseudo-weeks.
+    If ``projections`` are given, they replace the mean for the first
+    simulated week. The spread then comes from the team's historical
+    projection error (actual - projected), shrunk the same way.
+
+    Args:
+        history: teamweek_unified rows (``team_code``, ``team_actual_total``,
+            optionally ``team_projected_total``)
+        teams: Team codes, in simulation order
+        weeks: Weeks to simulate
+        projections: Projected totals for the first simulated week
+        prior_weeks: Weight of the league-wide prior, in weeks
+
+    Returns:
+        ScoreModel with (weeks, teams) mean and std arrays
+    """
+    actual = pd.to_numeric(history["team_actual_total"], errors="coerce")
+    codes = history["team_code"].astype(str)
+    season_mean, season_std = _shrunk_moments(actual, codes, teams, prior_weeks)
+
+    mean = np.tile(season_mean, (len(weeks), 1))
+    std = np.tile(season_std, (len(weeks), 1))
+
+    if projections and len(weeks):
+        error_std = season_std
+        if "team_projected_total" in history.columns:
+            projected = pd.to_numeric(history["team_projected_total"], errors="coerce")
+            errors = actual - projected
+            # Projections of 0 mean none were available for that week
+            usable = projected > 0
+            if usable.any():
+                _, error_std = _shrunk_moments(errors[usable], codes[usable], teams, prior_weeks)
+        for i, team in enumerate(teams):
+            if team in projections:
+                mean[0, i] = projections[team]
+                std[0, i] = error_std[i]
+
+    return ScoreModel(teams=list(teams), weeks=list(weeks), mean=mean, std=std)
+
+
+def _shrunk_moments(
+    values: pd.Series,
+    codes: pd.Series,
+    teams: Sequence[str],
+    prior_weeks: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    values = values.dropna()
+    codes = codes.loc[values.index]
+    if values.empty:
+        raise ValueError("No score history to fit from")
+    league_mean = float(values.mean())
+    league_var = float(values.var(ddof=0))
+
+    stats = values.groupby(codes).agg(["count", "mean", "var"]).reindex(list(teams))
+    n = stats["count"].fillna(0).to_numpy(dtype=float)
+    team_mean = stats["mean"].fillna(league_mean).to_numpy(dtype=float)
+    team_var = stats["var"].fillna(league_var).to_numpy(dtype=float)
+
+    weight = n / (n + prior_weeks)
+    mean = weight * team_mean + (1 - weight) * league_mean
+    var = weight * team_var + (1 - weight) * league_var
+    return mean, np.sqrt(var)
+
+
+def simulate_korm(
+    state: KORMState,
+    model: ScoreModel,
+    trials: int = DEFAULT_TRIALS,
+    seed: int | None = None,
+) -> KORMSimulation:
+    """
+    Simulate the remaining KORM weeks and tally outcome probabilities.
+
+    Args:
+        state: Standing after the last completed week
+        model: Score distributions for the weeks to simulate (teams in the
+            same order as ``state.teams``)
+        trials: Number of simulated seasons
+        seed: Random seed for reproducible results
+
+    Returns:
+        KORMSimulation with per-team probabilities
+    """
+    if list(model.teams) != list(state.teams):
+        raise ValueError("Score model teams do not match the KORM state")
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    rng = np.random.default_rng(seed)
+    n_teams = len(state.teams)
+    # Arrays are (teams, trials): every per-team step is then a contiguous
+    # sweep over all trials, and small dtypes keep those sweeps cheap
+    strikes = np.repeat(state.strikes.astype(np.int8)[:, None], trials, axis=1)
+    elimination_week = np.repeat(
+        state.elimination_week.astype(np.int16)[:, None], trials, axis=1
+    )
+    points = np.repeat(state.points.astype(np.float64)[:, None], trials, axis=1)
+    start_strikes = strikes.copy()
+    next_strike = np.zeros(n_teams)
+    mean = model.mean.astype(np.float32)[:, :, None]
+    std = model.std.astype(np.float32)[:, :, None]
+
+    for i, week in enumerate(model.weeks):
+        scores = rng.standard_normal((n_teams, trials), dtype=np.float32)
+        scores *= std[i]
+        scores += mean[i]
+        np.maximum(scores, 0.0, out=scores)
+        # ESPN scores are in hundredths, which keeps exact ties possible
+        np.round(scores, 2, out=scores)
+        # Every week counts toward the points tiebreak, even after KORM ends
+        points += scores
+
+        active = elimination_week == 0
+        active_count = active.sum(axis=0)
+        running = active_count > 1
+        if not running.any():
+            continue
+
+        # Threshold = lowest (1-strike) or second-lowest (2-strike) active score
+        lowest = np.full(trials, np.inf, dtype=np.float32)
+        second = lowest.copy()
+        for team in range(n_teams):
+            team_scores = np.where(active[team], scores[team], np.float32(np.inf))
+            np.minimum(second, np.maximum(lowest, team_scores), out=second)
+            np.minimum(lowest, team_scores, out=lowest)
+        threshold = np.where(active_count >= 5, second, lowest)
+        struck = active & running & (scores <= threshold)
+
+        strikes += struck
+        np.copyto(elimination_week, week, where=struck & (strikes >= 2))
+        if i == 0:
+            next_strike = struck.mean(axis=1)
+
+    place = _final_places(strikes, elimination_week, points)
+    place_probability = np.zeros((n_teams, n_teams))
+    for team in range(n_teams):
+        place_probability[team] = np.bincount(place[team], minlength=n_teams) / trials
+
+    return KORMSimulation(
+        teams=list(state.teams),
+        weeks=list(model.weeks),
+        trials=trials,
+        next_strike=next_strike,
+        any_strike=(strikes > start_strikes).mean(axis=1),
+        eliminated=(elimination_week > 0).mean(axis=1),
+        expected_strikes=strikes.mean(axis=1),
+        place=place_probability,
+    )
+
+
+def _final_places(
+    strikes: np.ndarray,
+    elimination_week: np.ndarray,
+    points: np.ndarray,
+) -> np.ndarray:
+    """Return 0-based final places, shape (teams, trials)."""
+    # Mirrors korm_processor._assign_final_standings: active teams by strikes,
+    # eliminated teams by latest elimination week, then most points. Both
+    # sorts there are stable, so full ties go to the earlier team.
+    eliminated = elimination_week > 0
+    rank = np.where(eliminated, 100 - elimination_week, strikes).astype(np.float64)
+    key = eliminated * 1e12 + rank * 1e9 - points
+    place = np.zeros(key.shape, dtype=np.int64)
+    for team in range(len(key)):
+        for other in range(len(key)):
+            if other < team:
+                place[team] += key[other] <= key[team]
+            elif other > team:
+                place[team] += key[other] < key[team]
+    return place
+
+
+def load_teamweek_history(repo_root: Path, seasons: Sequence[int]) -> pd.DataFrame:
+    """Concatenate the teamweek_unified rows of those seasons that have one."""
+    frames = []
+    for year in seasons:
+        path = repo_root / "data" / "seasons" / str(year) / "reports" / "teamweek_unified.csv"
+        if table_exists(path):
+            frames.append(read_table(path))
+    if not frames:
+        return pd.DataFrame(columns=["team_code", "team_actual_total"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def simulate_korm_season(
+    year: int,
+    repo_root: Path,
+    after_week: int,
+    trials: int = DEFAULT_TRIALS,
+    seed: int | None = None,
+    history_seasons: int = 3,
+    projections: Mapping[str, float] | None = None,
+) -> KORMSimulation:
+    """
+    Simulate the rest of a season's KORM window from its state after a week.
+
+    The score model is fit on this season's weeks up to ``after_week`` plus
+    the previous ``history_seasons`` seasons.
+
+    Args:
+        year: Season year
+        repo_root: Repository root path
+        after_week: Last completed week (0 to simulate the whole window)
+        trials: Number of simulated seasons
+        seed: Random seed for reproducible results
+        history_seasons: Earlier seasons to include in the score model
+        projections: Projected totals for the next week, by team code
+
+    Raises:
+        FileNotFoundError: If the season's scores are not available
+        ValueError: If ``after_week`` is not inside the KORM window
+    """
+    config = SEASON_CONFIG.get(year, {"weeks": (1, 14)})
+    start_week, end_week = cast(tuple[int, int], config["weeks"])
+    if not 0 <= after_week < end_week:
+        raise ValueError(f"after_week must be between 0 and {end_week - 1}")
+
+    weekly_scores = load_weekly_scores(year, repo_root)
+    teams = list(weekly_scores.get(1, {}))
+    if not teams:
+        raise ValueError(f"No week 1 data for {year}")
+    played = {week: scores for week, scores in weekly_scores.items() if week <= after_week}
+
+    if played:
+        state = state_from_season(process_korm_season(year, played), played)
+    else:
+        state = KORMState(
+            teams=teams,
+            strikes=np.zeros(len(teams), dtype=np.int64),
+            elimination_week=np.zeros(len(teams), dtype=np.int64),
+            points=np.zeros(len(teams)),
+            week=0,
+        )
+
+    past = load_teamweek_history(repo_root, range(year - history_seasons, year))
+    current = pd.DataFrame(
+        [
+            {"team_code": team, "team_actual_total": score}
+            for scores in played.values()
+            for team, score in scores.items()
+        ],
+        columns=["team_code", "team_actual_total"],
+    )
+    history = pd.concat([frame for frame in (past, current) if not frame.empty], ignore_index=True)
+
+    weeks = list(range(max(after_week + 1, start_week), end_week + 1))
+    model = fit_score_model(history, teams, weeks, projections=projections)
+    return simulate_korm(state, model, trials=trials, seed=seed)
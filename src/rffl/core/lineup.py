@@ -1,12 +1,154 @@
-"""RFFL lineup validation logic."""
+"""RFFL lineup validation logic.
+
+Lineup checks are a declarative rule set. Each rule is evaluated column-wise
+over the starters of every lineup at once and yields
+``(lineup, order, issue)`` hits; the hits are then put back into the order a
+per-lineup check would report them (lineup, then rule, then ``order``).
+"""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 
 from .constants import FLEX_ELIGIBLE_POSITIONS, RFFL_LINEUP_REQUIREMENTS
 from .exceptions import LineupValidationError
+from .tables import read_table
+
+# Slots that may only hold their own position
+SLOT_POSITIONS = {"QB": "QB", "K": "K", "D/ST": "D/ST"}
+
+# (lineup id, order within the rule, issue)
+RuleHit = tuple[int, int, dict[str, Any]]
+LineupRule = Callable[[pd.DataFrame, np.ndarray, int], Iterator[RuleHit]]
+
+
+def _slot_count_issues(
+    starters: pd.DataFrame, lineup: np.ndarray, n_lineups: int
+) -> Iterator[RuleHit]:
+    """Every lineup fills each slot exactly as ``RFFL_LINEUP_REQUIREMENTS`` says."""
+    slots = list(RFFL_LINEUP_REQUIREMENTS)
+    required = np.array(list(RFFL_LINEUP_REQUIREMENTS.values()))
+    codes = pd.Categorical(starters["slot"], categories=slots).codes
+    known = codes >= 0
+    counts = np.zeros((n_lineups, len(slots)), dtype=np.int64)
+    np.add.at(counts, (lineup[known], codes[known]), 1)
+
+    for lineup_id, col in zip(*np.nonzero(counts != required)):
+        position = slots[col]
+        required_count = int(required[col])
+        actual_count = int(counts[lineup_id, col])
+        yield int(lineup_id), int(col), {
+            "type": "count_mismatch",
+            "position": position,
+            "required": required_count,
+            "actual": actual_count,
+            "description": f"Expected {required_count} {position}, found {actual_count}",
+        }
+
+
+def _flex_eligibility_issues(
+    starters: pd.DataFrame, lineup: np.ndarray, n_lineups: int
+) -> Iterator[RuleHit]:
+    """FLEX holds an RB, WR or TE."""
+    ineligible = (starters["slot"] == "FLEX") & ~starters["position"].isin(
+        FLEX_ELIGIBLE_POSITIONS
+    )
+    positions = starters["position"].to_numpy()
+    players = starters["player_name"].to_numpy()
+    for row in np.flatnonzero(ineligible.to_numpy()):
+        yield int(lineup[row]), int(row), {
+            "type": "flex_ineligible",
+            "position": positions[row],
+            "player": players[row],
+            "description": (
+                f"FLEX player {players[row]} pos {positions[row]} not RB/WR/TE"
+            ),
+        }
+
+
+def _duplicate_player_issues(
+    starters: pd.DataFrame, lineup: np.ndarray, n_lineups: int
+) -> Iterator[RuleHit]:
+    """No player starts twice in one lineup (most repeated first)."""
+    rows = pd.DataFrame(
+        {
+            "lineup": lineup,
+            "player": starters["player_name"].to_numpy(),
+            "row": np.arange(len(starters)),
+        }
+    )
+    rows = rows[rows.duplicated(["lineup", "player"], keep=False) & rows["player"].notna()]
+    if rows.empty:
+        return
+    counted = rows.groupby(["lineup", "player"], sort=False)["row"].agg(["size", "min"])
+    for (lineup_id, player), count, first_row in zip(
+        counted.index, counted["size"], counted["min"]
+    ):
+        # Same order as value_counts(): count descending, then first appearance
+        yield int(lineup_id), -int(count) * len(starters) + int(first_row), {
+            "type": "duplicate_player",
+            "player": player,
+            "count": int(count),
+            "description": f"Player {player} appears {count} times in starters",
+        }
+
+
+def _slot_position_issues(
+    starters: pd.DataFrame, lineup: np.ndarray, n_lineups: int
+) -> Iterator[RuleHit]:
+    """Slots in ``SLOT_POSITIONS`` hold only their own position."""
+    rows = np.flatnonzero(starters["slot"].isin(SLOT_POSITIONS).to_numpy())
+    slots = starters["slot"].iloc[rows].to_numpy()
+    positions = starters["position"].iloc[rows].to_numpy()
+    players = starters["player_name"].iloc[rows].to_numpy()
+    expected = np.array([SLOT_POSITIONS[slot] for slot in slots], dtype=object)
+    for i in np.flatnonzero(positions != expected):
+        row = rows[i]
+        yield int(lineup[row]), int(row), {
+            "type": "invalid_position_in_slot",
+            "slot": slots[i],
+            "position": positions[i],
+            "player": players[i],
+            "description": f"{slots[i]} slot contains {positions[i]} player {players[i]}",
+        }
+
+
+# Evaluated in this order; issues within a lineup are reported in rule order
+LINEUP_RULES: tuple[LineupRule, ...] = (
+    _slot_count_issues,
+    _flex_eligibility_issues,
+    _duplicate_player_issues,
+    _slot_position_issues,
+)
+
+
+def evaluate_lineup_rules(
+    starters: pd.DataFrame, lineup: np.ndarray, n_lineups: int
+) -> list[list[dict[str, Any]]]:
+    """
+    Run ``LINEUP_RULES`` over the starters of many lineups in one pass.
+
+    Args:
+        starters: Starter rows of every lineup
+        lineup: Lineup id (0 to ``n_lineups - 1``) of each row in ``starters``
+        n_lineups: Number of lineups
+
+    Returns:
+        Issues of each lineup, indexed by lineup id
+    """
+    hits = [
+        (lineup_id, rule_index, order, issue)
+        for rule_index, rule in enumerate(LINEUP_RULES)
+        for lineup_id, order, issue in rule(starters, lineup, n_lineups)
+    ]
+    hits.sort(key=lambda hit: hit[:3])
+
+    issues: list[list[dict[str, Any]]] = [[] for _ in range(n_lineups)]
+    for lineup_id, _, _, issue in hits:
+        issues[lineup_id].append(issue)
+    return issues
 
 
 def validate_rffl_lineup(starters_df: pd.DataFrame) -> dict[str, Any]:
@@ -21,108 +163,9 @@ def validate_rffl_lineup(starters_df: pd.DataFrame) -> dict[str, Any]:
         - is_valid: bool
         - issues: list of issue dictionaries
     """
-    issues = []
-
-    # Count starters by slot
-    slot_counts = starters_df["slot"].value_counts().to_dict()
-
-    # Check each required position
-    for position, required_count in RFFL_LINEUP_REQUIREMENTS.items():
-        actual_count = slot_counts.get(position, 0)
-        if actual_count != required_count:
-            issues.append(
-                {
-                    "type": "count_mismatch",
-                    "position": position,
-                    "required": required_count,
-                    "actual": actual_count,
-                    "description": (
-                        f"Expected {required_count} {position}, "
-                        f"found {actual_count}"
-                    ),
-                }
-            )
-
-    # Check FLEX eligibility
-    flex_players = starters_df[starters_df["slot"] == "FLEX"]
-    for _, player in flex_players.iterrows():
-        player_position = player["position"]
-        if player_position not in FLEX_ELIGIBLE_POSITIONS:
-            issues.append(
-                {
-                    "type": "flex_ineligible",
-                    "position": player_position,
-                    "player": player["player_name"],
-                    "description": (
-                        f"FLEX player {player['player_name']} pos {player_position} "
-                        "not RB/WR/TE"
-                    ),
-                }
-            )
-
-    # Check for duplicate players
-    player_counts = starters_df["player_name"].value_counts()
-    duplicates = player_counts[player_counts > 1]
-    for player, count in duplicates.items():
-        issues.append(
-            {
-                "type": "duplicate_player",
-                "player": player,
-                "count": count,
-                "description": f"Player {player} appears {count} times in starters",
-            }
-        )
-
-    # Check for invalid positions in specific slots
-    for _, player in starters_df.iterrows():
-        slot = player["slot"]
-        position = player["position"]
-
-        # QB slot should only have QB position
-        if slot == "QB" and position != "QB":
-            issues.append(
-                {
-                    "type": "invalid_position_in_slot",
-                    "slot": slot,
-                    "position": position,
-                    "player": player["player_name"],
-                    "description": (
-                        f"QB slot contains {position} "
-                        f"player {player['player_name']}"
-                    ),
-                }
-            )
-
-        # K slot should only have K position
-        if slot == "K" and position != "K":
-            issues.append(
-                {
-                    "type": "invalid_position_in_slot",
-                    "slot": slot,
-                    "position": position,
-                    "player": player["player_name"],
-                    "description": (
-                        f"K slot contains {position} "
-                        f"player {player['player_name']}"
-                    ),
-                }
-            )
-
-        # D/ST slot should only have D/ST position
-        if slot == "D/ST" and position != "D/ST":
-            issues.append(
-                {
-                    "type": "invalid_position_in_slot",
-                    "slot": slot,
-                    "position": position,
-                    "player": player["player_name"],
-                    "description": (
-                        f"D/ST slot contains {position} "
-                        f"player {player['player_name']}"
-                    ),
-                }
-            )
-
+    (issues,) = evaluate_lineup_rules(
+        starters_df, np.zeros(len(starters_df), dtype=np.int64), 1
+    )
     return {
         "is_valid": len(issues) == 0,
         "issues": issues,
@@ -138,45 +181,39 @@ def validate_lineup_file(
     Validate RFFL lineup compliance for a boxscores CSV file.
 
     Args:
-        csv_path: Path to boxscores CSV file
+        csv_path: Path to boxscores CSV file (a newer .parquet sibling is preferred)
         output_path: Optional path for validation report
 
     Returns:
         Dictionary with validation results
     """
-    df = pd.read_csv(csv_path)
-    starters = df[df["slot_type"] == "starters"].copy()
-
-    # Group by team-week and validate each lineup
-    lineup_issues = []
-    valid_lineups = 0
-    total_lineups = 0
+    df = read_table(csv_path)
+    starters = df[df["slot_type"] == "starters"]
 
+    # Number lineups in (week, matchup, team) order; rows with a missing key are skipped
     team_key = "team_code" if "team_code" in starters.columns else "team_abbrev"
-    for (week, matchup, team), lineup_df in starters.groupby(
-        ["week", "matchup", team_key]
-    ):
-        total_lineups += 1
-        validation = validate_rffl_lineup(lineup_df)
-
-        if validation["is_valid"]:
-            valid_lineups += 1
-        else:
-            for issue in validation["issues"]:
-                lineup_issues.append(
-                    {
-                        "week": week,
-                        "matchup": matchup,
-                        team_key: team,
-                        "issue_type": issue["type"],
-                        "description": issue["description"],
-                        **{
-                            k: v
-                            for k, v in issue.items()
-                            if k not in ["type", "description"]
-                        },
-                    }
-                )
+    grouped = starters.groupby(["week", "matchup", team_key], sort=True)
+    lineup_keys = grouped.size().index.tolist()
+    lineup_ids = grouped.ngroup().to_numpy()
+    keyed = ~pd.isna(lineup_ids) & (lineup_ids >= 0)
+    issues_by_lineup = evaluate_lineup_rules(
+        starters[keyed], lineup_ids[keyed].astype(np.int64), len(lineup_keys)
+    )
+
+    lineup_issues = [
+        {
+            "week": week,
+            "matchup": matchup,
+            team_key: team,
+            "issue_type": issue["type"],
+            "description": issue["description"],
+            **{k: v for k, v in issue.items() if k not in ["type", "description"]},
+        }
+        for (week, matchup, team), issues in zip(lineup_keys, issues_by_lineup)
+        for issue in issues
+    ]
+    total_lineups = len(lineup_keys)
+    valid_lineups = sum(1 for issues in issues_by_lineup if not issues)
 
     report_path = None
     if lineup_issues and output_path:
@@ -198,4 +235,3 @@ def validate_lineup_file(
         "issues": lineup_issues,
         "report_path": report_path,
     }
-
@@ -0,0 +1,206 @@
+"""Raw-JSON boxscore engine.
+
+Builds the same per-week matchup/lineup stream that ``export_boxscores``
+reads from espn_api ``BoxScore``/``BoxPlayer`` objects, but straight from
+the league JSON fetched through ``LiveScoreClient``. No ``League`` is
+constructed, so the full player pool is never downloaded.
+
+Field semantics mirror espn_api so both engines produce identical rows:
+week selection follows ``League.box_scores`` (weeks past the current week
+fall back to the current week), points come from the season's stat entries
+for the scoring period, and ``nfl_team`` uses espn_api's ``PRO_TEAM_MAP``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from espn_api.football.constant import POSITION_MAP, PRO_TEAM_MAP  # type: ignore[import-untyped]
+
+from ..live.scores import LiveScoreClient, LiveScoringError
+from .exceptions import CacheMissError, ESPNAPIError, RateLimitError
+from .rosters import map_lineup_slot_id, map_position_id
+
+# ESPN does not expose player lineups before this season
+FIRST_BOXSCORE_SEASON = 2019
+
+# (source team abbrev, lineup) for the home and away side of one matchup
+MatchupSides = list[tuple[str | None, list["RawBoxPlayer"]]]
+
+
+@dataclass(slots=True)
+class RawBoxPlayer:
+    """Lineup entry with the BoxPlayer attributes the exporter reads."""
+
+    name: str | None
+    slot_position: str
+    position: str
+    proTeam: str  # noqa: N815 - same name as espn_api BoxPlayer.proTeam (read via getattr)
+    projected_points: float
+    points: float
+
+
+@dataclass(slots=True)
+class SeasonStatus:
+    """Scoring-period bookkeeping needed to map weeks to matchup periods."""
+
+    current_week: int
+    current_matchup_period: int
+    matchup_periods: dict[str, list[int]]
+    # Last scoring period whose stats are final (0 before week 1 ends)
+    last_completed_week: int = 0
+
+    @classmethod
+    def from_settings(cls, payload: dict[str, Any], year: int) -> "SeasonStatus":
+        status = payload.get("status") or {}
+        scoring_period = int(payload.get("scoringPeriodId") or 0)
+        final_period = int(status.get("finalScoringPeriod") or scoring_period)
+        current_week = scoring_period if year < 2018 else min(scoring_period, final_period)
+        if status.get("isActive") is False:
+            last_completed = final_period
+        else:
+            last_completed = max(0, min(scoring_period - 1, final_period))
+        schedule = (payload.get("settings") or {}).get("scheduleSettings") or {}
+        return cls(
+            current_week=current_week,
+            current_matchup_period=int(status.get("currentMatchupPeriod") or 0),
+            matchup_periods=schedule.get("matchupPeriods") or {},
+            last_completed_week=last_completed,
+        )
+
+    def periods_for(self, week: int) -> tuple[int, int]:
+        """Return (scoring_period, matchup_period) as ``League.box_scores`` would."""
+        if week and week <= self.current_week:
+            for matchup_id, weeks in self.matchup_periods.items():
+                if week in weeks:
+                    return week, int(matchup_id)
+            return week, self.current_matchup_period
+        return self.current_week, self.current_matchup_period
+
+
+def _position(player: dict[str, Any]) -> str:
+    position = map_position_id(player.get("defaultPositionId"))
+    if position != "Unknown":
+        return position
+    # Fall back to espn_api's rule: first eligible slot that is not a combo slot
+    name = player.get("fullName") or ""
+    for slot_id in player.get("eligibleSlots") or []:
+        label = POSITION_MAP.get(slot_id, "")
+        if (slot_id != 25 and "/" not in label) or "/" in name:
+            return str(label)
+    return ""
+
+
+def parse_box_player(entry: dict[str, Any], week: int, year: int) -> RawBoxPlayer:
+    """Convert one ``rosterForCurrentScoringPeriod`` entry into a RawBoxPlayer."""
+
+    player = (entry.get("playerPoolEntry") or {}).get("player") or entry.get("player") or {}
+    slot_id = entry.get("lineupSlotId")
+    slot_position = map_lineup_slot_id(int(slot_id)) if slot_id is not None else "FA"
+
+    pro_team = PRO_TEAM_MAP.get(player.get("proTeamId"), "")
+    points = 0.0
+    projected = 0.0
+    found_team = False
+    for stat in player.get("stats") or []:
+        period = stat.get("scoringPeriodId")
+        if (
+            not found_team
+            and period == week
+            and stat.get("statSourceId") == 0
+            and stat.get("proTeamId", 0) != 0
+        ):
+            pro_team = PRO_TEAM_MAP.get(stat["proTeamId"], pro_team)
+            found_team = True
+        if stat.get("seasonId") != year or stat.get("statSplitTypeId") == 2 or period != week:
+            continue
+        value = round(stat.get("appliedTotal", 0), 2)
+        if stat.get("statSourceId") == 0:
+            points = value
+        else:
+            projected = value
+
+    return RawBoxPlayer(
+        name=player.get("fullName"),
+        slot_position=slot_position,
+        position=_position(player),
+        proTeam=pro_team,
+        projected_points=projected,
+        points=points,
+    )
+
+
+def parse_matchups(payload: dict[str, Any], week: int, year: int) -> list[MatchupSides]:
+    """Split a ``fetch_boxscores`` payload into per-matchup home/away lineups."""
+
+    abbrevs = {
+        team.get("id"): team.get("abbrev") or "Unknown" for team in payload.get("teams") or []
+    }
+    matchups: list[MatchupSides] = []
+    for matchup in payload.get("schedule") or []:
+        sides: MatchupSides = []
+        for side_key in ("home", "away"):
+            side = matchup.get(side_key)
+            if not side:
+                sides.append((None, []))
+                continue
+            entries = (side.get("rosterForCurrentScoringPeriod") or {}).get("entries") or []
+            sides.append(
+                (
+                    abbrevs.get(side.get("teamId"), "Unknown"),
+                    [parse_box_player(entry, week, year) for entry in entries],
+                )
+            )
+        matchups.append(sides)
+    return matchups
+
+
+def iter_weeks_raw(
+    client: LiveScoreClient,
+    year: int,
+    start: int | None,
+    end: int | None,
+    workers: int = 1,
+    weeks: Iterable[int] | None = None,
+) -> Iterator[tuple[int, list[MatchupSides]]]:
+    """
+    Iterate over weeks, yielding (week, matchups) from raw league JSON.
+
+    Mirrors ``export.iter_weeks``: weeks ESPN rejects or that have no
+    matchups are skipped, and results are yielded in week order.
+    """
+    if year < FIRST_BOXSCORE_SEASON:
+        return
+    try:
+        status = SeasonStatus.from_settings(client.fetch_settings(), year)
+    except LiveScoringError as e:
+        raise ESPNAPIError(f"Failed to connect to ESPN: {e}") from e
+
+    weeks = sorted(weeks) if weeks is not None else list(range(start or 1, (end or 18) + 1))
+    if not weeks:
+        return
+
+    def fetch(week: int) -> list[MatchupSides] | None:
+        scoring_period, matchup_period = status.periods_for(week)
+        try:
+            payload = client.fetch_boxscores(scoring_period, matchup_period)
+        except LiveScoringError as exc:
+            # Same rule as export._fetch_week: only a rejected week is skipped
+            if isinstance(exc.__cause__, (RateLimitError, CacheMissError)):
+                raise exc.__cause__ from None
+            return None
+        return parse_matchups(payload, scoring_period, year)
+
+    if workers <= 1 or len(weeks) <= 1:
+        results: Iterator[list[MatchupSides] | None] = map(fetch, weeks)
+        for week, matchups in zip(weeks, results):
+            if matchups:
+                yield week, matchups
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(weeks))) as pool:
+        for week, matchups in zip(weeks, pool.map(fetch, weeks)):
+            if matchups:
+                yield week, matchups
@@ -28,7 +28,8 @@ Usage:
 """
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping, Optional
 
 
 # =============================================================================
@@ -461,6 +462,42 @@ REGISTRY: tuple[TeamSeason, ...] = (
 )
 
 
+# =============================================================================
+# INDEXES
+# =============================================================================
+# REGISTRY is immutable, so every lookup is served from read-only indexes
+# built once at import. Owner and team histories are ordered by season.
+
+def _group_by(
+    key: Callable[[TeamSeason], Any],
+    records: Iterable[TeamSeason] = REGISTRY,
+) -> Mapping[Any, tuple[TeamSeason, ...]]:
+    groups: dict[Any, list[TeamSeason]] = {}
+    for team in records:
+        groups.setdefault(key(team), []).append(team)
+    return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+
+def _owner_index() -> Mapping[str, tuple[TeamSeason, ...]]:
+    owners: dict[str, list[TeamSeason]] = {}
+    for team in _BY_SEASON_ORDER:
+        owners.setdefault(team.owner_code_1, []).append(team)
+        if team.owner_code_2 and team.owner_code_2 != team.owner_code_1:
+            owners.setdefault(team.owner_code_2, []).append(team)
+    return MappingProxyType({owner: tuple(teams) for owner, teams in owners.items()})
+
+
+_BY_SEASON_ORDER = tuple(sorted(REGISTRY, key=lambda t: t.season_year))
+_BY_SEASON_AND_CODE: Mapping[tuple[int, str], TeamSeason] = MappingProxyType(
+    {(team.season_year, team.team_code): team for team in REGISTRY}
+)
+_BY_SEASON = _group_by(lambda team: team.season_year)
+_BY_TEAM_CODE = _group_by(lambda team: team.team_code, _BY_SEASON_ORDER)
+_BY_OWNER = _owner_index()
+_CO_OWNED = tuple(team for team in REGISTRY if team.is_co_owned)
+_CO_OWNED_BY_SEASON = _group_by(lambda team: team.season_year, _CO_OWNED)
+
+
 # =============================================================================
 # QUERY FUNCTIONS
 # =============================================================================
@@ -481,10 +518,7 @@ def get_team(team_code: str, season: int) -> Optional[TeamSeason]:
         TeamSeason(season_year=2025, team_code='GFM', team_full_name='Great Fantasy Minds', 
                    is_co_owned=True, owner_code_1='TETZLAFF_LANCE', owner_code_2='TVEDTEN_OLE')
     """
-    for team in REGISTRY:
-        if team.team_code == team_code and team.season_year == season:
-            return team
-    return None
+    return _BY_SEASON_AND_CODE.get((season, team_code))
 
 
 def get_teams_by_season(season: int) -> list[TeamSeason]:
@@ -501,7 +535,7 @@ def get_teams_by_season(season: int) -> list[TeamSeason]:
         >>> len(get_teams_by_season(2011))
         12
     """
-    return [team for team in REGISTRY if team.season_year == season]
+    return list(_BY_SEASON.get(season, ()))
 
 
 def get_owner_history(owner_code: str) -> list[TeamSeason]:
@@ -519,11 +553,7 @@ def get_owner_history(owner_code: str) -> list[TeamSeason]:
         >>> len(history)
         24
     """
-    results = [
-        team for team in REGISTRY 
-        if team.owner_code_1 == owner_code or team.owner_code_2 == owner_code
-    ]
-    return sorted(results, key=lambda t: t.season_year)
+    return list(_BY_OWNER.get(owner_code, ()))
 
 
 def get_team_history(team_code: str) -> list[TeamSeason]:
@@ -541,8 +571,7 @@ def get_team_history(team_code: str) -> list[TeamSeason]:
         >>> history[0].season_year
         2011
     """
-    results = [team for team in REGISTRY if team.team_code == team_code]
-    return sorted(results, key=lambda t: t.season_year)
+    return list(_BY_TEAM_CODE.get(team_code, ()))
 
 
 def get_co_owned_teams(season: Optional[int] = None) -> list[TeamSeason]:
@@ -555,10 +584,9 @@ def get_co_owned_teams(season: Optional[int] = None) -> list[TeamSeason]:
     Returns:
         List of co-owned TeamSeason records
     """
-    results = [team for team in REGISTRY if team.is_co_owned]
     if season:
-        results = [team for team in results if team.season_year == season]
-    return results
+        return list(_CO_OWNED_BY_SEASON.get(season, ()))
+    return list(_CO_OWNED)
 
 
 def get_ironmen() -> tuple[Ironman, ...]:
@@ -568,17 +596,12 @@ def get_ironmen() -> tuple[Ironman, ...]:
 
 def get_unique_owners() -> set[str]:
     """Get all unique owner codes across all seasons."""
-    owners = set()
-    for team in REGISTRY:
-        owners.add(team.owner_code_1)
-        if team.owner_code_2:
-            owners.add(team.owner_code_2)
-    return owners
+    return set(_BY_OWNER)
 
 
 def get_unique_team_codes() -> set[str]:
     """Get all unique team codes across all seasons."""
-    return {team.team_code for team in REGISTRY}
+    return set(_BY_TEAM_CODE)
 
 
 def validate_registry() -> dict[str, Any]:
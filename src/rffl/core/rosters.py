@@ -7,9 +7,10 @@ from pathlib import Path
 import pandas as pd  # type: ignore[import-untyped]
 import requests  # type: ignore[import-untyped]
 
+from .aliases import alias_mapping_path, get_alias_resolver
 from .api import ESPNCredentials
 from .exceptions import ESPNAPIError
-from .utils import load_alias_index, resolve_canonical
+from .transport import http_get
 
 
 @dataclass
@@ -174,7 +175,7 @@ def export_historical_rosters(
             cookies["SWID"] = credentials.swid
 
     try:
-        response = requests.get(base_url, params=params, cookies=cookies, timeout=10)
+        response = http_get(base_url, params=params, cookies=cookies, timeout=10)
         response.raise_for_status()
 
         # Historical API returns data wrapped in array
@@ -193,8 +194,7 @@ def export_historical_rosters(
     rows: list[HistoricalRosterRow] = []
 
     # Load alias index for canonical team resolution
-    mapping_path = repo_root / "data" / "teams" / "alias_mapping.yaml"
-    alias_idx = load_alias_index(mapping_path)
+    aliases = get_alias_resolver(alias_mapping_path(repo_root))
 
     try:
         # Extract teams and their rosters
@@ -209,7 +209,7 @@ def export_historical_rosters(
                 or team.get("name")
                 or f"TEAM_{team_id}"
             )
-            team_code = resolve_canonical(team_abbrev, year, alias_idx)
+            team_code = aliases.resolve(team_abbrev, year)
 
             # Get roster for each week requested
             roster = team.get("roster", {})
@@ -0,0 +1,152 @@
+"""Explicit column types for season datasets.
+
+Each schema maps output column name to a ``pyarrow`` type factory name, in
+file order. Parquet output is written with these types instead of whatever
+pandas would infer, so every season reads back with identical dtypes.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# data/seasons/<year>/boxscores.*
+BOXSCORE_SCHEMA: dict[str, str] = {
+    "season_year": "int32",
+    "week": "int32",
+    "matchup": "int32",
+    "team_code": "string",
+    "is_co_owned?": "string",
+    "team_owner_1": "string",
+    "team_owner_2": "string",
+    "team_projected_total": "float64",
+    "team_actual_total": "float64",
+    "slot_type": "string",
+    "slot": "string",
+    "player_name": "string",
+    "nfl_team": "string",
+    "position": "string",
+    "is_placeholder": "string",
+    "issue_flag": "string",
+    "rs_projected_pf": "float64",
+    "rs_actual_pf": "float64",
+}
+
+
+# data/seasons/<year>/reports/teamweek_unified.*
+TEAMWEEK_SCHEMA: dict[str, str] = {
+    "season_year": "int32",
+    "week": "int32",
+    "matchup": "int32",
+    "team_code": "string",
+    "is_co_owned?": "string",
+    "team_owner_1": "string",
+    "team_owner_2": "string",
+    "opponent_code": "string",
+    "opp_is_co_owned?": "string",
+    "opp_owner_1": "string",
+    "opp_owner_2": "string",
+    "team_projected_total": "float64",
+    "team_actual_total": "float64",
+    "opp_actual_total": "float64",
+    "result": "string",
+    "margin": "float64",
+}
+
+# data/seasons/<year>/h2h.* (no season_year column; pre-2019 seasons)
+H2H_SCHEMA: dict[str, str] = {
+    "week": "int32",
+    "matchup": "int32",
+    "home_team": "string",
+    "away_team": "string",
+    "home_score": "float64",
+    "away_score": "float64",
+    "winner": "string",
+    "margin": "float64",
+}
+
+# data/seasons/<year>/draft.*
+DRAFT_SCHEMA: dict[str, str] = {
+    "year": "int32",
+    "round": "int32",
+    "round_pick": "int32",
+    "team_abbrev": "string",
+    "player_id": "int64",
+    "player_name": "string",
+    "bid_amount": "float64",
+    "keeper": "bool_",
+    "nominating_team": "string",
+}
+
+# data/seasons/<year>/transactions.*
+TRANSACTION_SCHEMA: dict[str, str] = {
+    "season_year": "int32",
+    "bid_amount": "float64",
+    "date": "string",
+    "effective_date": "string",
+    "id": "string",
+    "is_pending": "bool_",
+    "rating": "int32",
+    "status": "string",
+    "type": "string",
+    "team_id": "int32",
+    "team_code": "string",
+    "member_id": "string",
+    "player_id": "int64",
+    "player_name": "string",
+    "to_team_id": "int32",
+    "to_team_code": "string",
+    "from_team_id": "int32",
+    "from_team_code": "string",
+}
+
+# data/seasons/<year>/stat_corrections.*
+STAT_CORRECTION_SCHEMA: dict[str, str] = {
+    "season_year": "int32",
+    "week": "int32",
+    "player_id": "string",
+    "player_name": "string",
+    "team_id": "int32",
+    "team_code": "string",
+    "stat_id": "string",
+    "stat_name": "string",
+    "original_value": "string",
+    "corrected_value": "string",
+    "points_impact": "string",
+    "correction_date": "string",
+}
+
+
+def coerce_value(value: Any, type_name: str) -> Any:
+    """
+    Convert a row value to the Python type Arrow expects for ``type_name``.
+
+    Empty strings and NaN become null, matching how the same cell reads back
+    from CSV.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if type_name == "string":
+        return str(value)
+    if type_name.startswith("int"):
+        return int(value)
+    if type_name.startswith("float"):
+        return float(value)
+    if type_name == "bool_":
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1", "yes")
+        return bool(value)
+    return value
+
+
+def arrow_schema(schema: dict[str, str]) -> Any:
+    """Build a ``pyarrow.Schema`` from a column -> type-name mapping."""
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "Parquet output requires pyarrow. Install with: pip install 'rffl-tools[parquet]'"
+        ) from e
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in schema.items()])
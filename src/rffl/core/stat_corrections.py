@@ -1,22 +1,75 @@
 """Stat corrections export logic via web scraping."""
 
+import asyncio
 import csv
+import json
+import warnings
+from contextlib import AsyncExitStack
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Literal
 from urllib.parse import unquote
 
+import pandas as pd  # type: ignore[import-untyped]
 import requests  # type: ignore[import-untyped]
 from bs4 import BeautifulSoup
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+from .aliases import alias_mapping_path, get_alias_resolver
 from .api import ESPNCredentials
 from .exceptions import ESPNAPIError
+from .tables import read_table, table_exists
+from .transport import http_get
+from .utils import load_canonical_meta
+
+STAT_CORRECTIONS_URL = "https://fantasy.espn.com/football/statcorrections"
+
+# Browser tabs scraping weeks at the same time
+DEFAULT_SCRAPE_PAGES = 4
+
+# Requests aborted while rendering: nothing here affects the corrections data
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_MARKERS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "omtrdc.net",
+    "demdex.net",
+    "chartbeat",
+    "scorecardresearch.com",
+    "nielsen",
+    "bluekai.com",
+    "branch.io",
+    "optimizely",
+)
+
+# stat_id values on rows emitted by diff mode
+DIFF_PLAYER_POINTS = "fantasy_points"
+DIFF_TEAM_TOTAL = "team_total"
+DIFF_MATCHUP_RESULT = "matchup_result"
+POINTS_TOLERANCE = 0.005
+
+CORRECTIONS_SELECTOR = "table, [data-testid*='correction'], .stat-corrections, .no-corrections"
+
+NEXT_DATA_CORRECTIONS_JS = """
+    () => {
+        // Try to find corrections in the Next.js page props
+        const nextData = window.__NEXT_DATA__;
+        if (nextData && nextData.props && nextData.props.pageProps) {
+            const pageProps = nextData.props.pageProps;
+            if (pageProps.corrections || pageProps.statCorrections) {
+                return pageProps.corrections || pageProps.statCorrections;
+            }
+        }
+        return null;
+    }
+"""
 
 
 @dataclass
@@ -60,210 +113,557 @@ def _make_session(credentials: ESPNCredentials | None) -> requests.Session:
     return session
 
 
-def _scrape_stat_corrections_page(
+def _optional_str(value: Any) -> str | None:
+    """Stringify a JSON value, keeping a missing value as None."""
+    return str(value) if value is not None else None
+
+
+def _row_from_item(item: dict[str, Any], year: int, week: int) -> StatCorrectionRow:
+    """Build a StatCorrectionRow from a corrections JSON object."""
+    return StatCorrectionRow(
+        season_year=year,
+        week=week,
+        player_id=str(item.get("playerId", "")) if item.get("playerId") else None,
+        player_name=item.get("playerName") or item.get("name") or item.get("player"),
+        team_id=item.get("teamId"),
+        team_code=item.get("teamCode") or item.get("team"),
+        stat_id=str(item.get("statId", "")) if item.get("statId") else None,
+        stat_name=item.get("statName") or item.get("stat"),
+        original_value=_optional_str(item.get("originalValue")),
+        corrected_value=_optional_str(item.get("correctedValue")),
+        points_impact=_optional_str(item.get("pointsImpact")),
+        correction_date=item.get("correctionDate") or item.get("date"),
+    )
+
+
+def _rows_from_table_html(table_html: str, year: int, week: int) -> list[StatCorrectionRow]:
+    """Parse the rendered corrections table (player, stat, original, corrected, impact)."""
+    corrections = []
+    soup = BeautifulSoup(table_html, "html.parser")
+    rows = soup.find_all("tr")
+    for row in rows[1:]:  # Skip header
+        cells = row.find_all(["td", "th"])
+        if len(cells) < 3:
+            continue
+        cell_texts = [cell.get_text(strip=True) for cell in cells]
+        if not any(cell_texts):
+            continue
+        player_name = cell_texts[0] or None
+        stat_name = cell_texts[1] or None
+        if player_name or stat_name:
+            corrections.append(
+                StatCorrectionRow(
+                    season_year=year,
+                    week=week,
+                    player_id=None,
+                    player_name=player_name,
+                    team_id=None,
+                    team_code=None,
+                    stat_id=None,
+                    stat_name=stat_name,
+                    original_value=cell_texts[2],
+                    corrected_value=cell_texts[3] if len(cell_texts) > 3 else None,
+                    points_impact=cell_texts[4] if len(cell_texts) > 4 else None,
+                    correction_date=None,
+                )
+            )
+    return corrections
+
+
+def _should_block(resource_type: str, url: str) -> bool:
+    """Return True for requests the corrections page does not need to render."""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    url = url.lower()
+    return any(marker in url for marker in BLOCKED_URL_MARKERS)
+
+
+def _playwright_cookies(session: requests.Session) -> list[dict[str, str]]:
+    """Convert session cookies into Playwright's cookie format."""
+    return [
+        {
+            "name": cookie.name,
+            "value": cookie.value or "",
+            "domain": cookie.domain or ".espn.com",
+            "path": cookie.path or "/",
+        }
+        for cookie in session.cookies
+    ]
+
+
+class StatCorrectionsBrowser:
+    """
+    One headless Chromium shared by every week of a stat-corrections run.
+
+    The browser and its authenticated context are launched once; ``pages``
+    tabs are opened up front and handed out to concurrent ``scrape`` calls.
+    Images, fonts, media and analytics requests are aborted so each week
+    only waits for the corrections data itself.
+
+    Usage:
+        async with StatCorrectionsBrowser(session, pages=4) as browser:
+            rows = await browser.scrape(league_id, year, week)
+    """
+
+    def __init__(self, session: requests.Session, pages: int = DEFAULT_SCRAPE_PAGES):
+        self.session = session
+        self.pages = max(1, pages)
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._idle: asyncio.Queue[Any] | None = None
+
+    async def __aenter__(self) -> "StatCorrectionsBrowser":
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            context = await self._browser.new_context()
+            if self.session.cookies:
+                await context.add_cookies(_playwright_cookies(self.session))
+            await context.route("**/*", self._route)
+            self._idle = asyncio.Queue()
+            for _ in range(self.pages):
+                self._idle.put_nowait(await context.new_page())
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @staticmethod
+    async def _route(route: Any) -> None:
+        request = route.request
+        if _should_block(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def scrape(self, league_id: int, year: int, week: int) -> list[StatCorrectionRow]:
+        """Render one week's corrections page on a pooled tab and extract its rows."""
+        if self._idle is None:
+            raise RuntimeError("StatCorrectionsBrowser must be used as an async context manager")
+        page = await self._idle.get()
+        try:
+            return await _scrape_rendered_page(page, league_id, year, week)
+        finally:
+            self._idle.put_nowait(page)
+
+
+async def _scrape_rendered_page(
+    page: Any, league_id: int, year: int, week: int
+) -> list[StatCorrectionRow]:
+    """
+    Scrape stat corrections from a Playwright page.
+
+    ESPN uses a Next.js React app that loads corrections dynamically via JavaScript,
+    so the page is rendered and read from the table or the Next.js page props.
+    """
+    full_url = f"{STAT_CORRECTIONS_URL}?leagueId={league_id}&scoringPeriodId={week}"
+    await page.goto(full_url, wait_until="domcontentloaded", timeout=30000)
+
+    # Wait for corrections table or "No corrections" message
+    try:
+        await page.wait_for_selector(CORRECTIONS_SELECTOR, timeout=10000)
+    except Exception:
+        pass  # Continue even if selector not found
+
+    corrections: list[StatCorrectionRow] = []
+
+    # Method 1: Look for table
+    table = await page.query_selector("table")
+    if table:
+        corrections.extend(_rows_from_table_html(await table.inner_html(), year, week))
+
+    # Method 2: Try to get data from page's JavaScript context
+    try:
+        corrections_data = await page.evaluate(NEXT_DATA_CORRECTIONS_JS)
+        if corrections_data and isinstance(corrections_data, list):
+            for item in corrections_data:
+                if isinstance(item, dict):
+                    corrections.append(_row_from_item(item, year, week))
+    except Exception:
+        pass  # JavaScript extraction failed, keep table rows
+
+    return corrections
+
+
+def _find_corrections_in_data(obj: Any) -> list[Any] | None:
+    """Return the first list stored under a key containing "correction"."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if "correction" in key.lower() and isinstance(value, list):
+                return value
+            if isinstance(value, (dict, list)):
+                result = _find_corrections_in_data(value)
+                if result:
+                    return result
+    elif isinstance(obj, list):
+        for item in obj:
+            result = _find_corrections_in_data(item)
+            if result:
+                return result
+    return None
+
+
+def _scrape_stat_corrections_html(
     league_id: int,
     year: int,
     week: int,
     session: requests.Session,
 ) -> list[StatCorrectionRow]:
     """
-    Scrape stat corrections from ESPN web page.
-    
-    ESPN uses a Next.js React app that loads corrections dynamically via JavaScript.
-    We use Playwright to render the page and extract the data.
-    
+    Scrape stat corrections from the server-rendered HTML.
+
+    Fallback for when Playwright is unavailable or the rendered page yields
+    nothing: reads ``__NEXT_DATA__`` from the plain HTML response.
+
     Args:
         league_id: ESPN league ID
         year: Season year
         week: Week number (scoringPeriodId)
-        session: Authenticated requests session (for cookies)
-        
+        session: Authenticated requests session (for headers and cookies)
+
     Returns:
         List of StatCorrectionRow objects
-        
-    Raises:
-        ESPNAPIError: If scraping fails
     """
-    url = f"https://fantasy.espn.com/football/statcorrections"
     params = {
         "leagueId": league_id,
         "scoringPeriodId": week,
     }
-    
-    corrections = []
-    
-    # Use Playwright to render JavaScript if available
-    if PLAYWRIGHT_AVAILABLE:
-        import warnings
-        warnings.filterwarnings("ignore", category=UserWarning)
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                
-                # Set cookies from session
-                if session.cookies:
-                    cookies_list: list[dict[str, str]] = []
-                    for cookie in session.cookies:
-                        cookies_list.append({
-                            "name": cookie.name,
-                            "value": cookie.value,
-                            "domain": cookie.domain or ".espn.com",
-                            "path": cookie.path or "/",
-                        })
-                    context.add_cookies(cookies_list)  # type: ignore[arg-type]
-                
-                page = context.new_page()
-                full_url = f"{url}?leagueId={league_id}&scoringPeriodId={week}"
-                page.goto(full_url, wait_until="networkidle", timeout=30000)
-                
-                # Wait for corrections table or data to load
-                try:
-                    # Wait for table or "No corrections" message
-                    page.wait_for_selector("table, [data-testid*='correction'], .stat-corrections, .no-corrections", timeout=10000)
-                except:
-                    pass  # Continue even if selector not found
-                
-                # Try to extract data from the rendered page
-                # Method 1: Look for table
-                table_html = page.query_selector("table")
-                if table_html:
-                    table_text = table_html.inner_html()
-                    soup = BeautifulSoup(table_text, "html.parser")
-                    rows = soup.find_all("tr")
-                    for row in rows[1:]:  # Skip header
-                        cells = row.find_all(["td", "th"])
-                        if len(cells) >= 3:
-                            cell_texts = [cell.get_text(strip=True) for cell in cells]
-                            if any(cell_texts):  # Has data
-                                player_name = cell_texts[0] if len(cell_texts) > 0 else None
-                                stat_name = cell_texts[1] if len(cell_texts) > 1 else None
-                                original_value = cell_texts[2] if len(cell_texts) > 2 else None
-                                corrected_value = cell_texts[3] if len(cell_texts) > 3 else None
-                                points_impact = cell_texts[4] if len(cell_texts) > 4 else None
-                                
-                                if player_name or stat_name:
-                                    corrections.append(
-                                        StatCorrectionRow(
-                                            season_year=year,
-                                            week=week,
-                                            player_id=None,
-                                            player_name=player_name,
-                                            team_id=None,
-                                            team_code=None,
-                                            stat_id=None,
-                                            stat_name=stat_name,
-                                            original_value=original_value,
-                                            corrected_value=corrected_value,
-                                            points_impact=points_impact,
-                                            correction_date=None,
-                                        )
-                                    )
-                
-                # Method 2: Try to get data from page's JavaScript context
-                try:
-                    # Execute JavaScript to get corrections data if stored in window/React state
-                    corrections_data = page.evaluate("""
-                        () => {
-                            // Try to find corrections in React state or window object
-                            if (window.__NEXT_DATA__ && window.__NEXT_DATA__.props && window.__NEXT_DATA__.props.pageProps) {
-                                const pageProps = window.__NEXT_DATA__.props.pageProps;
-                                if (pageProps.corrections || pageProps.statCorrections) {
-                                    return pageProps.corrections || pageProps.statCorrections;
-                                }
-                            }
-                            // Try to find in React component state
-                            const reactRoot = document.querySelector('#__next');
-                            if (reactRoot && reactRoot._reactInternalInstance) {
-                                // This is a simplified attempt - React internals vary
-                            }
-                            return null;
-                        }
-                    """)
-                    
-                    if corrections_data and isinstance(corrections_data, list):
-                        for item in corrections_data:
-                            if isinstance(item, dict):
-                                corrections.append(
-                                    StatCorrectionRow(
-                                        season_year=year,
-                                        week=week,
-                                        player_id=str(item.get("playerId", "")) if item.get("playerId") else None,
-                                        player_name=item.get("playerName") or item.get("name") or item.get("player"),
-                                        team_id=item.get("teamId"),
-                                        team_code=item.get("teamCode") or item.get("team"),
-                                        stat_id=str(item.get("statId", "")) if item.get("statId") else None,
-                                        stat_name=item.get("statName") or item.get("stat"),
-                                        original_value=str(item.get("originalValue", "")) if item.get("originalValue") is not None else None,
-                                        corrected_value=str(item.get("correctedValue", "")) if item.get("correctedValue") is not None else None,
-                                        points_impact=str(item.get("pointsImpact", "")) if item.get("pointsImpact") is not None else None,
-                                        correction_date=item.get("correctionDate") or item.get("date"),
-                                    )
-                                )
-                except Exception:
-                    pass  # JavaScript extraction failed, continue with HTML parsing
-                
-                browser.close()
-        except Exception as e:
-            # Fall back to simple HTML scraping if Playwright fails
-            pass
-    
-    # Fallback: Simple HTML scraping (won't work for React apps but try anyway)
-    if not corrections:
-        try:
-            response = session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Check for __NEXT_DATA__
-            next_data_script = soup.find("script", id="__NEXT_DATA__")
-            if next_data_script and next_data_script.string:
+    corrections: list[StatCorrectionRow] = []
+    try:
+        response = http_get(
+            STAT_CORRECTIONS_URL,
+            params=params,
+            headers=dict(session.headers),
+            cookies=session.cookies.get_dict(),
+            timeout=30,
+        )
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        # Check for __NEXT_DATA__
+        next_data_script = soup.find("script", id="__NEXT_DATA__")
+        if next_data_script and next_data_script.string:
+            try:
+                corrections_data = _find_corrections_in_data(json.loads(next_data_script.string))
+                for item in corrections_data or []:
+                    if isinstance(item, dict):
+                        corrections.append(_row_from_item(item, year, week))
+            except Exception:
+                pass
+    except (requests.RequestException, ESPNAPIError):
+        pass
+
+    return corrections
+
+
+async def _scrape_weeks(
+    league_id: int,
+    year: int,
+    weeks: list[int],
+    session: requests.Session,
+    pages: int = DEFAULT_SCRAPE_PAGES,
+) -> dict[int, list[StatCorrectionRow] | BaseException]:
+    """
+    Scrape several weeks concurrently over one shared browser.
+
+    Weeks the browser cannot read (or every week, when Playwright is missing
+    or Chromium fails to launch) fall back to the HTML scraper.
+
+    Returns:
+        Mapping of week to its rows, or to the exception raised for that week
+    """
+    async with AsyncExitStack() as stack:
+        browser: StatCorrectionsBrowser | None = None
+        if PLAYWRIGHT_AVAILABLE:
+            warnings.filterwarnings("ignore", category=UserWarning)
+            try:
+                browser = await stack.enter_async_context(
+                    StatCorrectionsBrowser(session, pages=min(pages, len(weeks)))
+                )
+            except Exception:
+                browser = None  # Fall back to simple HTML scraping
+
+        async def scrape(week: int) -> list[StatCorrectionRow]:
+            corrections: list[StatCorrectionRow] = []
+            if browser is not None:
                 try:
-                    import json
-                    next_data = json.loads(next_data_script.string)
-                    def find_corrections_in_data(obj, path=""):
-                        if isinstance(obj, dict):
-                            for key, value in obj.items():
-                                if "correction" in key.lower():
-                                    if isinstance(value, list):
-                                        return value
-                                if isinstance(value, (dict, list)):
-                                    result = find_corrections_in_data(value, f"{path}.{key}")
-                                    if result:
-                                        return result
-                        elif isinstance(obj, list):
-                            for item in obj:
-                                result = find_corrections_in_data(item, path)
-                                if result:
-                                    return result
-                        return None
-                    
-                    corrections_data = find_corrections_in_data(next_data)
-                    if corrections_data:
-                        for item in corrections_data:
-                            if isinstance(item, dict):
-                                corrections.append(
-                                    StatCorrectionRow(
-                                        season_year=year,
-                                        week=week,
-                                        player_id=str(item.get("playerId", "")) if item.get("playerId") else None,
-                                        player_name=item.get("playerName") or item.get("name"),
-                                        team_id=item.get("teamId"),
-                                        team_code=item.get("teamCode") or item.get("team"),
-                                        stat_id=str(item.get("statId", "")) if item.get("statId") else None,
-                                        stat_name=item.get("statName") or item.get("stat"),
-                                        original_value=str(item.get("originalValue", "")) if item.get("originalValue") is not None else None,
-                                        corrected_value=str(item.get("correctedValue", "")) if item.get("correctedValue") is not None else None,
-                                        points_impact=str(item.get("pointsImpact", "")) if item.get("pointsImpact") is not None else None,
-                                        correction_date=item.get("correctionDate") or item.get("date"),
-                                    )
-                                )
+                    corrections = await browser.scrape(league_id, year, week)
                 except Exception:
-                    pass
-        except requests.RequestException:
-            pass
-    
-    return corrections
+                    corrections = []
+            if not corrections:
+                corrections = await asyncio.to_thread(
+                    _scrape_stat_corrections_html, league_id, year, week, session
+                )
+            return corrections
+
+        results = await asyncio.gather(*(scrape(week) for week in weeks), return_exceptions=True)
+    return dict(zip(weeks, results))
+
+
+def _diff_row(
+    year: int,
+    week: int,
+    team_code: str,
+    stat_id: str,
+    stat_name: str,
+    original: str,
+    corrected: str,
+    impact: float,
+    player_name: str | None = None,
+    correction_date: str | None = None,
+) -> StatCorrectionRow:
+    return StatCorrectionRow(
+        season_year=year,
+        week=week,
+        player_id=None,
+        player_name=player_name,
+        team_id=None,
+        team_code=team_code,
+        stat_id=stat_id,
+        stat_name=stat_name,
+        original_value=original,
+        corrected_value=corrected,
+        points_impact=f"{impact:+.2f}",
+        correction_date=correction_date,
+    )
+
+
+def _matchup_results(
+    totals: dict[tuple[int, int, str], float],
+) -> dict[tuple[int, int, str], str]:
+    """Map (week, matchup, team_code) to W/L/T from the matchup's team totals."""
+    by_matchup: dict[tuple[int, int], list[tuple[str, float]]] = {}
+    for (week, matchup, team_code), total in totals.items():
+        by_matchup.setdefault((week, matchup), []).append((team_code, total))
+    results: dict[tuple[int, int, str], str] = {}
+    for (week, matchup), teams in by_matchup.items():
+        if len(teams) != 2:
+            continue
+        (team_a, total_a), (team_b, total_b) = teams
+        margin = round(total_a - total_b, 2)
+        result_a = "T" if margin == 0 else ("W" if margin > 0 else "L")
+        result_b = {"W": "L", "L": "W", "T": "T"}[result_a]
+        results[(week, matchup, team_a)] = result_a
+        results[(week, matchup, team_b)] = result_b
+    return results
+
+
+def diff_boxscore_points(
+    stored: pd.DataFrame,
+    current: pd.DataFrame,
+    year: int,
+    correction_date: str | None = None,
+) -> list[StatCorrectionRow]:
+    """
+    Compare stored boxscore rows with a fresh pull and describe every change.
+
+    Player rows are keyed by (week, team_code, player_name); placeholders are
+    ignored. A row is emitted for each player whose ``rs_actual_pf`` moved
+    (stat_id ``fantasy_points``), for each team whose starter total moved
+    (``team_total``), and for each team whose matchup result flipped
+    (``matchup_result``, values W/L/T).
+
+    Args:
+        stored: Rows from a previously exported boxscores.csv
+        current: Rows rebuilt from ESPN for the same weeks
+        year: Season year
+        correction_date: Date stamped on every emitted row
+
+    Returns:
+        StatCorrectionRows ordered by week, team, then player/team/result
+    """
+    if stored.empty or current.empty:
+        return []
+
+    def players(df: pd.DataFrame) -> dict[tuple[int, str, str], float]:
+        real = df[df["is_placeholder"] != "Yes"]
+        return {
+            (int(week), str(team), str(name)): float(points)
+            for week, team, name, points in zip(
+                real["week"], real["team_code"], real["player_name"], real["rs_actual_pf"]
+            )
+        }
+
+    def team_totals(df: pd.DataFrame) -> dict[tuple[int, int, str], float]:
+        totals = df.groupby(["week", "matchup", "team_code"])["team_actual_total"].first()
+        return {
+            (int(week), int(matchup), str(team)): float(total)
+            for (week, matchup, team), total in totals.items()
+        }
+
+    # (week, team_code, kind rank) keeps player rows ahead of their team's summary rows
+    found: list[tuple[tuple[int, str, int], StatCorrectionRow]] = []
+
+    before_players = players(stored)
+    for player_key, points in players(current).items():
+        original = before_players.get(player_key)
+        if original is None or abs(points - original) < POINTS_TOLERANCE:
+            continue
+        week, team_code, player_name = player_key
+        found.append(
+            (
+                (week, team_code, 0),
+                _diff_row(
+                    year,
+                    week,
+                    team_code,
+                    DIFF_PLAYER_POINTS,
+                    "Fantasy Points",
+                    f"{original:.2f}",
+                    f"{points:.2f}",
+                    points - original,
+                    player_name=player_name,
+                    correction_date=correction_date,
+                ),
+            )
+        )
+
+    before_totals = team_totals(stored)
+    after_totals = team_totals(current)
+    for total_key, total in after_totals.items():
+        original = before_totals.get(total_key)
+        if original is None or abs(total - original) < POINTS_TOLERANCE:
+            continue
+        week, _matchup, team_code = total_key
+        found.append(
+            (
+                (week, team_code, 1),
+                _diff_row(
+                    year,
+                    week,
+                    team_code,
+                    DIFF_TEAM_TOTAL,
+                    "Team Total",
+                    f"{original:.2f}",
+                    f"{total:.2f}",
+                    total - original,
+                    correction_date=correction_date,
+                ),
+            )
+        )
+
+    before_results = _matchup_results(before_totals)
+    for total_key, result in _matchup_results(after_totals).items():
+        original_result = before_results.get(total_key)
+        if original_result is None or original_result == result:
+            continue
+        week, _matchup, team_code = total_key
+        found.append(
+            (
+                (week, team_code, 2),
+                _diff_row(
+                    year,
+                    week,
+                    team_code,
+                    DIFF_MATCHUP_RESULT,
+                    "Matchup Result",
+                    original_result,
+                    result,
+                    after_totals[total_key] - before_totals[total_key],
+                    correction_date=correction_date,
+                ),
+            )
+        )
+
+    found.sort(key=lambda item: item[0])
+    return [row for _key, row in found]
+
+
+def fetch_current_boxscores(
+    league_id: int,
+    year: int,
+    repo_root: Path,
+    credentials: ESPNCredentials | None = None,
+    start_week: int = 1,
+    end_week: int = 18,
+    workers: int = DEFAULT_SCRAPE_PAGES,
+) -> pd.DataFrame:
+    """
+    Re-pull completed weeks through the raw engine as boxscores.csv rows.
+
+    Weeks that have not finished yet are skipped so in-progress scoring is
+    never reported as a correction.
+    """
+    from ..live.scores import LiveScoreClient, LiveScoringError
+    from .export import rows_for_weeks
+    from .raw_boxscores import SeasonStatus, iter_weeks_raw
+
+    authenticated = credentials is not None and credentials.is_authenticated
+    client = LiveScoreClient(
+        league_id=league_id,
+        season=year,
+        espn_s2=credentials.espn_s2 if authenticated and credentials else None,
+        swid=credentials.swid if authenticated and credentials else None,
+    )
+    try:
+        status = SeasonStatus.from_settings(client.fetch_settings(), year)
+        end_week = min(end_week, status.last_completed_week)
+    except LiveScoringError as e:
+        raise ESPNAPIError(f"Failed to connect to ESPN: {e}") from e
+    if end_week < start_week:
+        return pd.DataFrame()
+
+    aliases = get_alias_resolver(alias_mapping_path(repo_root))
+    canon_meta = load_canonical_meta(repo_root)
+    weeks = iter_weeks_raw(client, year, start_week, end_week, workers=workers)
+    rows = rows_for_weeks(weeks, year, aliases, canon_meta)
+    return pd.DataFrame([asdict(row) for row in rows])
+
+
+def diff_stat_corrections(
+    league_id: int,
+    year: int,
+    boxscores_path: str | Path,
+    repo_root: Path,
+    credentials: ESPNCredentials | None = None,
+    start_week: int = 1,
+    end_week: int = 18,
+    workers: int = DEFAULT_SCRAPE_PAGES,
+) -> list[StatCorrectionRow]:
+    """
+    Detect stat corrections by diffing stored boxscores against ESPN.
+
+    Args:
+        league_id: ESPN league ID
+        year: Season year
+        boxscores_path: Previously exported boxscores.csv for the season
+        repo_root: Repository root (for team alias mappings)
+        credentials: Optional ESPN credentials (private leagues)
+        start_week: First week to compare
+        end_week: Last week to compare (clamped to the last completed week)
+        workers: Weeks fetched concurrently
+
+    Returns:
+        StatCorrectionRows for every changed player, team total and result
+
+    Raises:
+        FileNotFoundError: If the stored boxscores file does not exist
+        ESPNAPIError: If ESPN cannot be reached
+    """
+    boxscores_path = Path(boxscores_path)
+    if not table_exists(boxscores_path):
+        raise FileNotFoundError(f"Stored boxscores not found: {boxscores_path}")
+    stored = read_table(boxscores_path)
+    stored = stored[(stored["week"] >= start_week) & (stored["week"] <= end_week)]
+
+    current = fetch_current_boxscores(
+        league_id, year, repo_root, credentials, start_week, end_week, workers=workers
+    )
+    return diff_boxscore_points(
+        stored, current, year, correction_date=datetime.now().date().isoformat()
+    )
 
 
 def export_stat_corrections(
@@ -273,54 +673,85 @@ def export_stat_corrections(
     credentials: ESPNCredentials | None = None,
     start_week: int = 1,
     end_week: int = 18,
+    pages: int = DEFAULT_SCRAPE_PAGES,
+    mode: Literal["scrape", "diff"] = "scrape",
+    boxscores_path: str | Path | None = None,
+    repo_root: Path | None = None,
 ) -> Path:
     """
-    Export stat corrections for a season by scraping ESPN web pages.
-    
+    Export stat corrections for a season.
+
+    ``scrape`` renders ESPN's stat-corrections pages, sharing one browser
+    across the run with ``pages`` weeks rendered concurrently. ``diff``
+    re-pulls completed weeks through the raw API and compares player points
+    with the stored boxscores.csv (see :func:`diff_boxscore_points`); it does
+    not need a browser or, for public leagues, credentials.
+
     Args:
         league_id: ESPN league ID
         year: Season year
         output_path: Output CSV file path
-        credentials: ESPN authentication credentials (required)
+        credentials: ESPN authentication credentials (required for scrape)
         start_week: First week to extract (default: 1)
         end_week: Last week to extract (default: 18)
-        
+        pages: Browser tabs (scrape) or weeks fetched (diff) concurrently
+        mode: "scrape" or "diff"
+        boxscores_path: Stored boxscores for diff mode
+            (default: data/seasons/<year>/boxscores.csv)
+        repo_root: Repository root path (for diff mode's team mappings)
+
     Returns:
         Path to written CSV file
-        
+
     Raises:
         ESPNAPIError: If scraping fails or credentials missing
     """
-    if not credentials or not credentials.is_authenticated:
+    if mode not in ("scrape", "diff"):
+        raise ValueError(f"Unknown stat corrections mode: {mode}")
+    if mode == "scrape" and (not credentials or not credentials.is_authenticated):
         raise ESPNAPIError(
             "Stat corrections require authentication. Provide ESPN_S2 and SWID credentials."
         )
-    
+
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    session = _make_session(credentials)
-    
+
     all_corrections = []
-    
-    # Iterate through all weeks
-    for week in range(start_week, end_week + 1):
-        try:
-            week_corrections = _scrape_stat_corrections_page(
-                league_id=league_id,
-                year=year,
-                week=week,
-                session=session,
-            )
-            all_corrections.extend(week_corrections)
-        except ESPNAPIError:
-            # Continue to next week if one fails
-            continue
-        except Exception as e:
-            # Log but continue
-            print(f"Warning: Failed to scrape week {week}: {e}")
-            continue
-    
+    if mode == "diff":
+        if repo_root is None:
+            # Find repo root by looking for pyproject.toml
+            current = Path.cwd()
+            for parent in [current, *current.parents]:
+                if (parent / "pyproject.toml").exists():
+                    repo_root = parent
+                    break
+            if repo_root is None:
+                raise ValueError("Could not find repository root")
+        all_corrections = diff_stat_corrections(
+            league_id,
+            year,
+            boxscores_path or repo_root / "data" / "seasons" / str(year) / "boxscores.csv",
+            repo_root,
+            credentials=credentials,
+            start_week=start_week,
+            end_week=end_week,
+            workers=pages,
+        )
+    else:
+        session = _make_session(credentials)
+        weeks = list(range(start_week, end_week + 1))
+        results = asyncio.run(_scrape_weeks(league_id, year, weeks, session, pages=pages))
+        for week in weeks:
+            week_result = results[week]
+            if isinstance(week_result, ESPNAPIError):
+                # Continue to next week if one fails
+                continue
+            if isinstance(week_result, BaseException):
+                # Log but continue
+                print(f"Warning: Failed to scrape week {week}: {week_result}")
+                continue
+            all_corrections.extend(week_result)
+
     # Write to CSV
     if not all_corrections:
         # Create empty file with headers
@@ -0,0 +1,441 @@
+"""Embedded SQLite store built from ``data/seasons/*``.
+
+Every season dataset (boxscores, teamweek, h2h, draft, transactions, stat
+corrections) is loaded into one table per dataset, keyed by
+``season_year``, alongside the team/owner registry. Cross-season questions
+("every start Josh Allen made", "all PCX weeks since 2019") become indexed
+lookups instead of globbing and concatenating CSVs.
+
+The store is a derived cache: ``build_store`` reloads only the season files
+whose mtime changed since the last build, and a schema version bump
+rebuilds it from scratch. Column names follow the source files except that
+a trailing ``?`` is dropped (``is_co_owned?`` -> ``is_co_owned``),
+``draft.year`` is stored as ``season_year`` and files without a season
+column (``h2h.csv``) get one from their season directory.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Sequence
+
+import pandas as pd  # type: ignore[import-untyped]
+
+from .registry import REGISTRY
+from .schemas import (
+    BOXSCORE_SCHEMA,
+    DRAFT_SCHEMA,
+    H2H_SCHEMA,
+    STAT_CORRECTION_SCHEMA,
+    TEAMWEEK_SCHEMA,
+    TRANSACTION_SCHEMA,
+    coerce_value,
+)
+from .tables import read_table, resolve_table, table_exists
+
+# Bump when a table definition changes; older stores are rebuilt
+STORE_VERSION = 2
+STORE_FILENAME = "season_store.sqlite3"
+
+SQL_TYPES = {
+    "int32": "INTEGER",
+    "int64": "INTEGER",
+    "float64": "REAL",
+    "string": "TEXT",
+    "bool_": "INTEGER",
+}
+
+REGISTRY_SCHEMA: dict[str, str] = {
+    "season_year": "int32",
+    "team_code": "string",
+    "team_full_name": "string",
+    "is_co_owned": "bool_",
+    "owner_code_1": "string",
+    "owner_code_2": "string",
+}
+
+
+@dataclass(frozen=True)
+class StoreTable:
+    """One season dataset and how it maps into the store."""
+
+    name: str
+    # Source file relative to data/seasons/<year>/ (Parquet sibling preferred)
+    source: str
+    schema: dict[str, str]
+    indexes: tuple[tuple[str, ...], ...]
+    renames: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def columns(self) -> list[str]:
+        """SQL column names, in source column order."""
+        return [sql_column(self.renames.get(name, name)) for name in self.schema]
+
+
+STORE_TABLES: tuple[StoreTable, ...] = (
+    StoreTable(
+        "boxscores",
+        "boxscores.csv",
+        BOXSCORE_SCHEMA,
+        indexes=(("season_year", "week", "team_code"), ("player_name",)),
+    ),
+    StoreTable(
+        "teamweek",
+        "reports/teamweek_unified.csv",
+        TEAMWEEK_SCHEMA,
+        indexes=(("season_year", "week", "team_code"), ("opponent_code",)),
+    ),
+    StoreTable(
+        "h2h",
+        "h2h.csv",
+        {"season_year": "int32", **H2H_SCHEMA},
+        indexes=(("season_year", "week"), ("home_team",), ("away_team",)),
+    ),
+    StoreTable(
+        "draft",
+        "draft.csv",
+        DRAFT_SCHEMA,
+        indexes=(("season_year", "team_abbrev"), ("player_id",), ("player_name",)),
+        renames={"year": "season_year"},
+    ),
+    StoreTable(
+        "transactions",
+        "transactions.csv",
+        TRANSACTION_SCHEMA,
+        indexes=(("season_year", "team_code"), ("player_id",), ("player_name",)),
+    ),
+    StoreTable(
+        "stat_corrections",
+        "stat_corrections.csv",
+        {**STAT_CORRECTION_SCHEMA, "rffl_team_code": "string"},
+        indexes=(("season_year", "week", "team_code"), ("player_name",)),
+    ),
+)
+
+REGISTRY_INDEXES: tuple[tuple[str, ...], ...] = (
+    ("season_year", "team_code"),
+    ("owner_code_1",),
+    ("owner_code_2",),
+)
+
+# (season_year, week, team_code, score) per team-week, in weekly_scores() preference order
+WEEKLY_SCORE_SOURCES: tuple[str, ...] = (
+    "SELECT season_year, week, team_code, team_actual_total AS score FROM teamweek",
+    "SELECT DISTINCT season_year, week, team_code, team_actual_total AS score FROM boxscores",
+    "SELECT season_year, week, home_team AS team_code, home_score AS score FROM h2h "
+    "UNION ALL SELECT season_year, week, away_team, away_score FROM h2h",
+)
+
+
+def sql_column(name: str) -> str:
+    """Return the store column name for a source column."""
+    return name.rstrip("?")
+
+
+def default_store_path(repo_root: str | Path) -> Path:
+    """Return the store location for a repository checkout."""
+    return Path(repo_root) / ".cache" / STORE_FILENAME
+
+
+def _create_table(
+    conn: sqlite3.Connection,
+    name: str,
+    columns: Sequence[str],
+    types: Sequence[str],
+    indexes: Iterable[tuple[str, ...]],
+) -> None:
+    body = ", ".join(f"{col} {SQL_TYPES[t]}" for col, t in zip(columns, types))
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {name} ({body})")
+    for index in indexes:
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{name}_{'_'.join(index)} "
+            f"ON {name} ({', '.join(index)})"
+        )
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != STORE_VERSION:
+        names = [
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        ]
+        for name in names:
+            conn.execute(f"DROP TABLE {name}")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sources (
+            table_name TEXT NOT NULL,
+            season_year INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            mtime REAL NOT NULL,
+            row_count INTEGER NOT NULL,
+            PRIMARY KEY (table_name, season_year)
+        )
+        """
+    )
+    for table in STORE_TABLES:
+        _create_table(conn, table.name, table.columns, list(table.schema.values()), table.indexes)
+    _create_table(
+        conn, "registry", list(REGISTRY_SCHEMA), list(REGISTRY_SCHEMA.values()), REGISTRY_INDEXES
+    )
+    conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+
+def _frame_rows(df: pd.DataFrame, schema: dict[str, str]) -> Iterator[tuple[Any, ...]]:
+    types = list(schema.values())
+    for values in df.reindex(columns=list(schema)).itertuples(index=False, name=None):
+        yield tuple(coerce_value(value, type_name) for value, type_name in zip(values, types))
+
+
+def _season_dirs(repo_root: Path, seasons: Iterable[int] | None) -> list[tuple[int, Path]]:
+    wanted = set(seasons) if seasons is not None else None
+    found = []
+    for season_dir in (repo_root / "data" / "seasons").glob("*"):
+        if not season_dir.is_dir() or not season_dir.name.isdigit():
+            continue
+        year = int(season_dir.name)
+        if wanted is None or year in wanted:
+            found.append((year, season_dir))
+    return sorted(found)
+
+
+def _load_registry(conn: sqlite3.Connection) -> int:
+    conn.execute("DELETE FROM registry")
+    types = list(REGISTRY_SCHEMA.values())
+    rows = [
+        tuple(
+            coerce_value(getattr(team, name), type_name)
+            for name, type_name in zip(REGISTRY_SCHEMA, types)
+        )
+        for team in REGISTRY
+    ]
+    placeholders = ", ".join("?" * len(REGISTRY_SCHEMA))
+    conn.executemany(f"INSERT INTO registry VALUES ({placeholders})", rows)
+    return len(rows)
+
+
+def build_store(
+    repo_root: str | Path,
+    db_path: str | Path | None = None,
+    seasons: Iterable[int] | None = None,
+    force: bool = False,
+) -> dict[str, int]:
+    """
+    Create or refresh the season store from ``data/seasons/*``.
+
+    Args:
+        repo_root: Repository root containing ``data/seasons``
+        db_path: Store file (defaults to ``.cache/season_store.sqlite3``)
+        seasons: Only refresh these seasons (default: every season directory)
+        force: Reload every file even if its mtime is unchanged
+
+    Returns:
+        Rows loaded per table in this run (tables with nothing to reload are 0)
+    """
+    repo_root = Path(repo_root)
+    db_path = Path(db_path) if db_path else default_store_path(repo_root)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    loaded = {table.name: 0 for table in STORE_TABLES}
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            _create_schema(conn)
+            recorded = {
+                (name, year): (path, mtime)
+                for name, year, path, mtime in conn.execute(
+                    "SELECT table_name, season_year, path, mtime FROM sources"
+                )
+            }
+            for year, season_dir in _season_dirs(repo_root, seasons):
+                for table in STORE_TABLES:
+                    source = season_dir / table.source
+                    if not table_exists(source):
+                        if (table.name, year) in recorded:
+                            conn.execute(
+                                f"DELETE FROM {table.name} WHERE season_year = ?", (year,)
+                            )
+                            conn.execute(
+                                "DELETE FROM sources WHERE table_name = ? AND season_year = ?",
+                                (table.name, year),
+                            )
+                        continue
+
+                    resolved = resolve_table(source)
+                    mtime = resolved.stat().st_mtime
+                    if not force and recorded.get((table.name, year)) == (str(resolved), mtime):
+                        continue
+
+                    frame = read_table(source)
+                    if "season_year" in table.schema and "season_year" not in frame.columns:
+                        frame = frame.assign(season_year=year)
+                    rows = list(_frame_rows(frame, table.schema))
+                    placeholders = ", ".join("?" * len(table.schema))
+                    conn.execute(f"DELETE FROM {table.name} WHERE season_year = ?", (year,))
+                    conn.executemany(f"INSERT INTO {table.name} VALUES ({placeholders})", rows)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                        (table.name, year, str(resolved), mtime, len(rows)),
+                    )
+                    loaded[table.name] += len(rows)
+            loaded["registry"] = _load_registry(conn)
+    finally:
+        conn.close()
+    return loaded
+
+
+class SeasonStore:
+    """Read-only access to a built season store."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"Season store not found: {self.path}. Run 'rffl query build' first"
+            )
+        self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def __enter__(self) -> "SeasonStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        """Run a read-only SQL query and return the result as a DataFrame."""
+        return pd.read_sql_query(sql, self._conn, params=list(params))
+
+    def _select(self, table: str, order_by: str, **filters: Any) -> pd.DataFrame:
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.query(f"SELECT * FROM {table}{where} ORDER BY {order_by}", params)
+
+    def seasons(self) -> list[int]:
+        """Return every season with at least one dataset loaded."""
+        rows = self._conn.execute(
+            "SELECT DISTINCT season_year FROM sources ORDER BY season_year"
+        ).fetchall()
+        return [int(row[0]) for row in rows]
+
+    def boxscores(
+        self,
+        season: int | None = None,
+        week: int | None = None,
+        team_code: str | None = None,
+    ) -> pd.DataFrame:
+        """Player-level boxscore rows, filtered by any of season/week/team."""
+        return self._select(
+            "boxscores",
+            "season_year, week, matchup, team_code",
+            season_year=season,
+            week=week,
+            team_code=team_code,
+        )
+
+    def team_weeks(
+        self,
+        season: int | None = None,
+        week: int | None = None,
+        team_code: str | None = None,
+    ) -> pd.DataFrame:
+        """Team-week results (teamweek_unified rows)."""
+        return self._select(
+            "teamweek",
+            "season_year, week, matchup, team_code",
+            season_year=season,
+            week=week,
+            team_code=team_code,
+        )
+
+    def player_history(self, player_name: str, season: int | None = None) -> pd.DataFrame:
+        """Every boxscore row for one player across seasons."""
+        return self._select(
+            "boxscores",
+            "season_year, week",
+            player_name=player_name,
+            season_year=season,
+        )
+
+    def draft(self, season: int | None = None, team_code: str | None = None) -> pd.DataFrame:
+        """Draft picks, filtered by season and drafting team."""
+        return self._select(
+            "draft", "season_year, round, round_pick", season_year=season, team_abbrev=team_code
+        )
+
+    def transactions(
+        self,
+        season: int | None = None,
+        team_code: str | None = None,
+        player_name: str | None = None,
+    ) -> pd.DataFrame:
+        """Transactions, filtered by season, team and player."""
+        return self._select(
+            "transactions",
+            "season_year, date",
+            season_year=season,
+            team_code=team_code,
+            player_name=player_name,
+        )
+
+    def stat_corrections(
+        self,
+        season: int | None = None,
+        week: int | None = None,
+        team_code: str | None = None,
+    ) -> pd.DataFrame:
+        """Stat-correction rows, filtered by season/week/team."""
+        return self._select(
+            "stat_corrections",
+            "season_year, week",
+            season_year=season,
+            week=week,
+            team_code=team_code,
+        )
+
+    def registry(
+        self,
+        season: int | None = None,
+        team_code: str | None = None,
+    ) -> pd.DataFrame:
+        """Registry team-seasons, filtered by season and team."""
+        return self._select(
+            "registry", "season_year, team_code", season_year=season, team_code=team_code
+        )
+
+    def h2h(self, season: int | None = None, week: int | None = None) -> pd.DataFrame:
+        """Head-to-head matchup results (h2h.csv rows), filtered by season/week."""
+        return self._select("h2h", "season_year, week, matchup", season_year=season, week=week)
+
+    def weekly_scores(self, season: int, max_week: int) -> dict[int, dict[str, float]]:
+        """
+        Return {week: {team_code: team_actual_total}} in the KORM loader shape.
+
+        Scores come from teamweek, else boxscores, else h2h (the only source
+        for seasons before 2019), whichever has rows for ``season`` first.
+        """
+        rows: list[tuple[Any, ...]] = []
+        for source in WEEKLY_SCORE_SOURCES:
+            rows = self._conn.execute(
+                f"SELECT week, team_code, score FROM ({source}) "
+                "WHERE season_year = ? AND week <= ? ORDER BY week, team_code",
+                (season, max_week),
+            ).fetchall()
+            if rows:
+                break
+        weekly: dict[int, dict[str, float]] = {}
+        for week, team_code, score in rows:
+            weekly.setdefault(int(week), {})[team_code] = float(score)
+        return weekly
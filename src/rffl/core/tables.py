@@ -0,0 +1,95 @@
+"""Reading and writing season tables as CSV or Parquet.
+
+Every dataset under ``data/seasons/<year>/`` can exist as CSV, Parquet or
+both. Readers ask for the CSV path they always used; ``read_table`` loads
+the sibling ``.parquet`` instead when it exists, is at least as new as the
+CSV, and pyarrow is installed. Parquet files carry the explicit types from
+``core.schemas`` so nothing is re-inferred on load.
+"""
+
+from __future__ import annotations
+
+import csv
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Literal
+
+import pandas as pd  # type: ignore[import-untyped]
+
+from .writers import open_row_writer
+
+TableFormat = Literal["csv", "parquet"]
+TABLE_FORMATS: tuple[str, ...] = ("csv", "parquet")
+
+
+def parquet_available() -> bool:
+    """Return True if pyarrow is installed."""
+    return find_spec("pyarrow") is not None
+
+
+def columnar_path(path: str | Path) -> Path:
+    """Return the Parquet sibling of a table path."""
+    return Path(path).with_suffix(".parquet")
+
+
+def with_format(path: str | Path, fmt: TableFormat) -> Path:
+    """Return ``path`` with the suffix for ``fmt``."""
+    return Path(path).with_suffix(f".{fmt}")
+
+
+def resolve_table(path: str | Path) -> Path:
+    """
+    Return the file ``read_table`` would load for ``path``.
+
+    Prefers the Parquet sibling when it exists, pyarrow is available and it
+    is not older than the CSV; otherwise returns ``path`` unchanged.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        return path
+    parquet = columnar_path(path)
+    if not parquet.exists() or not parquet_available():
+        return path
+    if path.exists() and parquet.stat().st_mtime < path.stat().st_mtime:
+        return path
+    return parquet
+
+
+def table_exists(path: str | Path) -> bool:
+    """Return True if ``path`` or its columnar sibling exists."""
+    return resolve_table(path).exists()
+
+
+def read_table(path: str | Path, **csv_kwargs: Any) -> pd.DataFrame:
+    """
+    Load a season table, preferring its Parquet sibling.
+
+    Args:
+        path: Table path (usually the ``.csv`` name)
+        **csv_kwargs: Passed to ``pd.read_csv`` when the CSV is read
+
+    Raises:
+        FileNotFoundError: If neither file exists
+    """
+    resolved = resolve_table(path)
+    if resolved.suffix.lower() == ".parquet":
+        return pd.read_parquet(resolved)
+    return pd.read_csv(resolved, **csv_kwargs)
+
+
+def write_frame(df: pd.DataFrame, path: str | Path, schema: dict[str, str]) -> Path:
+    """
+    Write a DataFrame as CSV or, for ``.parquet`` paths, with ``schema`` types.
+
+    CSV output is exactly ``df.to_csv(index=False)``.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() != ".parquet":
+        df.to_csv(path, index=False, quoting=csv.QUOTE_MINIMAL)
+        return path
+    columns = list(schema)
+    with open_row_writer(path, columns, schema=schema) as writer:
+        for values in df.reindex(columns=columns).itertuples(index=False, name=None):
+            writer.write(values)
+    return path
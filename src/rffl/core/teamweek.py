@@ -4,12 +4,32 @@ This module provides functionality to transform player-level boxscore data
 into team-week aggregated data suitable for analysis and KORM processing.
 """
 
-import csv
 from pathlib import Path
-from typing import Any
+from typing import Iterable
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 
+from .schemas import TEAMWEEK_SCHEMA
+from .tables import TableFormat, read_table, table_exists, with_format, write_frame
+
+REQUIRED_COLUMNS = [
+    "season_year", "week", "matchup", "team_code",
+    "is_co_owned?", "team_owner_1", "team_owner_2",
+    "team_projected_total", "team_actual_total",
+]
+MATCHUP_KEYS = ["season_year", "week", "matchup"]
+TEAM_WEEK_KEYS = [*MATCHUP_KEYS, "team_code"]
+
+# Team-side column -> opponent-side column
+OPPONENT_COLUMNS = {
+    "team_code": "opponent_code",
+    "is_co_owned?": "opp_is_co_owned?",
+    "team_owner_1": "opp_owner_1",
+    "team_owner_2": "opp_owner_2",
+    "team_actual_total": "opp_actual_total",
+}
+
 
 def generate_teamweek_unified(
     boxscores_path: str | Path,
@@ -19,11 +39,13 @@ def generate_teamweek_unified(
     Generate teamweek_unified.csv from boxscores.csv.
 
     Transforms player-level boxscore data into team-week aggregated data,
-    matching opponents and calculating win/loss results.
+    matching opponents and calculating win/loss results (see ``build_teamweek``).
 
     Args:
-        boxscores_path: Path to boxscores.csv file
-        output_path: Optional output path for CSV. If None, returns DataFrame only.
+        boxscores_path: Path to boxscores.csv file (boxscores.parquet is read
+            instead when present, see ``tables.read_table``)
+        output_path: Optional output path (``.parquet`` writes Parquet, otherwise
+            CSV). If None, returns DataFrame only.
 
     Returns:
         DataFrame with team-week unified data
@@ -33,110 +55,79 @@ def generate_teamweek_unified(
         ValueError: If boxscores data is invalid
     """
     boxscores_path = Path(boxscores_path)
-    if not boxscores_path.exists():
+    if not table_exists(boxscores_path):
         raise FileNotFoundError(f"Boxscores file not found: {boxscores_path}")
 
     # Read boxscores
-    df = pd.read_csv(boxscores_path)
-
-    # Validate required columns
-    required_cols = [
-        "season_year", "week", "matchup", "team_code",
-        "is_co_owned?", "team_owner_1", "team_owner_2",
-        "team_projected_total", "team_actual_total"
-    ]
-    missing = [c for c in required_cols if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {missing}")
+    df = read_table(boxscores_path)
 
-    # Group by team-week and take first row (team totals are duplicated per player)
-    team_week = df.groupby(
-        ["season_year", "week", "matchup", "team_code"],
-        as_index=False
-    ).agg({
-        "is_co_owned?": "first",
-        "team_owner_1": "first",
-        "team_owner_2": "first",
-        "team_projected_total": "first",
-        "team_actual_total": "first",
-    })
-
-    # Create matchup pairs to find opponents
-    rows = []
-    for (season, week, matchup), group in team_week.groupby(
-        ["season_year", "week", "matchup"]
-    ):
-        teams = group.to_dict("records")
-        if len(teams) != 2:
-            # Skip incomplete matchups (e.g., bye weeks or data issues)
-            continue
+    result = build_teamweek(df)
 
-        team_a, team_b = teams[0], teams[1]
+    # Write output if path provided
+    if output_path:
+        write_frame(result, output_path, TEAMWEEK_SCHEMA)
 
-        # Create row for team_a
-        rows.append(_create_unified_row(team_a, team_b, season, week, matchup))
-        # Create row for team_b
-        rows.append(_create_unified_row(team_b, team_a, season, week, matchup))
+    return result
 
-    # Create output DataFrame
-    result = pd.DataFrame(rows)
 
-    # Sort by season, week, matchup, team_code
-    result = result.sort_values(
-        ["season_year", "week", "matchup", "team_code"]
-    ).reset_index(drop=True)
+def build_teamweek(boxscores: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build team-week unified rows from boxscore rows (any number of seasons).
 
-    # Write to CSV if output path provided
-    if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        result.to_csv(output_path, index=False, quoting=csv.QUOTE_MINIMAL)
+    Team totals are repeated on every player row, so each team-week collapses
+    to its first values. Teams are then paired with their opponent by a
+    self-merge on (season_year, week, matchup); matchups without exactly two
+    teams (byes, data issues) are dropped.
 
-    return result
+    Args:
+        boxscores: Player-level boxscore rows
 
+    Returns:
+        DataFrame with TEAMWEEK_SCHEMA columns, sorted by season, week,
+        matchup and team_code
 
-def _create_unified_row(
-    team: dict[str, Any],
-    opponent: dict[str, Any],
-    season: int,
-    week: int,
-    matchup: int,
-) -> dict[str, Any]:
-    """Create a unified row for one team in a matchup."""
-    team_score = team["team_actual_total"]
-    opp_score = opponent["team_actual_total"]
-    margin = round(team_score - opp_score, 2)
-
-    if team_score > opp_score:
-        result = "W"
-    elif team_score < opp_score:
-        result = "L"
-    else:
-        result = "T"
-
-    return {
-        "season_year": season,
-        "week": week,
-        "matchup": matchup,
-        "team_code": team["team_code"],
-        "is_co_owned?": team["is_co_owned?"],
-        "team_owner_1": team["team_owner_1"],
-        "team_owner_2": team["team_owner_2"] if pd.notna(team["team_owner_2"]) else "",
-        "opponent_code": opponent["team_code"],
-        "opp_is_co_owned?": opponent["is_co_owned?"],
-        "opp_owner_1": opponent["team_owner_1"],
-        "opp_owner_2": opponent["team_owner_2"] if pd.notna(opponent["team_owner_2"]) else "",
-        "team_projected_total": team["team_projected_total"],
-        "team_actual_total": team_score,
-        "opp_actual_total": opp_score,
-        "result": result,
-        "margin": margin,
-    }
+    Raises:
+        ValueError: If boxscores data is invalid
+    """
+    missing = [c for c in REQUIRED_COLUMNS if c not in boxscores.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    # Group by team-week and take first row (team totals are duplicated per player)
+    team_week = boxscores.groupby(TEAM_WEEK_KEYS, as_index=False).agg(
+        {
+            "is_co_owned?": "first",
+            "team_owner_1": "first",
+            "team_owner_2": "first",
+            "team_projected_total": "first",
+            "team_actual_total": "first",
+        }
+    )
+    team_week["team_owner_2"] = team_week["team_owner_2"].fillna("")
+
+    teams_per_matchup = team_week.groupby(MATCHUP_KEYS)["team_code"].transform("size")
+    team_week = team_week[teams_per_matchup == 2]
+
+    opponents = team_week[[*MATCHUP_KEYS, *OPPONENT_COLUMNS]].rename(columns=OPPONENT_COLUMNS)
+    result = team_week.merge(opponents, on=MATCHUP_KEYS)
+    result = result[result["team_code"] != result["opponent_code"]]
+
+    team_score = result["team_actual_total"]
+    opp_score = result["opp_actual_total"]
+    result["margin"] = (team_score - opp_score).round(2)
+    result["result"] = np.select([team_score > opp_score, team_score < opp_score], ["W", "L"], "T")
+
+    return (
+        result[list(TEAMWEEK_SCHEMA)]
+        .sort_values(TEAM_WEEK_KEYS)
+        .reset_index(drop=True)
+    )
 
 
 def generate_teamweek_for_season(
     season_dir: str | Path,
     force: bool = False,
+    output_format: TableFormat = "csv",
 ) -> Path | None:
     """
     Generate teamweek_unified.csv for a season directory.
@@ -144,15 +135,16 @@ def generate_teamweek_for_season(
     Args:
         season_dir: Path to season directory (e.g., data/seasons/2024)
         force: If True, overwrite existing file. If False, skip if exists.
+        output_format: "csv" or "parquet"
 
     Returns:
         Path to generated file, or None if skipped
     """
     season_dir = Path(season_dir)
     boxscores_path = season_dir / "boxscores.csv"
-    output_path = season_dir / "reports" / "teamweek_unified.csv"
+    output_path = with_format(season_dir / "reports" / "teamweek_unified.csv", output_format)
 
-    if not boxscores_path.exists():
+    if not table_exists(boxscores_path):
         return None
 
     if output_path.exists() and not force:
@@ -160,3 +152,57 @@ def generate_teamweek_for_season(
 
     generate_teamweek_unified(boxscores_path, output_path)
     return output_path
+
+
+def generate_teamweek_all(
+    seasons_dir: str | Path,
+    seasons: Iterable[int] | None = None,
+    force: bool = False,
+    output_format: TableFormat = "csv",
+) -> dict[int, Path]:
+    """
+    Generate teamweek_unified for every season in one pass.
+
+    All boxscores are read and combined, ``build_teamweek`` runs once over the
+    combined frame, and the result is split back into each season's
+    ``reports/`` directory.
+
+    Args:
+        seasons_dir: Directory holding one sub-directory per season (data/seasons)
+        seasons: Only these seasons (default: every season directory)
+        force: If True, overwrite existing files. If False, skip seasons that have one.
+        output_format: "csv" or "parquet"
+
+    Returns:
+        {season_year: path written}; seasons without boxscores or complete
+        matchups are left out
+    """
+    wanted = set(seasons) if seasons is not None else None
+    outputs: dict[int, Path] = {}
+    frames = []
+    for season_dir in sorted(Path(seasons_dir).iterdir()):
+        if not season_dir.is_dir() or not season_dir.name.isdigit():
+            continue
+        year = int(season_dir.name)
+        if wanted is not None and year not in wanted:
+            continue
+        boxscores_path = season_dir / "boxscores.csv"
+        output_path = with_format(season_dir / "reports" / "teamweek_unified.csv", output_format)
+        if not table_exists(boxscores_path) or (output_path.exists() and not force):
+            continue
+        df = read_table(boxscores_path)
+        if df.empty:
+            continue
+        outputs[year] = output_path
+        frames.append(df)
+
+    if not frames:
+        return {}
+
+    written: dict[int, Path] = {}
+    result = build_teamweek(pd.concat(frames, ignore_index=True))
+    for year, season_rows in result.groupby("season_year", sort=True):
+        path = outputs[int(year)]
+        write_frame(season_rows.reset_index(drop=True), path, TEAMWEEK_SCHEMA)
+        written[int(year)] = path
+    return written
@@ -1,7 +1,7 @@
 """Transaction export logic."""
 
 import csv
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, astuple, dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -10,6 +10,9 @@ from espn_api.football import League  # type: ignore[import-untyped]
 
 from .api import ESPNCredentials
 from .exceptions import ESPNAPIError
+from .schemas import TRANSACTION_SCHEMA
+from .transport import http_get, install_espn_api_transport
+from .writers import open_row_writer
 
 
 @dataclass
@@ -50,7 +53,7 @@ def export_transactions(
     Args:
         league_id: ESPN league ID
         year: Season year
-        output_path: Output CSV file path
+        output_path: Output file path (``.parquet`` writes Parquet, otherwise CSV)
         credentials: Optional ESPN authentication credentials
         public_only: If True, ignore credentials (public league mode)
         repo_root: Repository root path (for team mappings if needed)
@@ -73,6 +76,7 @@ def export_transactions(
     if year >= 2018:
         try:
             # Use espn_api library to get transactions
+            install_espn_api_transport()
             if not public_only and credentials and credentials.is_authenticated:
                 league = League(
                     league_id=league_id,
@@ -187,7 +191,7 @@ def export_transactions(
                 for week in range(1, final_scoring_period + 1):
                     week_url = f"{base_url}/seasons/{year}/segments/0/leagues/{league_id}?scoringPeriodId={week}&view=mTransactions2&view=mTeam"
                     try:
-                        week_response = requests.get(week_url, cookies=cookies, timeout=10)
+                        week_response = http_get(week_url, cookies=cookies, timeout=10)
                         if week_response.status_code == 200:
                             week_data = week_response.json()
                             # Extract transactions from this week
@@ -213,7 +217,7 @@ def export_transactions(
             base_url = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl"
             fallback_url = f"{base_url}/seasons/{year}/segments/0/leagues/{league_id}?view=mTransactions2&view=mTeam"
             try:
-                fallback_response = requests.get(fallback_url, cookies=cookies, timeout=10)
+                fallback_response = http_get(fallback_url, cookies=cookies, timeout=10)
                 if fallback_response.status_code == 200:
                     fallback_data = fallback_response.json()
                     transactions = []
@@ -232,7 +236,7 @@ def export_transactions(
         url = f"{base_url}/leagueHistory/{league_id}?seasonId={year}&view=mTransactions"
         
         try:
-            response = requests.get(url, cookies=cookies, timeout=10)
+            response = http_get(url, cookies=cookies, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -388,6 +392,14 @@ def export_transactions(
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if out_path.suffix.lower() == ".parquet":
+        with open_row_writer(
+            out_path, list(TRANSACTION_SCHEMA), schema=TRANSACTION_SCHEMA
+        ) as table_writer:
+            for row in rows:
+                table_writer.write(astuple(row))
+        return out_path
+
     with open(out_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(
             f,
@@ -0,0 +1,488 @@
+"""Shared HTTP transport with an on-disk response cache.
+
+Every ESPN caller (``LiveScoreClient``, the transaction and roster exporters,
+the live report helpers and espn_api's ``League``) issues its GET requests
+through :func:`http_get`. That gives one place to record responses to disk and
+replay them later without touching the network. Requests that do reach the
+network pass through a process-wide token bucket and are retried with
+jittered exponential backoff on 429/5xx responses and connection errors.
+
+Cache modes:
+- ``off``: always hit the network, never read or write the cache
+- ``on``: serve fresh cache entries, record misses
+- ``refresh``: always hit the network, record every response
+- ``replay``: serve cache entries regardless of age; a miss is an error
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Literal, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+from .exceptions import CacheMissError, RateLimitError
+
+CacheMode = Literal["off", "on", "refresh", "replay"]
+CACHE_MODES: tuple[CacheMode, ...] = ("off", "on", "refresh", "replay")
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL = 300.0
+
+# (pattern, ttl seconds) matched against "url?query"; first match wins.
+# A ttl of None means the entry never expires.
+DEFAULT_TTL_RULES: tuple[tuple[str, float | None], ...] = (
+    (r"view=mLiveScoring", 15.0),
+    (r"sports\.core\.api\.espn\.com/.*/status", 15.0),
+    (r"sports\.core\.api\.espn\.com", 60.0),
+    (r"view=proTeamSchedules_wl", 6 * 3600.0),
+    (r"view=kona_player", 3600.0),
+)
+
+# Network requests allowed per second (sustained) and in a burst
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Headers that change the response body and therefore belong in the cache key
+KEYED_HEADERS = ("x-fantasy-filter",)
+
+_SEASON_PATTERN = re.compile(r"(?:/seasons/|seasonId=)(\d{4})")
+
+
+@dataclass(slots=True)
+class HTTPResponse:
+    """Minimal response object shared by live and cached requests.
+
+    Mirrors the parts of ``requests.Response`` that callers in this package
+    (and espn_api) rely on: ``status_code``, ``content``, ``text``, ``json()``
+    and ``raise_for_status()``.
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content.decode("utf-8"))
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+def season_is_complete(season: int, today: date | None = None) -> bool:
+    """Return True once a season's data can no longer change (March 1 of the next year)."""
+    today = today or date.today()
+    return today >= date(season + 1, 3, 1)
+
+
+def _normalize_params(
+    url: str,
+    params: Mapping[str, Any] | Iterable[tuple[str, Any]] | None,
+) -> tuple[str, list[tuple[str, str]]]:
+    """Split query parameters out of url and merge them with params, sorted."""
+    parts = urlsplit(url)
+    pairs: list[tuple[str, str]] = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        items = params.items() if isinstance(params, Mapping) else params
+        for key, value in items:
+            if isinstance(value, (list, tuple)):
+                pairs.extend((str(key), str(v)) for v in value)
+            else:
+                pairs.append((str(key), str(value)))
+    base = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    return base, sorted(pairs)
+
+
+def _cookie_identity(cookies: Mapping[str, str] | None) -> str:
+    """Hash cookie values so keys differ per identity without storing secrets."""
+    if not cookies:
+        return ""
+    canonical = sorted((name.lower(), str(value)) for name, value in cookies.items())
+    return hashlib.sha256(json.dumps(canonical).encode("utf-8")).hexdigest()[:16]
+
+
+def cache_key(
+    url: str,
+    params: Mapping[str, Any] | Iterable[tuple[str, Any]] | None = None,
+    headers: Mapping[str, str] | None = None,
+    cookies: Mapping[str, str] | None = None,
+) -> str:
+    """Build a stable cache key from URL, params, cookie identity and filter headers."""
+    base, pairs = _normalize_params(url, params)
+    lowered = {k.lower(): v for k, v in (headers or {}).items()}
+    keyed_headers = [(h, lowered[h]) for h in KEYED_HEADERS if h in lowered]
+    payload = json.dumps([base, pairs, keyed_headers, _cookie_identity(cookies)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def ttl_for(
+    url: str,
+    params: Mapping[str, Any] | Iterable[tuple[str, Any]] | None = None,
+    rules: Iterable[tuple[str, float | None]] = DEFAULT_TTL_RULES,
+    default: float | None = DEFAULT_TTL,
+) -> float | None:
+    """Return the TTL (seconds, or None for forever) for a request."""
+    base, pairs = _normalize_params(url, params)
+    target = f"{base}?{urlencode(pairs)}"
+    season_match = _SEASON_PATTERN.search(target)
+    if season_match and season_is_complete(int(season_match.group(1))):
+        return None
+    for pattern, ttl in rules:
+        if re.search(pattern, target):
+            return ttl
+    return default
+
+
+class ResponseCache:
+    """SQLite-backed response store with per-entry expiry and LRU eviction."""
+
+    def __init__(self, path: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def lookup(self, key: str, allow_stale: bool = False) -> bytes | None:
+        """Return the cached body for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if not allow_stale and expires_at is not None and expires_at <= now:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        return bytes(body)
+
+    def store(self, key: str, url: str, body: bytes, ttl: float | None) -> None:
+        """Record a response body and evict least-recently-used entries if over budget."""
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body, len(body), now, expires_at, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and total body size."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": int(count), "bytes": int(total)}
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Return the delay before retry number ``attempt`` (0-based), with full jitter."""
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_CAP)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2**attempt)))
+
+
+class _TransportState:
+    """Process-wide transport configuration."""
+
+    def __init__(self) -> None:
+        self.mode: CacheMode = "off"
+        self.cache: ResponseCache | None = None
+        self.ttl_rules: tuple[tuple[str, float | None], ...] = DEFAULT_TTL_RULES
+        self.session: requests.Session | None = None
+        self.limiter = TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+        self.max_retries = DEFAULT_MAX_RETRIES
+        self.lock = threading.Lock()
+
+
+_state = _TransportState()
+
+
+def configure_http_cache(
+    cache_dir: str | Path | None = None,
+    mode: CacheMode = "on",
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    ttl_rules: Iterable[tuple[str, float | None]] | None = None,
+) -> ResponseCache | None:
+    """
+    Configure the shared response cache for this process.
+
+    Args:
+        cache_dir: Directory holding the cache database (required unless mode is "off")
+        mode: One of "off", "on", "refresh", "replay"
+        max_bytes: Size budget before least-recently-used entries are evicted
+        ttl_rules: Optional (pattern, ttl) rules replacing DEFAULT_TTL_RULES
+
+    Returns:
+        The active ResponseCache, or None when caching is off
+    """
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Invalid cache mode: {mode}. Must be one of {', '.join(CACHE_MODES)}")
+    with _state.lock:
+        if _state.cache is not None:
+            _state.cache.close()
+            _state.cache = None
+        _state.mode = mode
+        _state.ttl_rules = tuple(ttl_rules) if ttl_rules is not None else DEFAULT_TTL_RULES
+        if mode != "off":
+            if cache_dir is None:
+                raise ValueError("cache_dir is required when the HTTP cache is enabled")
+            _state.cache = ResponseCache(Path(cache_dir) / "responses.sqlite3", max_bytes)
+        return _state.cache
+
+
+def configure_rate_limit(
+    rate: float = DEFAULT_RATE,
+    burst: int = DEFAULT_BURST,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> None:
+    """
+    Configure the process-wide request throttle and retry policy.
+
+    Args:
+        rate: Sustained network requests per second
+        burst: Requests allowed back-to-back before throttling starts
+        max_retries: Retries on 429/5xx responses and connection errors
+    """
+    with _state.lock:
+        _state.limiter = TokenBucket(rate, burst)
+        _state.max_retries = max(0, max_retries)
+
+
+def get_http_cache() -> ResponseCache | None:
+    """Return the active response cache, if any."""
+    return _state.cache
+
+
+def get_cache_mode() -> CacheMode:
+    """Return the active cache mode."""
+    return _state.mode
+
+
+def _session() -> requests.Session:
+    """Return the shared keep-alive session, creating it on first use."""
+    if _state.session is None:
+        with _state.lock:
+            if _state.session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _state.session = session
+    return _state.session
+
+
+def http_get(
+    url: str,
+    params: Mapping[str, Any] | Iterable[tuple[str, Any]] | None = None,
+    headers: Mapping[str, str] | None = None,
+    cookies: Mapping[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    refresh: bool = False,
+) -> HTTPResponse:
+    """
+    Issue a GET request through the shared session and response cache.
+
+    Only 200 responses are recorded. Network errors propagate as
+    ``requests.RequestException`` (after retries) so existing handlers keep
+    working; 5xx responses that survive every retry are returned as-is.
+    ``refresh`` treats this one request as in ``refresh`` mode (skip the
+    cached copy, record the new one) unless the cache is replaying; pollers
+    use it for data that must be newer than its cache TTL.
+
+    Raises:
+        CacheMissError: In replay mode when no recorded response exists
+        RateLimitError: When ESPN keeps answering 429 after every retry
+    """
+    if params is not None and not isinstance(params, Mapping):
+        params = list(params)
+    mode = _state.mode
+    cache = _state.cache
+    key = cache_key(url, params, headers, cookies) if cache is not None else ""
+
+    if cache is not None and (mode == "replay" or (mode == "on" and not refresh)):
+        body = cache.lookup(key, allow_stale=(mode == "replay"))
+        if body is not None:
+            return HTTPResponse(url=url, status_code=200, content=body, from_cache=True)
+    if mode == "replay":
+        raise CacheMissError(f"No recorded response for {url} (replay mode)")
+
+    response = _send(
+        url,
+        params=params,
+        headers=dict(headers) if headers else None,
+        cookies=dict(cookies) if cookies else None,
+        timeout=timeout,
+    )
+    result = HTTPResponse(
+        url=response.url,
+        status_code=response.status_code,
+        content=response.content,
+    )
+    if cache is not None and response.status_code == 200:
+        cache.store(key, url, response.content, ttl_for(url, params, _state.ttl_rules))
+    return result
+
+
+def _send(url: str, **kwargs: Any) -> requests.Response:
+    """Issue a throttled GET, retrying 429/5xx and connection errors with backoff."""
+    attempt = 0
+    while True:
+        _state.limiter.acquire()
+        try:
+            response = _session().get(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= _state.max_retries:
+                raise
+            time.sleep(backoff_delay(attempt))
+            attempt += 1
+            continue
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        if attempt >= _state.max_retries:
+            if response.status_code == 429:
+                raise RateLimitError(
+                    f"ESPN rate limit persisted after {attempt} retries: {url}"
+                )
+            return response
+        time.sleep(backoff_delay(attempt, response.headers.get("Retry-After")))
+        attempt += 1
+
+
+class _RequestsShim:
+    """Stand-in for the ``requests`` module inside espn_api.
+
+    espn_api calls ``requests.get(endpoint, params=..., headers=..., cookies=...)``
+    and only reads ``status_code`` and ``json()`` from the result, so routing
+    that one function through :func:`http_get` is enough.
+    """
+
+    def get(
+        self,
+        url: str,
+        params: Any = None,
+        headers: Any = None,
+        cookies: Any = None,
+        **kwargs: Any,
+    ) -> HTTPResponse:
+        return http_get(
+            url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            timeout=kwargs.get("timeout") or DEFAULT_TIMEOUT,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+
+def install_espn_api_transport() -> None:
+    """Route espn_api's HTTP requests through :func:`http_get` (idempotent)."""
+    try:
+        from espn_api.requests import espn_requests  # type: ignore[import-untyped]
+    except ImportError:  # pragma: no cover - espn_api is a core dependency
+        return
+    if not isinstance(espn_requests.requests, _RequestsShim):
+        espn_requests.requests = _RequestsShim()
@@ -2,6 +2,7 @@
 
 import math
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -60,7 +61,11 @@ def get_team_abbrev(team: Any) -> str:
 
 
 def load_alias_index(mapping_path: str | Path) -> dict[str, list[dict]]:
-    """Load team alias mapping index."""
+    """Load team alias mapping index.
+
+    Prefer ``aliases.get_alias_resolver``, which parses the file once per
+    process and resolves without re-scanning the rules.
+    """
     try:
         with open(mapping_path, encoding="utf-8") as f:
             y = yaml.safe_load(f) or {}
@@ -77,7 +82,7 @@ def load_alias_index(mapping_path: str | Path) -> dict[str, list[dict]]:
 
 
 def resolve_canonical(abbrev: str, year: int | None, idx: dict[str, list[dict[str, Any]]]) -> str:
-    """Resolve canonical team code from alias."""
+    """Resolve canonical team code from alias (see ``aliases.AliasResolver``)."""
     rules = idx.get(abbrev)
     if not rules:
         return abbrev
@@ -104,9 +109,15 @@ def load_canonical_meta(repo_root: Path | None = None) -> dict[tuple[int, str],
     
     Uses RFFL_REG_TEAMS_001 (Python registry) as the Source of Truth.
     The repo_root parameter is kept for backward compatibility but is no longer used.
+    The mapping is built once and shared between callers; treat it as read-only.
     """
+    return _canonical_meta_index()
+
+
+@lru_cache(maxsize=1)
+def _canonical_meta_index() -> dict[tuple[int, str], dict]:
     from .registry import REGISTRY
-    
+
     meta: dict[tuple[int, str], dict] = {}
     for team in REGISTRY:
         meta[(team.season_year, team.team_code)] = {
@@ -6,6 +6,7 @@ from typing import Any
 import pandas as pd  # type: ignore[import-untyped]
 
 from .exceptions import ValidationError
+from .tables import read_table
 
 
 def validate_boxscores(
@@ -16,7 +17,7 @@ def validate_boxscores(
     Validate exported boxscore data for consistency and completeness.
 
     Args:
-        csv_path: Path to boxscores CSV file
+        csv_path: Path to boxscores CSV file (a newer .parquet sibling is preferred)
         tolerance: Allowed difference for sums
 
     Returns:
@@ -25,7 +26,7 @@ def validate_boxscores(
         - issues: list of issue dictionaries
         - report_path: Path to validation report (if issues found)
     """
-    df = pd.read_csv(csv_path)
+    df = read_table(csv_path)
     starters = df[df["slot_type"] == "starters"].copy()
     team_key = "team_code" if "team_code" in starters.columns else "team_abbrev"
     agg = starters.groupby(["week", "matchup", team_key], as_index=False).agg(
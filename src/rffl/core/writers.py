@@ -0,0 +1,151 @@
+"""Streaming row writers for export outputs.
+
+Rows are written as they are produced instead of being collected into a
+DataFrame first, so memory stays flat however many weeks or seasons are
+exported. Output goes to a temporary file next to the destination and is
+moved into place only when the writer closes cleanly; an exception inside
+the ``with`` block leaves any existing file untouched.
+
+CSV output matches ``DataFrame.to_csv(index=False)`` byte for byte. Parquet
+output needs the optional ``pyarrow`` dependency and an explicit schema.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Sequence
+
+from .schemas import arrow_schema, coerce_value
+
+# Rows buffered per Parquet row group
+PARQUET_BATCH_ROWS = 10_000
+
+
+class RowWriter(ABC):
+    """Base class: atomic, streaming writer of rows in a fixed column order."""
+
+    def __init__(self, path: str | Path, columns: Sequence[str]):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.rows_written = 0
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+
+    @abstractmethod
+    def write(self, values: Sequence[Any]) -> None:
+        """Write one row (values in ``columns`` order)."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Flush and close the temporary file."""
+
+    def __enter__(self) -> "RowWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            self._close()
+        except BaseException:
+            self._tmp_path.unlink(missing_ok=True)
+            raise
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class CsvRowWriter(RowWriter):
+    """Write rows as CSV with a header, formatted like pandas' ``to_csv``."""
+
+    def __enter__(self) -> "CsvRowWriter":
+        super().__enter__()
+        self._file = open(self._tmp_path, "w", newline="")
+        self._writer = csv.writer(self._file, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+        self._writer.writerow(self.columns)
+        return self
+
+    def write(self, values: Sequence[Any]) -> None:
+        self._writer.writerow(values)
+        self.rows_written += 1
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetRowWriter(RowWriter):
+    """Write rows to Parquet in bounded row groups (requires pyarrow)."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        schema: dict[str, str],
+        batch_rows: int = PARQUET_BATCH_ROWS,
+    ):
+        super().__init__(path, list(schema))
+        self.types = list(schema.values())
+        self.schema = arrow_schema(schema)
+        self.batch_rows = batch_rows
+        self._batch: list[Sequence[Any]] = []
+
+    def __enter__(self) -> "ParquetRowWriter":
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+        super().__enter__()
+        self._writer = pq.ParquetWriter(self._tmp_path, self.schema)
+        return self
+
+    def write(self, values: Sequence[Any]) -> None:
+        self._batch.append(values)
+        self.rows_written += 1
+        if len(self._batch) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._batch:
+            return
+        import pyarrow as pa  # type: ignore[import-untyped]
+
+        arrays = [
+            pa.array(
+                [coerce_value(row[i], type_name) for row in self._batch],
+                type=self.schema.field(i).type,
+            )
+            for i, type_name in enumerate(self.types)
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        self._batch = []
+
+    def _close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            self._writer.close()
+
+
+def open_row_writer(
+    path: str | Path,
+    columns: Sequence[str],
+    schema: dict[str, str] | None = None,
+) -> RowWriter:
+    """
+    Return a streaming writer chosen by the output suffix.
+
+    ``.parquet`` paths get a ParquetRowWriter (``schema`` required, see
+    ``core.schemas``); anything else is written as CSV.
+    """
+    if Path(path).suffix.lower() == ".parquet":
+        if schema is None:
+            raise ValueError(f"No Parquet schema for {path}")
+        if list(schema) != list(columns):
+            raise ValueError(f"Parquet schema columns do not match output columns for {path}")
+        return ParquetRowWriter(path, schema)
+    return CsvRowWriter(path, columns)
@@ -6,12 +6,13 @@ from typing import Optional, Any
 from enum import Enum
 import pandas as pd  # type: ignore[import-untyped]
 from pathlib import Path
-import time
+import asyncio
 
 from rffl.core.api import ESPNClient, ESPNCredentials
-from rffl.core.utils import load_canonical_meta, resolve_canonical, load_alias_index, get_team_abbrev
+from rffl.core.aliases import alias_mapping_path, get_alias_resolver
+from rffl.core.utils import load_canonical_meta, get_team_abbrev
 from rffl.core.rosters import map_pro_team_id
-from rffl.live.scores import LiveScoreClient
+from rffl.live.scores import AsyncLiveScoreClient, LiveScoringError
 from rffl.forensic.stat_ids import PlayerStatID, DSTStatID
 
 
@@ -49,6 +50,10 @@ SEASON_DATA_QUALITY: dict[int, SeasonDataQuality] = {
     2025: SeasonDataQuality(2025, DataCompleteness.COMPLETE, None),
 }
 
+# Weeks fetched in parallel during season-wide scans; core.transport's shared
+# rate limiter keeps the overall request rate within ESPN's limits
+BULK_FETCH_CONCURRENCY = 8
+
 
 class ESPNAPITool:
     """
@@ -58,7 +63,7 @@ class ESPNAPITool:
     - Return TD attribution may be buried in boxscore HTML for older seasons
     - Historical seasons (2011-2018) have sparser data structures
     - Player-to-D/ST mapping requires proTeamId cross-reference
-    - Rate limits apply on bulk historical queries
+    - Rate limits apply on bulk historical queries (throttled and retried by core.transport)
     
     ESPN Stat ID Reference:
     - Kick Return TD: Stat ID 102 (discovered via RFFL-INQ-2025-001)
@@ -116,11 +121,12 @@ class ESPNAPITool:
             raise ValueError("Kick Return TD stat ID not yet discovered. Run discovery script first.")
         
         # Use raw API to access appliedStats
-        client = LiveScoreClient(
+        client = AsyncLiveScoreClient(
             league_id=self.league_id,
             season=season,
             espn_s2=self.credentials.espn_s2 if self.credentials else None,
             swid=self.credentials.swid if self.credentials else None,
+            max_concurrency=BULK_FETCH_CONCURRENCY,
         )
         
         # Load team mappings
@@ -130,7 +136,7 @@ class ESPNAPITool:
                 repo_root = parent
                 break
         
-        alias_idx = load_alias_index(repo_root / "data" / "teams" / "alias_mapping.yaml")
+        aliases = get_alias_resolver(alias_mapping_path(repo_root))
         canon_meta = load_canonical_meta(repo_root)
         
         # Map proTeamId to NFL team abbreviations
@@ -140,15 +146,20 @@ class ESPNAPITool:
         return_td_events = []
         
         # Determine weeks to process
-        weeks_to_process = [week] if week else range(1, 19)
+        weeks_to_process = [week] if week else list(range(1, 19))
+        
+        # Whole-season scans use one filtered request; a single week fetches directly
+        if week:
+            fetch = client.fetch_scoreboards(weeks_to_process, include_boxscore=True)
+        else:
+            fetch = client.fetch_season_scoreboards(weeks_to_process, include_boxscore=True)
+        scoreboards = asyncio.run(fetch)
         
         for week_num in weeks_to_process:
             try:
-                # Fetch raw boxscore data
-                data = client.fetch_scoreboard(
-                    scoring_period=week_num,
-                    include_boxscore=True
-                )
+                data = scoreboards[week_num]
+                if isinstance(data, LiveScoringError):
+                    raise data
                 
                 # Extract return TD events from rosters
                 teams = data.get('teams', [])
@@ -162,7 +173,7 @@ class ESPNAPITool:
                         (team.get('location', '') + ' ' + team.get('nickname', '')).strip()
                     )
                     # Resolve to canonical RFFL team code
-                    rffl_team_code = resolve_canonical(team_abbrev, season, alias_idx)
+                    rffl_team_code = aliases.resolve(team_abbrev, season)
                     
                     # If resolution failed, try to match by team ID or owner info
                     if rffl_team_code == team_abbrev:  # Resolution failed
@@ -255,10 +266,6 @@ class ESPNAPITool:
                                             'rffl_team_code': rffl_team_code,
                                             'lineup_slot': lineup_slot,
                                         })
-                
-                # Rate limit: sleep between weeks
-                if week is None:  # Only sleep if processing multiple weeks
-                    time.sleep(1)
                     
             except Exception as e:
                 # Log error but continue with other weeks
@@ -298,11 +305,12 @@ class ESPNAPITool:
             raise ValueError("D/ST Kick Return TD stat ID not yet discovered. Run discovery script first.")
         
         # Use raw API to access appliedStats
-        client = LiveScoreClient(
+        client = AsyncLiveScoreClient(
             league_id=self.league_id,
             season=season,
             espn_s2=self.credentials.espn_s2 if self.credentials else None,
             swid=self.credentials.swid if self.credentials else None,
+            max_concurrency=BULK_FETCH_CONCURRENCY,
         )
         
         # Load team mappings
@@ -312,21 +320,26 @@ class ESPNAPITool:
                 repo_root = parent
                 break
         
-        alias_idx = load_alias_index(repo_root / "data" / "teams" / "alias_mapping.yaml")
+        aliases = get_alias_resolver(alias_mapping_path(repo_root))
         canon_meta = load_canonical_meta(repo_root)
         
         dst_events = []
         
         # Determine weeks to process
-        weeks_to_process = [week] if week else range(1, 19)
+        weeks_to_process = [week] if week else list(range(1, 19))
+        
+        # Whole-season scans use one filtered request; a single week fetches directly
+        if week:
+            fetch = client.fetch_scoreboards(weeks_to_process, include_boxscore=True)
+        else:
+            fetch = client.fetch_season_scoreboards(weeks_to_process, include_boxscore=True)
+        scoreboards = asyncio.run(fetch)
         
         for week_num in weeks_to_process:
             try:
-                # Fetch raw boxscore data
-                data = client.fetch_scoreboard(
-                    scoring_period=week_num,
-                    include_boxscore=True
-                )
+                data = scoreboards[week_num]
+                if isinstance(data, LiveScoringError):
+                    raise data
                 
                 # Extract D/ST scoring from rosters
                 teams = data.get('teams', [])
@@ -338,7 +351,7 @@ class ESPNAPITool:
                         team.get('teamAbbrev') or
                         (team.get('location', '') + ' ' + team.get('nickname', '')).strip()
                     )
-                    rffl_team_code = resolve_canonical(team_abbrev, season, alias_idx)
+                    rffl_team_code = aliases.resolve(team_abbrev, season)
                     if rffl_team_code == team_abbrev:  # Resolution failed
                         rffl_team_code = team_abbrev or f"TEAM_{team_id}"
                     
@@ -412,10 +425,6 @@ class ESPNAPITool:
                                     'rffl_team_code': rffl_team_code,
                                     'lineup_slot': lineup_slot,
                                 })
-                
-                # Rate limit: sleep between weeks
-                if week is None:
-                    time.sleep(1)
                     
             except Exception as e:
                 print(f"Warning: Could not process Week {week_num} for season {season}: {e}")
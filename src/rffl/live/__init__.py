@@ -2,6 +2,7 @@
 
 from .scores import (
     LM_API_BASE_URL,
+    AsyncLiveScoreClient,
     LiveCommandMode,
     LiveScoreClient,
     LiveScoringError,
@@ -11,6 +12,7 @@ from .scores import (
 
 __all__ = [
     "LM_API_BASE_URL",
+    "AsyncLiveScoreClient",
     "LiveCommandMode",
     "LiveScoreClient",
     "LiveScoringError",
@@ -10,9 +10,15 @@ This module handles the KORM elimination competition logic, including:
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import json
 
+from .report import TeamReport, fetch_all_matchup_reports
+
+if TYPE_CHECKING:
+    from ..core.korm_processor import KORMCheckpoint
+    from ..core.korm_simulator import KORMSimulation
+
 
 @dataclass
 class KORMTeam:
@@ -63,6 +69,8 @@ class WeekScore:
     completion_pct: float
     players_remaining: int
     total_players: int
+    minutes_remaining: float = 0.0
+    team_abbrev: str = ""
 
     @property
     def is_complete(self) -> bool:
@@ -108,42 +116,64 @@ class KORMTracker:
         """Initialize KORM tracker.
 
         Args:
-            history_dir: Directory containing historical KORM result files
+            history_dir: Season directory containing korm_checkpoints.json
         """
         self.teams: Dict[str, KORMTeam] = {}
         self.week_results: Dict[int, KORMWeekResult] = {}
         self.history_dir = history_dir
+        self.checkpoint_week: Optional[int] = None
 
         if history_dir:
             self.load_history()
 
-    def load_history(self) -> None:
-        """Load historical KORM results from markdown files."""
-        if not self.history_dir or not self.history_dir.exists():
+    def load_history(self, before_week: Optional[int] = None) -> None:
+        """Load KORM state from the season's korm_checkpoints.json.
+
+        Applies the latest week before ``before_week`` (or the latest week
+        overall). The saved checkpoints are first validated against the
+        season's scores and the KORM rules and re-processed where stale;
+        without score data they are used only if the rules are unchanged.
+        Teams not yet tracked are added under their team code. Does nothing
+        if the directory has no checkpoints.
+
+        Args:
+            before_week: Live week being tracked; only earlier weeks apply
+        """
+        if not self.history_dir:
+            return
+        path = self.history_dir / "korm_checkpoints.json"
+        if not path.exists():
             return
 
-        # Load each week's results
-        for week_file in sorted(self.history_dir.glob("2025_KORM_week_*_results.md")):
-            week_num = self._extract_week_number(week_file.name)
-            if week_num:
-                self._parse_week_file(week_file, week_num)
-
-    def _extract_week_number(self, filename: str) -> Optional[int]:
-        """Extract week number from filename."""
-        import re
-        match = re.search(r'week_(\d+)_results', filename)
-        if match:
-            return int(match.group(1))
-        return None
-
-    def _parse_week_file(self, filepath: Path, week: int) -> None:
-        """Parse a week results markdown file."""
-        # This is a simplified parser - in production you'd want more robust parsing
-        content = filepath.read_text()
-
-        # Extract strike recipients and eliminations from the content
-        # This is a placeholder - you'd implement full markdown parsing here
-        pass
+        from ..core.korm_processor import current_season_checkpoints, load_korm_checkpoints
+
+        try:
+            current = current_season_checkpoints(
+                self.history_dir,
+                through_week=None if before_week is None else before_week - 1,
+            )
+        except (FileNotFoundError, ValueError):
+            try:
+                current = load_korm_checkpoints(path)
+            except ValueError:
+                current = []
+        checkpoints = [cp for cp in current if before_week is None or cp.week < before_week]
+        if checkpoints:
+            self.load_checkpoint(checkpoints[-1])
+
+    def load_checkpoint(self, checkpoint: "KORMCheckpoint") -> None:
+        """Set every team's strikes and status from a saved week checkpoint."""
+        by_abbr = {team.abbreviation: team for team in self.teams.values()}
+        for code, state in checkpoint.teams.items():
+            team = by_abbr.get(code)
+            if team is None:
+                team = KORMTeam(code, code, 0)
+                self.teams[code] = team
+            team.strikes = state.strike_count
+            team.strike_weeks = state.strike_weeks
+            team.eliminated = state.status == "eliminated"
+            team.eliminated_week = state.elimination_week
+        self.checkpoint_week = checkpoint.week
 
     def add_team(self, name: str, abbr: str, team_id: int) -> None:
         """Add a team to KORM tracking."""
@@ -164,6 +194,15 @@ class KORMTracker:
             team.eliminated = True
             team.eliminated_week = week
 
+    def get_team(self, name: str, abbreviation: str = "") -> Optional[KORMTeam]:
+        """Find a tracked team by name, falling back to its abbreviation."""
+        team = self.teams.get(name)
+        if team is None and abbreviation:
+            team = next(
+                (t for t in self.teams.values() if t.abbreviation == abbreviation), None
+            )
+        return team
+
     def get_active_teams(self) -> List[KORMTeam]:
         """Get list of active (non-eliminated) teams."""
         return [t for t in self.teams.values() if not t.eliminated]
@@ -175,7 +214,8 @@ class KORMTracker:
     def get_strike_mode(self) -> str:
         """Determine current strike mode based on active teams."""
         active_count = len(self.get_active_teams())
-        return "2-strike" if active_count >= 6 else "1-strike"
+        # Same rule as core.korm_processor.process_korm_week
+        return "2-strike" if active_count >= 5 else "1-strike"
 
     def get_strikes_awarded(self) -> int:
         """Get number of strikes awarded per week based on mode."""
@@ -185,13 +225,16 @@ class KORMTracker:
 class KORMReportGenerator:
     """Generates formatted KORM reports."""
 
-    def __init__(self, tracker: KORMTracker):
+    def __init__(self, tracker: KORMTracker, simulation: Optional["KORMSimulation"] = None):
         """Initialize report generator.
 
         Args:
             tracker: KORMTracker instance with current state
+            simulation: Optional Monte Carlo outcome probabilities for the
+                rest of the KORM window (see ``rffl.core.korm_simulator``)
         """
         self.tracker = tracker
+        self.simulation = simulation
 
     def generate_live_report(
         self,
@@ -253,17 +296,18 @@ class KORMReportGenerator:
         lines.append("")
         lines.append("### ✅ SAFE ZONE")
         lines.append("")
-        lines.append("| Rank | Team | Current | Projected | Complete | KORM Status |")
-        lines.append("|------|------|---------|-----------|----------|-------------|")
+        lines.append("| Rank | Team | Current | Projected | Complete | Min Left | KORM Status |")
+        lines.append("|------|------|---------|-----------|----------|----------|-------------|")
 
         for i, score in enumerate(safe_teams, 1):
-            team = self.tracker.teams.get(score.team_name)
+            team = self.tracker.get_team(score.team_name, score.team_abbrev)
             status = team.status if team else "Unknown"
             complete_str = "✓" if score.is_complete else f"{score.completion_pct:.1f}%"
 
             lines.append(
                 f"| {i}️⃣ | **{score.team_name}** | {score.actual_score:.2f} | "
-                f"**{score.projected_score:.1f}** | {complete_str} | {status} |"
+                f"**{score.projected_score:.1f}** | {complete_str} | "
+                f"{score.minutes_remaining:.0f} | {status} |"
             )
 
         lines.append("")
@@ -271,18 +315,18 @@ class KORMReportGenerator:
         lines.append("")
         lines.append("### 🚨 DANGER ZONE (Strike Recipients)")
         lines.append("")
-        lines.append("| Rank | Team | Current | Projected | Complete | KORM Status |")
-        lines.append("|------|------|---------|-----------|----------|-------------|")
+        lines.append("| Rank | Team | Current | Projected | Complete | Min Left | KORM Status |")
+        lines.append("|------|------|---------|-----------|----------|----------|-------------|")
 
         start_rank = len(safe_teams) + 1
         for i, score in enumerate(bottom_teams, start_rank):
-            team = self.tracker.teams.get(score.team_name)
             status = "⚠️ **PROJECTED STRIKE**"
             complete_str = "✓" if score.is_complete else f"{score.completion_pct:.1f}%"
 
             lines.append(
                 f"| {i}️⃣ | **{score.team_name}** | {score.actual_score:.2f} | "
-                f"**{score.projected_score:.1f}** | {complete_str} | {status} |"
+                f"**{score.projected_score:.1f}** | {complete_str} | "
+                f"{score.minutes_remaining:.0f} | {status} |"
             )
 
         return "\n".join(lines)
@@ -322,6 +366,13 @@ class KORMReportGenerator:
         lines.append("")
         lines.append(f"**{len(incomplete_scores)} teams still have players in action**")
         lines.append("")
+        for score in sorted(incomplete_scores, key=lambda s: -s.minutes_remaining):
+            lines.append(
+                f"- **{score.team_name}**: {score.players_remaining}/{score.total_players} "
+                f"players left, {score.minutes_remaining:.0f} min "
+                f"({score.actual_score:.2f} → {score.projected_score:.1f})"
+            )
+        lines.append("")
 
         return "\n".join(lines)
 
@@ -337,6 +388,30 @@ class KORMReportGenerator:
         lines.append("- **Strike Recipients:** " + ", ".join(s.team_name for s in bottom_teams))
         lines.append("")
 
+        if self.simulation is not None:
+            lines.append(self._generate_simulation_table(self.simulation))
+
+        return "\n".join(lines)
+
+    def _generate_simulation_table(self, simulation: "KORMSimulation") -> str:
+        """Generate the simulated outcome probabilities table."""
+        names = {team.abbreviation: name for name, team in self.tracker.teams.items()}
+        weeks = simulation.weeks
+        window = f"Weeks {weeks[0]}-{weeks[-1]}" if weeks else "Remaining weeks"
+
+        lines = [f"### 🎲 Simulated Odds ({window}, {simulation.trials:,} trials)"]
+        lines.append("")
+        lines.append("| Team | Win | Top 3 | Strike This Week | Eliminated |")
+        lines.append("|------|-----|-------|------------------|------------|")
+        for row in simulation.to_frame().itertuples(index=False):
+            if row.eliminated >= 1.0 and row.top3 == 0.0:
+                continue
+            lines.append(
+                f"| {names.get(row.team, row.team)} | {row.win:.1%} | {row.top3:.1%} | "
+                f"{row.next_strike:.1%} | {row.eliminated:.1%} |"
+            )
+        lines.append("")
+
         return "\n".join(lines)
 
     def _generate_current_standings(self) -> str:
@@ -392,19 +467,134 @@ class KORMReportGenerator:
 *⚠️ Projections subject to change based on remaining games*"""
 
 
-def load_historical_korm_state(history_dir: Path) -> KORMTracker:
-    """Load KORM state from historical markdown files.
+def week_score_from_report(report: TeamReport, week: int) -> WeekScore:
+    """Convert a live team report into a KORM week score."""
+    projected = report.live_projection
+    if projected <= 0.0:
+        # No live projection from ESPN: scale unfinished players' baselines by time left
+        projected = report.actual_points + sum(
+            player.baseline * player.minutes_remaining / 60.0 for player in report.players
+        )
+    return WeekScore(
+        team_name=report.name,
+        week=week,
+        actual_score=report.actual_points,
+        projected_score=projected,
+        baseline_projection=report.baseline_projection,
+        completion_pct=report.minutes_used_pct,
+        players_remaining=sum(1 for player in report.players if player.minutes_remaining > 0),
+        total_players=len(report.players),
+        minutes_remaining=report.minutes_remaining,
+        team_abbrev=report.abbrev,
+    )
+
+
+def korm_week_scores(
+    matchup_reports: List[Tuple[dict, TeamReport, TeamReport]],
+    week: int,
+    tracker: Optional[KORMTracker] = None,
+) -> List[WeekScore]:
+    """Build KORM week scores for every team in a scoring period's matchup reports.
 
     Args:
-        history_dir: Directory containing KORM history files
+        matchup_reports: Output of ``fetch_all_matchup_reports``
+        week: Scoring period
+        tracker: If given, teams it has eliminated are left out
+
+    Returns:
+        One WeekScore per team still in the competition
+    """
+    scores = []
+    for _meta, away_report, home_report in matchup_reports:
+        for report in (away_report, home_report):
+            if tracker is not None:
+                team = tracker.get_team(report.name, report.abbrev)
+                if team is not None and team.eliminated:
+                    continue
+            scores.append(week_score_from_report(report, week))
+    return scores
+
+
+def fetch_korm_week_scores(
+    *,
+    league_id: int,
+    season: int,
+    week: int,
+    tracker: Optional[KORMTracker] = None,
+    timeout: float = 10.0,
+    espn_s2: Optional[str] = None,
+    swid: Optional[str] = None,
+) -> List[WeekScore]:
+    """Fetch live KORM week scores with a single scoreboard request.
+
+    Uses the live report pipeline, so every team's live projection, completion
+    and remaining minutes come from its starters' real game states.
+    """
+    period, matchup_reports = fetch_all_matchup_reports(
+        league_id=league_id,
+        season=season,
+        scoring_period=week,
+        timeout=timeout,
+        espn_s2=espn_s2,
+        swid=swid,
+    )
+    return korm_week_scores(matchup_reports, period, tracker)
+
+
+def simulate_live_korm(
+    season: int,
+    week: int,
+    scores: List[WeekScore],
+    repo_root: Path,
+    tracker: Optional[KORMTracker] = None,
+    trials: int = 10_000,
+    seed: Optional[int] = None,
+) -> "KORMSimulation":
+    """Simulate the rest of the KORM window using this week's live projections.
+
+    The season state is taken from the completed weeks before ``week``; each
+    team's live projected score replaces its model mean for ``week``.
+
+    Args:
+        season: Season year
+        week: Live week (the first simulated week)
+        scores: Live week scores, e.g. from ``fetch_korm_week_scores``
+        repo_root: Repository root path
+        tracker: If given, maps live team names to their KORM team codes
+        trials: Number of simulated seasons
+        seed: Random seed for reproducible odds
+
+    Raises:
+        FileNotFoundError: If the season's scores are not available
+        ValueError: If ``week`` is not inside the KORM window
+    """
+    from ..core.korm_simulator import simulate_korm_season
+
+    projections = {}
+    for score in scores:
+        team = tracker.get_team(score.team_name, score.team_abbrev) if tracker else None
+        code = team.abbreviation if team is not None else score.team_abbrev
+        projections[code or score.team_name] = score.projected_score
+    return simulate_korm_season(
+        season, repo_root, week - 1, trials=trials, seed=seed, projections=projections
+    )
+
+
+def load_historical_korm_state(history_dir: Path, week: Optional[int] = None) -> KORMTracker:
+    """Load KORM state going into a week.
+
+    Uses the season's saved week checkpoints (korm_checkpoints.json in
+    ``history_dir``) when present, otherwise the recorded 2025 strikes.
+
+    Args:
+        history_dir: Season directory containing korm_checkpoints.json
+        week: Live week; state is taken from the weeks before it
 
     Returns:
         Initialized KORMTracker with historical data
     """
-    tracker = KORMTracker(history_dir)
+    tracker = KORMTracker()
 
-    # Manually initialize known teams and state
-    # This would be extracted from historical files in production
     teams_data = {
         "Great Fantasy Minds": ("GFM", 1),
         "PKMC Unhinged": ("PKMC", 2),
@@ -423,6 +613,11 @@ def load_historical_korm_state(history_dir: Path) -> KORMTracker:
     for name, (abbr, team_id) in teams_data.items():
         tracker.add_team(name, abbr, team_id)
 
+    tracker.history_dir = history_dir
+    tracker.load_history(before_week=week)
+    if tracker.checkpoint_week is not None:
+        return tracker
+
     # Record historical strikes (from Week 1-5 files)
     historical_strikes = [
         ("Tennessee Typicals", 1),
@@ -437,7 +632,7 @@ def load_historical_korm_state(history_dir: Path) -> KORMTracker:
         ("Jag Bombers", 5),  # Eliminated W5
     ]
 
-    for team_name, week in historical_strikes:
-        tracker.record_strike(team_name, week)
+    for team_name, week_num in historical_strikes:
+        tracker.record_strike(team_name, week_num)
 
     return tracker
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
-from . import LM_API_BASE_URL, LiveScoreClient, LiveScoringError
+import requests  # type: ignore[import-untyped]
+
+from ..core.exceptions import ESPNAPIError
+from ..core.transport import get_cache_mode, get_http_cache, http_get, season_is_complete
+from . import LM_API_BASE_URL, AsyncLiveScoreClient, LiveScoringError
 
 PRO_SCHEDULE_HEADERS = {
     "User-Agent": "rffl-recipes/1.0",
@@ -45,6 +52,20 @@ POSITION_LABELS: Dict[int, str] = {
 }
 PLAYER_SUFFIXES = {"Jr.", "Sr.", "II", "III", "IV", "V"}
 
+# Seconds an event status stays cached, keyed by game state (None = forever)
+STATUS_TTL_BY_STATE: Dict[str, float | None] = {
+    "post": None,
+    "in": 10.0,
+    "pre": 300.0,
+}
+# Failed lookups are retried after this many seconds
+STATUS_FAILURE_TTL = 30.0
+# Seconds before a persisted pro schedule is revalidated against ESPN
+PRO_SCHEDULE_MAX_AGE = 12 * 3600.0
+_pro_schedule_max_age = PRO_SCHEDULE_MAX_AGE
+
+ProLookups = tuple[Dict[int, str], Dict[tuple[int, int], dict[str, Any]]]
+
 
 @dataclass(slots=True)
 class EventStatus:
@@ -92,6 +113,7 @@ class TeamReport:
     baseline_projection: float
     minutes_remaining: float
     players: List[PlayerCard]
+    abbrev: str = ""
 
     @property
     def projection_delta(self) -> float:
@@ -113,31 +135,36 @@ class TeamReport:
         return max(0.0, (self.actual_points / self.baseline_projection) * 100.0)
 
 
+def _get_json(
+    url: str, headers: dict[str, str], timeout: float, refresh: bool = False
+) -> dict[str, Any]:
+    """GET a JSON payload through the shared transport (``refresh`` skips cached copies)."""
+    try:
+        response = http_get(url, headers=headers, timeout=timeout, refresh=refresh)
+    except ESPNAPIError as exc:
+        raise LiveScoringError(str(exc)) from exc
+    except requests.RequestException as exc:  # pragma: no cover - network failure
+        raise LiveScoringError(f"Request to {url} failed: {exc}") from exc
+    if response.status_code != 200:  # pragma: no cover - network failure
+        raise LiveScoringError(f"Request to {url} failed with status {response.status_code}")
+    try:
+        result: dict[str, Any] = response.json()
+        return result
+    except json.JSONDecodeError as exc:  # pragma: no cover - invalid payload
+        raise LiveScoringError(f"Failed to parse payload from {url}") from exc
+
+
 def fetch_pro_team_data(season: int, timeout: float) -> dict[str, Any]:
     """Return the pro team schedule payload for the requested season."""
 
     url = f"{LM_API_BASE_URL}/seasons/{season}?view=proTeamSchedules_wl"
-    request = Request(url, headers=PRO_SCHEDULE_HEADERS)
-    try:
-        with urlopen(request, timeout=timeout) as response:
-            payload = response.read()
-    except HTTPError as exc:  # pragma: no cover - network failure
-        raise LiveScoringError(
-            f"Pro team schedule request failed with status {exc.code}"
-        ) from exc
-    except URLError as exc:  # pragma: no cover - network failure
-        raise LiveScoringError(f"Pro team schedule request failed: {exc.reason}") from exc
-
     try:
-        result: dict[str, Any] = json.loads(payload.decode("utf-8"))
-        return result
-    except json.JSONDecodeError as exc:  # pragma: no cover - invalid payload
-        raise LiveScoringError("Failed to parse pro team schedule payload") from exc
+        return _get_json(url, PRO_SCHEDULE_HEADERS, timeout)
+    except LiveScoringError as exc:
+        raise LiveScoringError(f"Pro team schedule request failed: {exc}") from exc
 
 
-def build_pro_lookups(
-    pro_data: dict[str, Any]
-) -> tuple[Dict[int, str], Dict[tuple[int, int], dict[str, Any]]]:
+def build_pro_lookups(pro_data: dict[str, Any]) -> ProLookups:
     """Build lookup maps for pro team abbreviations and weekly games."""
 
     settings = pro_data.get("settings") or {}
@@ -164,31 +191,173 @@ def build_pro_lookups(
     return abbrev_by_team, games_by_team_week
 
 
-class EventStatusFetcher:
-    """Fetch and cache event status payloads."""
+def _pro_schedule_cache_path(season: int) -> Path | None:
+    cache = get_http_cache()
+    if cache is None:
+        return None
+    return cache.path.parent / f"pro_schedule_{season}.json"
+
+
+def _read_pro_lookups(path: Path, max_age: float | None) -> ProLookups | None:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if max_age is not None and time.time() - float(payload["fetched_at"]) > max_age:
+            return None
+        abbrev = {int(team_id): str(value) for team_id, value in payload["abbrev"].items()}
+        games = {(int(team_id), int(period)): game for team_id, period, game in payload["games"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return abbrev, games
+
+
+def _write_pro_lookups(path: Path, lookups: ProLookups) -> None:
+    abbrev, games = lookups
+    payload = {
+        "fetched_at": time.time(),
+        "abbrev": {str(team_id): value for team_id, value in abbrev.items()},
+        "games": [[team_id, period, game] for (team_id, period), game in games.items()],
+    }
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, path)
+    except OSError:  # pragma: no cover - cache is best effort
+        return
+
 
-    def __init__(self, timeout: float) -> None:
+def configure_pro_schedule_cache(max_age: float = PRO_SCHEDULE_MAX_AGE) -> None:
+    """Set the process-wide seconds before a persisted pro schedule is revalidated."""
+    global _pro_schedule_max_age
+    _pro_schedule_max_age = max_age
+
+
+def load_pro_lookups(
+    season: int,
+    timeout: float,
+    max_age: float | None = None,
+) -> ProLookups:
+    """
+    Return pro team lookups, served from a per-season file when fresh.
+
+    The parsed lookups live next to the HTTP cache and follow its mode:
+    "off" always downloads, "refresh" re-downloads and rewrites, "replay"
+    ignores age. Completed seasons are never revalidated.
+
+    Args:
+        season: Season year
+        timeout: Request timeout in seconds
+        max_age: Seconds before the cached lookups are revalidated (defaults to
+            the value set by ``configure_pro_schedule_cache``)
+    """
+
+    if max_age is None:
+        max_age = _pro_schedule_max_age
+    path = _pro_schedule_cache_path(season)
+    mode = get_cache_mode()
+    if path is not None and mode != "refresh":
+        ignore_age = mode == "replay" or season_is_complete(season)
+        cached = _read_pro_lookups(path, None if ignore_age else max_age)
+        if cached is not None:
+            return cached
+
+    lookups = build_pro_lookups(fetch_pro_team_data(season, timeout))
+    if path is not None:
+        _write_pro_lookups(path, lookups)
+    return lookups
+
+
+def scoring_period_event_ids(
+    pro_games: Dict[tuple[int, int], dict[str, Any]], scoring_period: int
+) -> set[int]:
+    """Return every NFL event id scheduled in the scoring period."""
+
+    event_ids: set[int] = set()
+    for (_team_id, period), game in pro_games.items():
+        if period != scoring_period:
+            continue
+        game_id = game.get("id")
+        if game_id is None:
+            continue
+        try:
+            event_ids.add(int(game_id))
+        except (TypeError, ValueError):  # pragma: no cover - malformed payload
+            continue
+    return event_ids
+
+
+class EventStatusFetcher:
+    """Fetch and cache event status payloads.
+
+    Entries expire according to ``STATUS_TTL_BY_STATE``: final games are kept
+    for the life of the fetcher, live games for seconds and scheduled games
+    for minutes. Expired statuses are re-read from ESPN, bypassing the HTTP
+    response cache. ``prefetch`` resolves a batch of events concurrently.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        max_workers: int = 8,
+        ttl_by_state: Dict[str, float | None] | None = None,
+    ) -> None:
         self.timeout = timeout
-        self._cache: Dict[int, EventStatus | None] = {}
+        self.max_workers = max_workers
+        self.ttl_by_state = ttl_by_state if ttl_by_state is not None else STATUS_TTL_BY_STATE
+        self._cache: Dict[int, tuple[EventStatus | None, float | None]] = {}
+
+    def _cached(self, event_id: int) -> tuple[bool, EventStatus | None]:
+        entry = self._cache.get(event_id)
+        if entry is None:
+            return False, None
+        status, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            return False, None
+        return True, status
+
+    def _store(self, event_id: int, status: EventStatus | None) -> None:
+        if status is None:
+            ttl: float | None = STATUS_FAILURE_TTL
+        else:
+            ttl = self.ttl_by_state.get(status.state, STATUS_FAILURE_TTL)
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._cache[event_id] = (status, expires_at)
 
     def get(self, event_id: int | None) -> EventStatus | None:
         if event_id is None:
             return None
-        if event_id in self._cache:
-            return self._cache[event_id]
+        hit, status = self._cached(event_id)
+        if hit:
+            return status
 
         status = self._fetch_status(event_id)
-        self._cache[event_id] = status
+        self._store(event_id, status)
         return status
 
+    def prefetch(self, event_ids: Iterable[int | None]) -> None:
+        """Resolve every uncached event id concurrently."""
+
+        pending = sorted(
+            {event_id for event_id in event_ids if event_id is not None}
+            - {event_id for event_id in self._cache if self._cached(event_id)[0]}
+        )
+        if not pending:
+            return
+        workers = max(1, min(self.max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            statuses = list(pool.map(self._fetch_status, pending))
+        for event_id, status in zip(pending, statuses):
+            self._store(event_id, status)
+
     def _fetch_status(self, event_id: int) -> EventStatus | None:
         event_url = (
             f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/{event_id}"
         )
         try:
-            with urlopen(Request(event_url, headers=EVENT_HEADERS), timeout=self.timeout) as resp:
-                event_payload = json.loads(resp.read().decode("utf-8"))
-        except (HTTPError, URLError, json.JSONDecodeError):  # pragma: no cover - network failure
+            event_payload = _get_json(event_url, EVENT_HEADERS, self.timeout)
+        except LiveScoringError:  # pragma: no cover - network failure
             return None
 
         competitions: Iterable[dict[str, Any]] = event_payload.get("competitions") or []
@@ -202,9 +371,8 @@ class EventStatusFetcher:
             return None
 
         try:
-            with urlopen(Request(competition_ref, headers=EVENT_HEADERS), timeout=self.timeout) as resp:
-                competition = json.loads(resp.read().decode("utf-8"))
-        except (HTTPError, URLError, json.JSONDecodeError):  # pragma: no cover - network failure
+            competition = _get_json(competition_ref, EVENT_HEADERS, self.timeout)
+        except LiveScoringError:  # pragma: no cover - network failure
             return None
 
         status_info = competition.get("status") or {}
@@ -212,10 +380,11 @@ class EventStatusFetcher:
         if not status_ref:
             return None
 
+        # STATUS_TTL_BY_STATE decides when a status is re-read, so the HTTP cache's
+        # own (longer) TTL for this endpoint must not serve an older copy
         try:
-            with urlopen(Request(status_ref, headers=EVENT_HEADERS), timeout=self.timeout) as resp:
-                status_payload = json.loads(resp.read().decode("utf-8"))
-        except (HTTPError, URLError, json.JSONDecodeError):  # pragma: no cover - network failure
+            status_payload = _get_json(status_ref, EVENT_HEADERS, self.timeout, refresh=True)
+        except LiveScoringError:  # pragma: no cover - network failure
             return None
 
         status_type = status_payload.get("type") or {}
@@ -582,6 +751,21 @@ def render_team_section(report: TeamReport) -> List[str]:
     return lines
 
 
+def render_matchup_update(
+    meta: dict[str, Any], away_report: TeamReport, home_report: TeamReport
+) -> List[str]:
+    """Render the header, summary table and player cards for one matchup."""
+    lines = [
+        f"#### {away_report.name} @ {home_report.name} (Matchup {meta.get('matchup_id', '-')})"
+    ]
+    lines.extend(render_summary_table([away_report, home_report]))
+    lines.append("")
+    for report in (away_report, home_report):
+        lines.extend(render_team_section(report))
+        lines.append("")
+    return lines
+
+
 def ensure_matchup(
     schedule: Iterable[dict[str, Any]],
     scoring_period: int,
@@ -669,6 +853,7 @@ def build_team_report(
         baseline_projection=baseline_projection,
         minutes_remaining=minutes_remaining,
         players=players,
+        abbrev=str(team_info.get("abbrev") or ""),
     )
 
 
@@ -725,7 +910,7 @@ def build_player_card(
     )
 
 
-def _build_matchup_report(
+def build_matchup_report(
     matchup: dict[str, Any],
     period: int,
     team_lookup: dict[int, dict[str, Any]],
@@ -770,6 +955,26 @@ def _build_matchup_report(
     return matchup_meta, away_report, home_report
 
 
+async def _fetch_report_inputs(
+    client: AsyncLiveScoreClient,
+    season: int,
+    scoring_period: int | None,
+    timeout: float,
+) -> tuple[int, dict[str, Any], ProLookups]:
+    """Fetch settings/scoreboard and the pro schedule concurrently."""
+
+    async def scoreboard() -> tuple[int, dict[str, Any]]:
+        period = scoring_period or await client.get_current_scoring_period()
+        data = await client.fetch_scoreboard(period, include_boxscore=True, include_live=True)
+        return period, data
+
+    (period, data), pro_lookups = await asyncio.gather(
+        scoreboard(),
+        asyncio.to_thread(load_pro_lookups, season, timeout),
+    )
+    return period, data, pro_lookups
+
+
 def fetch_all_matchup_reports(
     *,
     league_id: int,
@@ -781,7 +986,7 @@ def fetch_all_matchup_reports(
 ) -> tuple[int, list[tuple[dict[str, Any], TeamReport, TeamReport]]]:
     """Return matchup reports for every matchup in the scoring period."""
 
-    client = LiveScoreClient(
+    client = AsyncLiveScoreClient(
         league_id=league_id,
         season=season,
         timeout=timeout,
@@ -789,11 +994,8 @@ def fetch_all_matchup_reports(
         swid=swid,
     )
 
-    period = scoring_period or client.get_current_scoring_period()
-    data = client.fetch_scoreboard(
-        period,
-        include_boxscore=True,
-        include_live=True,
+    period, data, (pro_abbrev, pro_games) = asyncio.run(
+        _fetch_report_inputs(client, season, scoring_period, timeout)
     )
 
     schedule = [
@@ -807,12 +1009,11 @@ def fetch_all_matchup_reports(
         team.get("id"): team for team in teams_payload if team.get("id") is not None
     }
 
-    pro_data = fetch_pro_team_data(season, timeout)
-    pro_abbrev, pro_games = build_pro_lookups(pro_data)
     status_fetcher = EventStatusFetcher(timeout)
+    status_fetcher.prefetch(scoring_period_event_ids(pro_games, period))
 
     matchup_reports = [
-        _build_matchup_report(
+        build_matchup_report(
             matchup,
             period,
             team_lookup,
@@ -900,13 +1101,7 @@ def generate_live_matchup_report(
 
         all_lines: List[str] = [f"### Live Matchup Report - Week {period}", ""]
         for meta, away_report, home_report in matchup_reports:
-            header = f"#### {away_report.name} @ {home_report.name} (Matchup {meta.get('matchup_id', '-')})"
-            all_lines.append(header)
-            all_lines.extend(render_summary_table([away_report, home_report]))
-            all_lines.append("")
-            for report in (away_report, home_report):
-                all_lines.extend(render_team_section(report))
-                all_lines.append("")
+            all_lines.extend(render_matchup_update(meta, away_report, home_report))
         if all_lines and all_lines[-1] == "":
             all_lines.pop()
         content = "\n".join(all_lines)
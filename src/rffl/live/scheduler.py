@@ -0,0 +1,139 @@
+"""Adaptive poll cadence for live watch mode.
+
+The delay before the next poll is driven by the NFL games our rostered
+players are in: fast while any of those games is in progress, slower at
+halftime, and otherwise asleep until the next kickoff. Once every game is
+final there is nothing left to poll.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from .report import EventStatus, EventStatusFetcher, resolve_event_id
+
+LIVE_INTERVAL = 15.0
+HALFTIME_INTERVAL = 120.0
+UNKNOWN_INTERVAL = 300.0
+MAX_IDLE_SLEEP = 3600.0
+
+
+def rostered_event_ids(
+    data: dict[str, Any],
+    scoring_period: int,
+    pro_games: Dict[tuple[int, int], dict[str, Any]],
+) -> set[int]:
+    """Return the NFL event ids of every player rostered in the period's matchups."""
+
+    event_ids: set[int] = set()
+    for matchup in data.get("schedule") or []:
+        if matchup.get("matchupPeriodId") != scoring_period:
+            continue
+        for side_key in ("home", "away"):
+            roster = (matchup.get(side_key) or {}).get("rosterForCurrentScoringPeriod") or {}
+            for entry in roster.get("entries") or []:
+                player = (entry.get("playerPoolEntry") or {}).get("player") or {}
+                event_id = resolve_event_id(player, scoring_period, pro_games)
+                if event_id is not None:
+                    event_ids.add(event_id)
+    return event_ids
+
+
+def kickoff_times(
+    pro_games: Dict[tuple[int, int], dict[str, Any]], scoring_period: int
+) -> Dict[int, datetime]:
+    """Map event id to kickoff time from ``proGamesByScoringPeriod`` dates (epoch ms)."""
+
+    kickoffs: Dict[int, datetime] = {}
+    for (_team_id, period), game in pro_games.items():
+        if period != scoring_period:
+            continue
+        game_id, date_ms = game.get("id"), game.get("date")
+        if game_id is None or date_ms is None:
+            continue
+        try:
+            kickoffs[int(game_id)] = datetime.fromtimestamp(
+                float(date_ms) / 1000.0, tz=timezone.utc
+            )
+        except (TypeError, ValueError, OverflowError):  # pragma: no cover - malformed payload
+            continue
+    return kickoffs
+
+
+def is_halftime(status: EventStatus) -> bool:
+    text = f"{status.detail} {status.short_detail}".lower()
+    return "halftime" in text
+
+
+@dataclass
+class AdaptivePollScheduler:
+    """Choose the next poll delay from the state of rostered players' games."""
+
+    status_fetcher: EventStatusFetcher
+    pro_games: Dict[tuple[int, int], dict[str, Any]]
+    scoring_period: int
+    live_interval: float = LIVE_INTERVAL
+    halftime_interval: float = HALFTIME_INTERVAL
+    unknown_interval: float = UNKNOWN_INTERVAL
+    max_idle_sleep: float = MAX_IDLE_SLEEP
+
+    def next_delay(self, data: dict[str, Any], now: datetime | None = None) -> float | None:
+        """
+        Return seconds until the next poll, or None when every game is final.
+
+        Args:
+            data: Latest scoreboard payload (with rosters)
+            now: Current time (defaults to now, timezone-aware)
+        """
+        event_ids = rostered_event_ids(data, self.scoring_period, self.pro_games)
+        self.status_fetcher.prefetch(event_ids)
+        statuses = {event_id: self.status_fetcher.get(event_id) for event_id in event_ids}
+        kickoffs = kickoff_times(self.pro_games, self.scoring_period)
+        return self.delay_for(statuses, kickoffs, now)
+
+    def delay_for(
+        self,
+        statuses: Dict[int, EventStatus | None],
+        kickoffs: Dict[int, datetime],
+        now: datetime | None = None,
+    ) -> float | None:
+        """Return the poll delay for a set of event statuses (None = all final)."""
+        now = now or datetime.now(timezone.utc)
+        if not statuses:
+            return self.unknown_interval
+        live = [status for status in statuses.values() if status and status.state == "in"]
+        if live:
+            if all(is_halftime(status) for status in live):
+                return self.halftime_interval
+            return self.live_interval
+
+        upcoming: list[datetime] = []
+        unknown = False
+        for event_id, status in statuses.items():
+            if status is not None and status.state == "post":
+                continue
+            start = (status.start_time if status else None) or kickoffs.get(event_id)
+            if start is None:
+                unknown = True
+            else:
+                upcoming.append(start)
+
+        if not upcoming:
+            return self.unknown_interval if unknown else None
+        until_kickoff = (min(upcoming) - now).total_seconds()
+        delay = min(max(until_kickoff, self.live_interval), self.max_idle_sleep)
+        if unknown:
+            delay = min(delay, self.unknown_interval)
+        return delay
+
+
+def describe_delay(delay: float | None) -> str:
+    """Human-readable description of the next poll."""
+    if delay is None:
+        return "all games final"
+    if delay >= 60:
+        return f"next poll in {delay / 60:.0f}m"
+    return f"next poll in {delay:.0f}s"
+
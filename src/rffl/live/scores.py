@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Iterable, Literal
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+import requests  # type: ignore[import-untyped]
 from rich.console import Console
 from rich.table import Table
 
+from ..core.exceptions import ESPNAPIError
+from ..core.transport import http_get
+
 LM_API_BASE_URL = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl"
 
 console = Console()
@@ -38,43 +40,48 @@ class LiveScoreClient:
             f"leagues/{self.league_id}"
         )
 
-    def _get(self, params: Iterable[tuple[str, Any]]) -> dict[str, Any]:
-        """Execute a GET request with common settings."""
-        query = urlencode(list(params), doseq=True)
+    def _get(
+        self,
+        params: Iterable[tuple[str, Any]],
+        extra_headers: dict[str, str] | None = None,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Execute a GET request with common settings (``refresh`` skips cached copies)."""
         headers = {"Accept": "application/json", "User-Agent": "rffl-recipes/1.0"}
-        cookie_header = self._build_cookie_header()
-        if cookie_header:
-            headers["Cookie"] = cookie_header
-
-        request = Request(url=f"{self._league_url()}?{query}", headers=headers)
+        if extra_headers:
+            headers.update(extra_headers)
 
         try:
-            with urlopen(request, timeout=self.timeout) as response:
-                payload = response.read()
-        except HTTPError as exc:  # pragma: no cover - network failure scenario
-            error_detail = getattr(exc, "reason", "") or "HTTP error"
-            raise LiveScoringError(
-                f"ESPN API returned status {exc.code}: {error_detail}"
-            ) from exc
-        except URLError as exc:  # pragma: no cover - network failure scenario
-            raise LiveScoringError(f"HTTP request failed: {exc.reason}") from exc
+            response = http_get(
+                self._league_url(),
+                params=list(params),
+                headers=headers,
+                cookies=self._build_cookies(),
+                timeout=self.timeout,
+                refresh=refresh,
+            )
+        except ESPNAPIError as exc:
+            raise LiveScoringError(str(exc)) from exc
+        except requests.RequestException as exc:  # pragma: no cover - network failure scenario
+            raise LiveScoringError(f"HTTP request failed: {exc}") from exc
+
+        if response.status_code != 200:  # pragma: no cover - network failure scenario
+            raise LiveScoringError(f"ESPN API returned status {response.status_code}")
 
         try:
-            result: dict[str, Any] = json.loads(payload.decode("utf-8"))
+            result: dict[str, Any] = response.json()
             return result
         except json.JSONDecodeError as exc:  # pragma: no cover - invalid payload scenario
             raise LiveScoringError("Failed to parse JSON payload") from exc
 
-    def _build_cookie_header(self) -> str | None:
-        """Create cookie header for private leagues when credentials provided."""
-        parts: list[str] = []
+    def _build_cookies(self) -> dict[str, str] | None:
+        """Create cookies for private leagues when credentials provided."""
+        cookies: dict[str, str] = {}
         if self.espn_s2:
-            parts.append(f"espn_s2={self.espn_s2}")
+            cookies["espn_s2"] = self.espn_s2
         if self.swid:
-            parts.append(f"SWID={self.swid}")
-        if not parts:
-            return None
-        return "; ".join(parts)
+            cookies["SWID"] = self.swid
+        return cookies or None
 
     def fetch_settings(self) -> dict[str, Any]:
         """Fetch league settings including current scoring period."""
@@ -98,8 +105,13 @@ class LiveScoreClient:
         scoring_period: int,
         include_boxscore: bool = False,
         include_live: bool = False,
+        refresh: bool = False,
     ) -> dict[str, Any]:
-        """Fetch scoreboard (and optionally roster) data for a scoring period."""
+        """Fetch scoreboard (and optionally roster) data for a scoring period.
+
+        Pollers pass ``refresh`` so a cached scoreboard is never mistaken for
+        "no change"; the fresh response is still recorded.
+        """
         params: list[tuple[str, Any]] = [
             ("view", "mMatchupScore"),
             ("view", "mTeam"),
@@ -111,7 +123,310 @@ class LiveScoreClient:
         if include_live:
             params.append(("view", "mLiveScoring"))
             params.append(("view", "mScoreboard"))
-        return self._get(params)
+        return self._get(params, refresh=refresh)
+
+    def fetch_boxscores(self, scoring_period: int, matchup_period: int) -> dict[str, Any]:
+        """Fetch one week's matchups with per-player lineups and team abbreviations.
+
+        Requests the same views and schedule filter as espn_api's
+        ``League.box_scores`` (plus ``mTeam``) without initialising a League.
+        """
+        params: list[tuple[str, Any]] = [
+            ("view", "mMatchupScore"),
+            ("view", "mScoreboard"),
+            ("view", "mTeam"),
+            ("scoringPeriodId", scoring_period),
+        ]
+        filters = {"schedule": {"filterMatchupPeriodIds": {"value": [matchup_period]}}}
+        return self._get(params, extra_headers={"x-fantasy-filter": json.dumps(filters)})
+
+    def _season_request(
+        self,
+        matchup_periods: list[int],
+        include_boxscore: bool,
+        scoring_period: int | None = None,
+    ) -> dict[str, Any]:
+        params: list[tuple[str, Any]] = [
+            ("view", "mMatchupScore"),
+            ("view", "mTeam"),
+            ("view", "mSettings"),
+        ]
+        if include_boxscore:
+            params.append(("view", "mBoxscore"))
+            params.append(("view", "mRoster"))
+        if scoring_period is not None:
+            params.append(("scoringPeriodId", scoring_period))
+        filters = {"schedule": {"filterMatchupPeriodIds": {"value": matchup_periods}}}
+        return self._get(params, extra_headers={"x-fantasy-filter": json.dumps(filters)})
+
+    def _season_payload(
+        self,
+        periods: list[int],
+        include_boxscore: bool,
+        scoring_period: int | None = None,
+    ) -> dict[str, Any]:
+        # The schedule filter takes matchup period ids; they only diverge from
+        # scoring periods after a multi-week round, which the settings reveal
+        payload = self._season_request(periods, include_boxscore, scoring_period)
+        matchup_periods = _payload_matchup_periods(payload)
+        wanted = sorted({matchup_period_for(matchup_periods, period) for period in periods})
+        if not set(wanted) <= set(periods):
+            payload = self._season_request(wanted, include_boxscore, scoring_period)
+        return payload
+
+    def fetch_season_scoreboards(
+        self,
+        scoring_periods: Iterable[int],
+        include_boxscore: bool = False,
+    ) -> dict[int, dict[str, Any] | LiveScoringError]:
+        """Fetch many scoring periods with one filtered request where ESPN allows it.
+
+        A single ``x-fantasy-filter`` request returns the schedule for every
+        requested matchup period, which is then split into per-week payloads
+        shaped like :meth:`fetch_scoreboard`. With ``include_boxscore``, weeks
+        whose lineups are not in the combined payload (``rosterForMatchupPeriod``
+        is missing, or the matchup spans several scoring periods) fall back to
+        one request per week.
+
+        Returns a mapping of scoring period to payload, or to the
+        ``LiveScoringError`` raised for that period.
+        """
+        periods = sorted(set(scoring_periods))
+        results = self._fetch_season_split(periods, include_boxscore)
+        for period in periods:
+            if period not in results:
+                results[period] = self._fetch_season_period(period, include_boxscore)
+        return {period: results[period] for period in periods}
+
+    def _fetch_season_split(
+        self, periods: list[int], include_boxscore: bool
+    ) -> dict[int, dict[str, Any] | LiveScoringError]:
+        # A failed bulk request leaves every period to the per-week fallback
+        try:
+            combined = self._season_payload(periods, include_boxscore)
+        except LiveScoringError:
+            return {}
+        return dict(split_season_payload(combined, periods, include_boxscore))
+
+    def _fetch_season_period(
+        self, period: int, include_boxscore: bool
+    ) -> dict[str, Any] | LiveScoringError:
+        try:
+            payload = self._season_payload([period], include_boxscore, scoring_period=period)
+        except LiveScoringError as exc:
+            return exc
+        split = split_season_payload(payload, [period], include_boxscore, scoring_period=period)
+        result: dict[str, Any] = split.get(period, payload)
+        return result
+
+
+def matchup_period_for(matchup_periods: dict[str, list[int]], scoring_period: int) -> int:
+    """Return the matchup period a scoring period belongs to (itself if unmapped)."""
+    for matchup_id, weeks in matchup_periods.items():
+        if scoring_period in weeks:
+            return int(matchup_id)
+    return scoring_period
+
+
+def _payload_matchup_periods(payload: dict[str, Any]) -> dict[str, list[int]]:
+    schedule_settings = (payload.get("settings") or {}).get("scheduleSettings") or {}
+    result: dict[str, list[int]] = schedule_settings.get("matchupPeriods") or {}
+    return result
+
+
+def split_season_payload(
+    payload: dict[str, Any],
+    scoring_periods: Iterable[int],
+    include_boxscore: bool = False,
+    scoring_period: int | None = None,
+) -> dict[int, dict[str, Any]]:
+    """
+    Split a multi-period league payload into per-week scoreboard payloads.
+
+    Each week gets the matchups for its matchup period, looked up in the
+    settings' ``matchupPeriods`` (so both weeks of a two-week playoff round
+    share its matchups). With
+    ``include_boxscore`` every side also gets ``rosterForCurrentScoringPeriod``
+    and every team a ``roster``, both taken from that matchup's
+    ``rosterForMatchupPeriod``. ``rosterForCurrentScoringPeriod`` is only
+    trusted when the payload was requested for ``scoring_period``. Weeks whose
+    lineups are missing, or whose matchup period spans several scoring
+    periods, are left out so the caller can fetch them individually.
+
+    Args:
+        payload: League JSON covering one or more matchup periods
+        scoring_periods: Scoring periods to extract
+        include_boxscore: Require and attach per-team lineups
+        scoring_period: Scoring period the payload was requested for, if any
+    """
+    matchup_periods = _payload_matchup_periods(payload)
+    teams = payload.get("teams") or []
+    split: dict[int, dict[str, Any]] = {}
+
+    for period in scoring_periods:
+        matchup_period = matchup_period_for(matchup_periods, period)
+        schedule = [
+            matchup
+            for matchup in payload.get("schedule") or []
+            if matchup.get("matchupPeriodId") == matchup_period
+        ]
+        if not schedule:
+            continue
+        if not include_boxscore:
+            split[period] = {**payload, "scoringPeriodId": period, "schedule": schedule}
+            continue
+        if matchup_periods.get(str(matchup_period), [period]) != [period]:
+            continue
+
+        lineups: dict[Any, dict[str, Any]] = {}
+        sides_complete = True
+        week_schedule = []
+        for matchup in schedule:
+            week_matchup = dict(matchup)
+            for side_key in ("home", "away"):
+                side = matchup.get(side_key)
+                if not side:
+                    continue
+                roster = side.get("rosterForMatchupPeriod")
+                if not (roster or {}).get("entries") and scoring_period == period:
+                    roster = side.get("rosterForCurrentScoringPeriod")
+                if not (roster or {}).get("entries"):
+                    sides_complete = False
+                    break
+                lineups[side.get("teamId")] = roster
+                week_matchup[side_key] = {**side, "rosterForCurrentScoringPeriod": roster}
+            if not sides_complete:
+                break
+            week_schedule.append(week_matchup)
+        if not sides_complete:
+            continue
+
+        week_teams = [
+            {**team, "roster": lineups.get(team.get("id"), {"entries": []})} for team in teams
+        ]
+        split[period] = {
+            **payload,
+            "scoringPeriodId": period,
+            "schedule": week_schedule,
+            "teams": week_teams,
+        }
+    return split
+
+
+@dataclass(slots=True)
+class AsyncLiveScoreClient:
+    """Asyncio variant of :class:`LiveScoreClient` with the same fetch surface.
+
+    Requests run on worker threads over the shared keep-alive session in
+    ``core.transport``, so concurrent calls reuse pooled TLS connections
+    instead of opening one per request. ``max_concurrency`` caps in-flight
+    requests.
+    """
+
+    league_id: int
+    season: int
+    segment_id: int = 0
+    timeout: float = 10.0
+    espn_s2: str | None = None
+    swid: str | None = None
+    max_concurrency: int = 8
+    _client: LiveScoreClient = field(init=False, repr=False)
+    _semaphore: asyncio.Semaphore | None = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self._client = LiveScoreClient(
+            league_id=self.league_id,
+            season=self.season,
+            segment_id=self.segment_id,
+            timeout=self.timeout,
+            espn_s2=self.espn_s2,
+            swid=self.swid,
+        )
+
+    async def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        # Created lazily so the semaphore binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def fetch_settings(self) -> dict[str, Any]:
+        """Fetch league settings including current scoring period."""
+        result: dict[str, Any] = await self._run(self._client.fetch_settings)
+        return result
+
+    async def get_current_scoring_period(self) -> int:
+        """Return the current scoring period for the league."""
+        result: int = await self._run(self._client.get_current_scoring_period)
+        return result
+
+    async def fetch_scoreboard(
+        self,
+        scoring_period: int,
+        include_boxscore: bool = False,
+        include_live: bool = False,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch scoreboard (and optionally roster) data for a scoring period."""
+        result: dict[str, Any] = await self._run(
+            self._client.fetch_scoreboard,
+            scoring_period,
+            include_boxscore=include_boxscore,
+            include_live=include_live,
+            refresh=refresh,
+        )
+        return result
+
+    async def fetch_season_scoreboards(
+        self,
+        scoring_periods: Iterable[int],
+        include_boxscore: bool = False,
+    ) -> dict[int, dict[str, Any] | LiveScoringError]:
+        """Fetch many scoring periods with as few filtered requests as ESPN allows.
+
+        Weeks missing from the combined payload are fetched concurrently.
+        """
+        periods = sorted(set(scoring_periods))
+        results: dict[int, dict[str, Any] | LiveScoringError] = await self._run(
+            self._client._fetch_season_split, periods, include_boxscore
+        )
+        missing = [period for period in periods if period not in results]
+        fallbacks = await asyncio.gather(
+            *(
+                self._run(self._client._fetch_season_period, period, include_boxscore)
+                for period in missing
+            )
+        )
+        results.update(zip(missing, fallbacks))
+        return {period: results[period] for period in periods}
+
+    async def fetch_scoreboards(
+        self,
+        scoring_periods: Iterable[int],
+        include_boxscore: bool = False,
+        include_live: bool = False,
+    ) -> dict[int, dict[str, Any] | LiveScoringError]:
+        """Fetch several scoring periods concurrently.
+
+        Returns a mapping of scoring period to payload, or to the
+        ``LiveScoringError`` raised for that period, in the order requested.
+        """
+        periods = list(scoring_periods)
+        results = await asyncio.gather(
+            *(
+                self.fetch_scoreboard(
+                    period, include_boxscore=include_boxscore, include_live=include_live
+                )
+                for period in periods
+            ),
+            return_exceptions=True,
+        )
+        outcome: dict[int, dict[str, Any] | LiveScoringError] = {}
+        for period, result in zip(periods, results):
+            if isinstance(result, BaseException) and not isinstance(result, LiveScoringError):
+                raise result
+            outcome[period] = result
+        return outcome
 
 
 LiveCommandMode = Literal["scoreboard", "boxscore", "combined"]
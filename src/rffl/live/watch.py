@@ -0,0 +1,251 @@
+"""Long-running watch mode for live scores and matchup reports.
+
+Each poll fetches the scoreboard once, fingerprints every matchup (team
+totals plus per-player points) and compares it with the previous poll.
+Only matchups whose fingerprint changed are rebuilt and re-rendered.
+With ``adaptive`` enabled the poll cadence follows the rostered players'
+games (see ``live.scheduler``) instead of a fixed interval.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from rich.console import Console
+
+from .report import (
+    EventStatusFetcher,
+    build_matchup_report,
+    extract_actual,
+    load_pro_lookups,
+    render_matchup_update,
+    scoring_period_event_ids,
+)
+from .scheduler import AdaptivePollScheduler, describe_delay
+from .scores import LiveScoreClient, build_scoreboard_table
+
+console = Console()
+
+MatchupSnapshot = Dict[str, float]
+
+
+def matchup_snapshot(matchup: dict[str, Any], scoring_period: int) -> MatchupSnapshot:
+    """Return the point totals that identify a matchup's current state."""
+
+    snapshot: MatchupSnapshot = {}
+    for side_key in ("home", "away"):
+        side = matchup.get(side_key) or {}
+        snapshot[f"{side_key}:total"] = float(side.get("totalPoints") or 0.0)
+        snapshot[f"{side_key}:live"] = float(side.get("totalPointsLive") or 0.0)
+        snapshot[f"{side_key}:projected"] = float(side.get("totalProjectedPointsLive") or 0.0)
+        roster = side.get("rosterForCurrentScoringPeriod") or {}
+        for entry in roster.get("entries") or []:
+            player = (entry.get("playerPoolEntry") or {}).get("player") or {}
+            player_id = entry.get("playerId", player.get("id"))
+            key = f"{side_key}:{player_id}:{entry.get('lineupSlotId')}"
+            snapshot[key] = extract_actual(player, scoring_period)
+    return snapshot
+
+
+def changed_matchups(
+    previous: Dict[Any, MatchupSnapshot],
+    current: Dict[Any, MatchupSnapshot],
+) -> List[Any]:
+    """Return matchup ids that are new or whose snapshot differs."""
+
+    return [
+        matchup_id
+        for matchup_id, snapshot in current.items()
+        if previous.get(matchup_id) != snapshot
+    ]
+
+
+@dataclass
+class ScoreboardWatcher:
+    """Poll a scoreboard and report which matchups changed since the last poll."""
+
+    client: LiveScoreClient
+    scoring_period: int
+    include_boxscore: bool = True
+    last_data: dict[str, Any] = field(default_factory=dict)
+    _snapshots: Dict[Any, MatchupSnapshot] = field(default_factory=dict)
+
+    def poll(self) -> tuple[dict[str, Any], List[dict[str, Any]]]:
+        """Fetch the scoreboard and return it with the changed matchups."""
+
+        data = self.client.fetch_scoreboard(
+            self.scoring_period,
+            include_boxscore=self.include_boxscore,
+            include_live=True,
+            refresh=True,
+        )
+        schedule = [
+            matchup
+            for matchup in (data.get("schedule") or [])
+            if matchup.get("matchupPeriodId") == self.scoring_period
+        ]
+        current = {
+            matchup.get("id"): matchup_snapshot(matchup, self.scoring_period)
+            for matchup in schedule
+        }
+        changed_ids = set(changed_matchups(self._snapshots, current))
+        self._snapshots = current
+        self.last_data = data
+        return data, [matchup for matchup in schedule if matchup.get("id") in changed_ids]
+
+
+def run_watch(
+    poll: Callable[[], None],
+    interval: float,
+    max_polls: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    next_delay: Callable[[], float | None] | None = None,
+) -> None:
+    """
+    Call poll repeatedly until interrupted (or max_polls reached).
+
+    Args:
+        poll: Fetch-and-render callback
+        interval: Fixed seconds between polls when next_delay is not given
+        max_polls: Stop after this many polls
+        sleep: Sleep function (injectable for tests)
+        next_delay: Returns seconds until the next poll, or None to stop
+    """
+
+    polls = 0
+    try:
+        while True:
+            poll()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            delay = interval if next_delay is None else next_delay()
+            if delay is None:
+                console.print("[green]All rostered games are final - watch finished.[/green]")
+                return
+            if next_delay is not None:
+                console.print(f"[dim]{_timestamp()} - {describe_delay(delay)}[/dim]")
+            sleep(delay)
+    except KeyboardInterrupt:
+        console.print("[yellow]Watch stopped.[/yellow]")
+
+
+def _timestamp() -> str:
+    return datetime.now().strftime("%H:%M:%S")
+
+
+def watch_live_scores(
+    *,
+    league_id: int,
+    season: int,
+    scoring_period: int | None = None,
+    interval: float = 30.0,
+    timeout: float = 10.0,
+    espn_s2: str | None = None,
+    swid: str | None = None,
+    max_polls: int | None = None,
+    adaptive: bool = False,
+) -> None:
+    """Re-render the live scoreboard rows whose scores changed since the last poll."""
+
+    client = LiveScoreClient(
+        league_id=league_id,
+        season=season,
+        timeout=timeout,
+        espn_s2=espn_s2,
+        swid=swid,
+    )
+    period = scoring_period or client.get_current_scoring_period()
+    # Rosters are only needed to find which NFL games the adaptive scheduler tracks
+    watcher = ScoreboardWatcher(client, period, include_boxscore=adaptive)
+    next_delay: Callable[[], float | None] | None = None
+    if adaptive:
+        _pro_abbrev, pro_games = load_pro_lookups(season, timeout)
+        scheduler = AdaptivePollScheduler(
+            EventStatusFetcher(timeout), pro_games, period, live_interval=interval
+        )
+
+        def adaptive_delay() -> float | None:
+            return scheduler.next_delay(watcher.last_data)
+
+        next_delay = adaptive_delay
+
+    def poll() -> None:
+        data, changed = watcher.poll()
+        if not changed:
+            return
+        teams = data.get("teams") or []
+        team_lookup = {team.get("id"): team for team in teams if team.get("id") is not None}
+        console.print(f"[dim]{_timestamp()} - {len(changed)} matchup(s) updated[/dim]")
+        console.print(build_scoreboard_table({**data, "schedule": changed}, team_lookup, period))
+
+    run_watch(poll, interval, max_polls=max_polls, next_delay=next_delay)
+
+
+def watch_live_report(
+    *,
+    league_id: int,
+    season: int,
+    scoring_period: int | None = None,
+    team_id: int | None = None,
+    matchup_id: int | None = None,
+    interval: float = 30.0,
+    timeout: float = 10.0,
+    espn_s2: str | None = None,
+    swid: str | None = None,
+    max_polls: int | None = None,
+    adaptive: bool = False,
+) -> None:
+    """Rebuild and print matchup reports only for matchups that changed."""
+
+    client = LiveScoreClient(
+        league_id=league_id,
+        season=season,
+        timeout=timeout,
+        espn_s2=espn_s2,
+        swid=swid,
+    )
+    period = scoring_period or client.get_current_scoring_period()
+    watcher = ScoreboardWatcher(client, period)
+    pro_abbrev, pro_games = load_pro_lookups(season, timeout)
+    status_fetcher = EventStatusFetcher(timeout)
+    scheduler = AdaptivePollScheduler(status_fetcher, pro_games, period, live_interval=interval)
+
+    def wanted(matchup: dict[str, Any]) -> bool:
+        if matchup_id is not None:
+            return matchup.get("id") == matchup_id
+        if team_id is not None:
+            sides = (matchup.get("home") or {}, matchup.get("away") or {})
+            return any(side.get("teamId") == team_id for side in sides)
+        return True
+
+    def poll() -> None:
+        data, changed = watcher.poll()
+        changed = [matchup for matchup in changed if wanted(matchup)]
+        if not changed:
+            return
+        teams_payload = data.get("teams") or []
+        team_lookup = {
+            team.get("id"): team for team in teams_payload if team.get("id") is not None
+        }
+        status_fetcher.prefetch(scoring_period_event_ids(pro_games, period))
+        lines: List[str] = [f"### Live Matchup Report - Week {period} ({_timestamp()})", ""]
+        for matchup in changed:
+            meta, away_report, home_report = build_matchup_report(
+                matchup, period, team_lookup, pro_abbrev, pro_games, status_fetcher
+            )
+            lines.extend(render_matchup_update(meta, away_report, home_report))
+        if lines[-1] == "":
+            lines.pop()
+        content = "\n".join(lines)
+        console.print(f"```\n{content}\n```")
+
+    def next_delay() -> float | None:
+        return scheduler.next_delay(watcher.last_data)
+
+    run_watch(
+        poll, interval, max_polls=max_polls, next_delay=next_delay if adaptive else None
+    )
@@ -0,0 +1,76 @@
+"""Tests for the compiled alias resolver."""
+
+import os
+
+import pandas as pd  # type: ignore[import-untyped]
+
+from rffl.core.aliases import AliasResolver, get_alias_resolver
+from rffl.core.utils import load_alias_index, resolve_canonical
+
+MAPPING = """aliases:
+  - alias: OLD
+    canonical: NEW
+    start_year: 2011
+    end_year: 2015
+  - alias: OLD
+    canonical: NEWER
+    start_year: "2016"
+  - alias: ALT
+    canonical: MAIN
+  - alias: SCOPED
+    canonical: LATE
+    start_year: 2020
+  - alias: SCOPED
+    canonical: ANY
+  - alias: BLANK
+    canonical:
+"""
+
+
+class TestAliasResolver:
+    """The compiled tables agree with resolve_canonical for every year."""
+
+    def test_matches_rule_scan(self, tmp_path):
+        path = tmp_path / "alias_mapping.yaml"
+        path.write_text(MAPPING)
+        idx = load_alias_index(path)
+        resolver = get_alias_resolver(path)
+
+        for year in [None, *range(2000, 2030)]:
+            for code in ["OLD", "ALT", "SCOPED", "BLANK", "PCX"]:
+                assert resolver.resolve(code, year) == resolve_canonical(code, year, idx)
+
+    def test_resolve_column(self):
+        resolver = AliasResolver(
+            [
+                {"alias": "OLD", "canonical": "NEW", "end_year": 2015},
+                {"alias": "OLD", "canonical": "NEWER", "start_year": 2016},
+            ]
+        )
+        codes = pd.Series(["OLD", "PCX", "OLD"], index=[10, 11, 12])
+        years = pd.Series([2014, 2014, 2020], index=[10, 11, 12])
+
+        assert resolver.resolve_column(codes, years).tolist() == ["NEW", "PCX", "NEWER"]
+        assert resolver.resolve_column(codes, 2020).tolist() == ["NEWER", "PCX", "NEWER"]
+        assert list(resolver.resolve_column(codes, years).index) == [10, 11, 12]
+
+
+class TestGetAliasResolver:
+    """One resolver per file, rebuilt only when the file changes."""
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "alias_mapping.yaml"
+        path.write_text("aliases:\n  - alias: A\n    canonical: B\n")
+        first = get_alias_resolver(path)
+        assert get_alias_resolver(path) is first
+
+        path.write_text("aliases:\n  - alias: A\n    canonical: C\n")
+        mtime = path.stat().st_mtime + 5
+        os.utime(path, (mtime, mtime))
+        second = get_alias_resolver(path)
+        assert second is not first
+        assert second.resolve("A", 2024) == "C"
+
+    def test_missing_file_resolves_nothing(self, tmp_path):
+        resolver = get_alias_resolver(tmp_path / "missing.yaml")
+        assert resolver.resolve("A", 2024) == "A"
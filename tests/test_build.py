@@ -0,0 +1,113 @@
+"""Tests for the derived-artifact build graph."""
+
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from rffl.core import build as build_module
+from rffl.core.build import build, load_manifest
+
+
+def _write_boxscores(season_dir, year, bump=0.0):
+    rows = []
+    for team, actual in (("AAA", 100.0 + bump), ("BBB", 90.0), ("CCC", 80.0), ("DDD", 70.0)):
+        matchup = 1 if team in ("AAA", "BBB") else 2
+        rows.append(
+            {
+                "season_year": year,
+                "week": 1,
+                "matchup": matchup,
+                "team_code": team,
+                "is_co_owned?": "No",
+                "team_owner_1": f"{team}_1",
+                "team_owner_2": None,
+                "team_projected_total": 95.0,
+                "team_actual_total": actual,
+                "slot_type": "starters",
+                "slot": "QB",
+                "player_name": f"{team} QB",
+                "nfl_team": "KC",
+                "position": "QB",
+                "is_placeholder": "No",
+                "issue_flag": None,
+                "rs_projected_pf": 95.0,
+                "rs_actual_pf": actual,
+            }
+        )
+    pd.DataFrame(rows).to_csv(season_dir / "boxscores.csv", index=False)
+
+
+@pytest.fixture
+def repo_root(tmp_path):
+    for year in (2023, 2024):
+        season_dir = tmp_path / "data" / "seasons" / str(year)
+        season_dir.mkdir(parents=True)
+        _write_boxscores(season_dir, year)
+    (tmp_path / "data" / "seasons" / "2011").mkdir()  # nothing to derive
+    return tmp_path
+
+
+def _statuses(results):
+    return {(r.season, r.target): r.status for r in results}
+
+
+class TestBuild:
+    """Only targets whose inputs or code changed are rebuilt."""
+
+    def test_first_build_then_fresh(self, repo_root):
+        first = build(repo_root)
+        assert _statuses(first) == {
+            (2023, "teamweek"): "built",
+            (2023, "korm"): "built",
+            (2023, "validation"): "built",
+            (2024, "teamweek"): "built",
+            (2024, "korm"): "built",
+            (2024, "validation"): "built",
+        }
+        assert (repo_root / "data/seasons/2024/reports/teamweek_unified.csv").exists()
+        assert (repo_root / "data/seasons/2024/korm_results.json").exists()
+        manifest = load_manifest(repo_root / ".cache" / "build_manifest.json")
+        assert set(manifest["targets"]["2024/teamweek"]["inputs"]) == {"boxscores.csv"}
+
+        assert {r.status for r in build(repo_root)} == {"fresh"}
+
+    def test_boxscore_refresh_rebuilds_only_that_season(self, repo_root):
+        build(repo_root)
+        _write_boxscores(repo_root / "data/seasons/2024", 2024, bump=5.0)
+
+        planned = build(repo_root, dry_run=True)
+        assert {k for k, v in _statuses(planned).items() if v == "stale"} == {
+            (2024, "teamweek"),
+            (2024, "korm"),
+            (2024, "validation"),
+        }
+
+        rebuilt = build(repo_root, workers=2)
+        assert {k for k, v in _statuses(rebuilt).items() if v != "fresh"} == {
+            (2024, "teamweek"),
+            (2024, "korm"),
+            (2024, "validation"),
+        }
+        teamweek = pd.read_csv(repo_root / "data/seasons/2024/reports/teamweek_unified.csv")
+        assert teamweek.loc[teamweek["team_code"] == "AAA", "team_actual_total"].item() == 105.0
+
+    def test_code_change_and_missing_output(self, repo_root, monkeypatch):
+        build(repo_root)
+        (repo_root / "data/seasons/2023/korm_history.md").unlink()
+        results = build(repo_root, targets=["korm"])
+        assert _statuses(results) == {(2023, "korm"): "built", (2024, "korm"): "fresh"}
+
+        monkeypatch.setattr(build_module, "code_version", lambda modules: "changed")
+        assert {r.status for r in build(repo_root, seasons=[2023])} == {"built"}
+
+    def test_failure_skips_downstream(self, repo_root, monkeypatch):
+        def broken(year, season_dir, repo_root):
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(build_module.BUILDERS, "teamweek", broken)
+        results = build(repo_root, seasons=[2024])
+        failed = {(r.target, r.detail) for r in results if r.status == "failed"}
+        assert failed == {("teamweek", "boom"), ("korm", "upstream failed")}
+
+    def test_unknown_target(self, repo_root):
+        with pytest.raises(ValueError, match="bogus"):
+            build(repo_root, targets=["bogus"])
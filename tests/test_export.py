@@ -7,8 +7,8 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from rffl.core.export import Row, iter_weeks, export_boxscores
-from rffl.core.exceptions import ESPNAPIError, ValidationError
+from rffl.core.export import Row, checkpoint_path, iter_weeks, export_boxscores
+from rffl.core.exceptions import ESPNAPIError, RateLimitError, ValidationError
 
 
 class TestRow:
@@ -166,6 +166,51 @@ class TestIterWeeks:
         assert weeks[0][0] == 1
         assert weeks[1][0] == 3
 
+    def test_iter_weeks_workers_preserves_week_order(self, mock_espn_client):
+        """Test that concurrent fetching still yields weeks in order."""
+        import time
+
+        def side_effect(week):
+            # Later weeks finish first to exercise reordering
+            time.sleep(0.01 * (6 - week))
+            return [f"week-{week}"]
+
+        mock_espn_client.get_boxscores.side_effect = side_effect
+
+        weeks = list(iter_weeks(mock_espn_client, 1, 5, workers=4))
+
+        assert [wk for wk, _ in weeks] == [1, 2, 3, 4, 5]
+        assert weeks[2][1] == ["week-3"]
+        mock_espn_client.get_league.assert_called_once()
+
+    def test_iter_weeks_workers_skips_errors_and_empty(self, mock_espn_client):
+        """Test that concurrent fetching skips failed and empty weeks."""
+        def side_effect(week):
+            if week == 2:
+                raise ESPNAPIError("API Error")
+            if week == 4:
+                return []
+            return [MagicMock()]
+
+        mock_espn_client.get_boxscores.side_effect = side_effect
+
+        weeks = list(iter_weeks(mock_espn_client, 1, 5, workers=3))
+
+        assert [wk for wk, _ in weeks] == [1, 3, 5]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_iter_weeks_reraises_rate_limit(self, mock_espn_client, workers):
+        """Test that a persistent 429 stops iteration instead of skipping the week."""
+        def side_effect(week):
+            if week == 2:
+                raise RateLimitError("ESPN rate limit persisted after 3 retries")
+            return [MagicMock()]
+
+        mock_espn_client.get_boxscores.side_effect = side_effect
+
+        with pytest.raises(RateLimitError):
+            list(iter_weeks(mock_espn_client, 1, 3, workers=workers))
+
 
 class TestExportBoxscores:
     """Tests for the export_boxscores function."""
@@ -333,6 +378,136 @@ class TestExportBoxscores:
         expected_order = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "D/ST", "K"]
         assert slots == expected_order
 
+    def test_export_boxscores_workers_output_identical(
+        self, mock_boxscore, setup_repo_root, tmp_path
+    ):
+        """Test that concurrent week fetching writes the same bytes as serial."""
+        outputs = {}
+        for workers in (1, 4):
+            output_path = tmp_path / f"boxscores_{workers}.csv"
+            with patch("rffl.core.export.ESPNClient") as MockClient:
+                mock_client = MagicMock()
+                mock_client.get_league.return_value = MagicMock()
+                mock_client.get_boxscores.return_value = [mock_boxscore]
+                MockClient.return_value = mock_client
+
+                export_boxscores(
+                    league_id=323196,
+                    year=2024,
+                    output_path=output_path,
+                    start_week=1,
+                    end_week=6,
+                    repo_root=setup_repo_root,
+                    workers=workers,
+                )
+            outputs[workers] = output_path.read_bytes()
+
+        assert outputs[1] == outputs[4]
+
+    def _run_incremental(self, mock_boxscore, repo_root, output_path, fail_week=None, **kwargs):
+        """Run an incremental export with week 4 live; return the weeks fetched."""
+        fetched = []
+
+        def get_boxscores(week):
+            if week == fail_week:
+                raise RuntimeError("connection reset")
+            fetched.append(week)
+            return [mock_boxscore]
+
+        settings = {"scoringPeriodId": 4, "status": {"finalScoringPeriod": 17, "isActive": True}}
+        with patch("rffl.core.export.ESPNClient") as MockClient, patch(
+            "rffl.core.export._live_client"
+        ) as mock_live:
+            MockClient.return_value.get_boxscores.side_effect = get_boxscores
+            mock_live.return_value.fetch_settings.return_value = settings
+            export_boxscores(
+                league_id=323196,
+                year=2024,
+                output_path=output_path,
+                start_week=1,
+                end_week=6,
+                repo_root=repo_root,
+                incremental=True,
+                **kwargs,
+            )
+        return fetched
+
+    def test_export_boxscores_incremental_fetches_only_live_weeks(
+        self, mock_boxscore, setup_repo_root, tmp_path
+    ):
+        """Test that incremental runs match a full export and skip final weeks."""
+        full_path = tmp_path / "full.csv"
+        with patch("rffl.core.export.ESPNClient") as MockClient:
+            MockClient.return_value.get_boxscores.return_value = [mock_boxscore]
+            export_boxscores(
+                league_id=323196,
+                year=2024,
+                output_path=full_path,
+                start_week=1,
+                end_week=4,
+                repo_root=setup_repo_root,
+            )
+
+        output_path = tmp_path / "boxscores.csv"
+        assert self._run_incremental(mock_boxscore, setup_repo_root, output_path) == [1, 2, 3, 4]
+        assert output_path.read_bytes() == full_path.read_bytes()
+
+        # Weeks 1-3 are final; only the live week is fetched again
+        assert self._run_incremental(mock_boxscore, setup_repo_root, output_path) == [4]
+        assert output_path.read_bytes() == full_path.read_bytes()
+
+    def test_export_boxscores_incremental_resumes_after_crash(
+        self, mock_boxscore, setup_repo_root, tmp_path
+    ):
+        """Test that a failed backfill keeps finished weeks and resumes from the checkpoint."""
+        output_path = tmp_path / "boxscores.csv"
+        with pytest.raises(ESPNAPIError):
+            self._run_incremental(mock_boxscore, setup_repo_root, output_path, fail_week=3)
+
+        assert sorted(pd.read_csv(output_path)["week"].unique()) == [1, 2]
+        assert checkpoint_path(output_path).exists()
+
+        assert self._run_incremental(mock_boxscore, setup_repo_root, output_path) == [3, 4]
+        assert sorted(pd.read_csv(output_path)["week"].unique()) == [1, 2, 3, 4]
+
+    def test_export_boxscores_rate_limit_fails_loudly(
+        self, mock_boxscore, setup_repo_root, tmp_path
+    ):
+        """Test that a 429 mid-season aborts the export rather than writing a short file."""
+        output_path = tmp_path / "boxscores.csv"
+
+        def get_boxscores(week):
+            if week == 3:
+                raise RateLimitError("ESPN rate limit persisted after 3 retries")
+            return [mock_boxscore]
+
+        with patch("rffl.core.export.ESPNClient") as mock_client:
+            mock_client.return_value.get_boxscores.side_effect = get_boxscores
+            with pytest.raises(RateLimitError):
+                export_boxscores(
+                    league_id=323196,
+                    year=2024,
+                    output_path=output_path,
+                    start_week=1,
+                    end_week=4,
+                    repo_root=setup_repo_root,
+                )
+
+        assert not output_path.exists()
+        assert not checkpoint_path(output_path).exists()
+
+    def test_export_boxscores_incremental_legacy_csv_refetches_latest_week(
+        self, mock_boxscore, setup_repo_root, tmp_path
+    ):
+        """Test that a CSV without a checkpoint re-fetches only its latest week."""
+        output_path = tmp_path / "boxscores.csv"
+        self._run_incremental(mock_boxscore, setup_repo_root, output_path)
+        checkpoint_path(output_path).unlink()
+        df = pd.read_csv(output_path)
+        df[df["week"] <= 2].to_csv(output_path, index=False)
+
+        assert self._run_incremental(mock_boxscore, setup_repo_root, output_path) == [2, 3, 4]
+
     def test_export_boxscores_bench_after_starters(self, mock_boxscore, setup_repo_root, tmp_path):
         """Test that bench players appear after starters."""
         output_path = tmp_path / "boxscores.csv"
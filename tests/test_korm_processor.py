@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from rffl.core import korm_processor
 from rffl.core.korm_processor import (
     KORMStrike,
     KORMTeamResult,
@@ -14,10 +15,20 @@ from rffl.core.korm_processor import (
     process_korm_season,
     generate_korm_markdown,
     generate_korm_json,
+    generate_korm_checkpoints_json,
     load_weekly_scores_from_h2h,
     load_weekly_scores_from_teamweek,
+    load_score_matrix_from_h2h,
+    process_and_save_korm_seasons,
+    process_and_save_korm_season,
+    load_korm_checkpoints,
+    load_korm_season,
+    load_season_checkpoints,
     SEASON_CONFIG,
 )
+from rffl.live.korm import load_historical_korm_state
+
+SEASONS_DIR = Path(__file__).resolve().parents[1] / "data" / "seasons"
 
 
 class TestKORMStrikeMode:
@@ -289,6 +300,226 @@ class TestKORMDataLoading:
         assert 15 not in scores
 
 
+    def test_score_matrix_from_h2h(self, tmp_path):
+        """Test the week x team matrix keeps file order and leaves gaps as NaN."""
+        h2h_csv = """week,matchup,home_team,away_team,home_score,away_score,winner,margin
+1,1,B,A,100,90,B,10
+1,2,D,C,80,85,C,-5
+2,1,A,B,70,60,A,10
+"""
+        h2h_path = tmp_path / "h2h.csv"
+        h2h_path.write_text(h2h_csv)
+
+        matrix = load_score_matrix_from_h2h(h2h_path, max_week=13)
+
+        assert list(matrix.index) == [1, 2]
+        assert list(matrix.columns) == ["B", "A", "D", "C"]
+        assert matrix.loc[2, "A"] == 70.0
+        assert matrix.loc[2, ["D", "C"]].isna().all()
+        assert list(load_weekly_scores_from_h2h(h2h_path, max_week=13)[2]) == ["B", "A"]
+
+
+class TestKORMBatchProcessing:
+    """Test processing several seasons at once."""
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test seasons fan out across processes and report missing data."""
+        teamweek_csv = "season_year,week,team_code,team_actual_total\n" + "".join(
+            f"2024,{week},T{i},{100 + i * week}\n" for week in (1, 2) for i in range(6)
+        )
+        reports = tmp_path / "data" / "seasons" / "2024" / "reports"
+        reports.mkdir(parents=True)
+        (reports / "teamweek_unified.csv").write_text(teamweek_csv)
+
+        serial = process_and_save_korm_seasons([2024, 2023], tmp_path)
+        serial_json = (tmp_path / "data/seasons/2024/korm_results.json").read_text()
+        parallel = process_and_save_korm_seasons([2024, 2023], tmp_path, workers=2)
+        parallel_json = (tmp_path / "data/seasons/2024/korm_results.json").read_text()
+
+        assert serial == parallel
+        assert list(serial) == [2023, 2024]
+        assert serial[2023][0] == "missing"
+        assert serial[2024] == ("success", "korm_history.md")
+        assert json.loads(serial_json)["weeks"] == json.loads(parallel_json)["weeks"]
+
+
+
+class TestKORMCheckpoints:
+    """Test per-week state snapshots and incremental processing."""
+
+    @staticmethod
+    def _scores(weeks):
+        return {
+            week: {f"T{i}": 100.0 + ((i * 7 + week * 3) % 11) for i in range(6)}
+            for week in weeks
+        }
+
+    def test_checkpoint_per_processed_week(self):
+        """Test each week's checkpoint holds cumulative strikes and status."""
+        result = process_korm_season(2024, self._scores(range(1, 15)))
+
+        assert [cp.week for cp in result.checkpoints] == [w.week for w in result.weeks]
+        for week, checkpoint in zip(result.weeks, result.checkpoints):
+            assert checkpoint.active_count == week.active_count_end
+        last = result.checkpoints[-1]
+        for team, final in result.team_results.items():
+            assert last.teams[team].strike_weeks == final.strike_weeks
+            assert last.teams[team].status == final.status
+
+    def test_resume_matches_full_processing(self, tmp_path):
+        """Test a saved season resumes from its checkpoints."""
+        reports = tmp_path / "data" / "seasons" / "2024" / "reports"
+        reports.mkdir(parents=True)
+        scores = self._scores(range(1, 15))
+
+        def write_teamweek(weeks):
+            rows = ["season_year,week,team_code,team_actual_total"] + [
+                f"2024,{week},{team},{score}"
+                for week in weeks
+                for team, score in scores[week].items()
+            ]
+            (reports / "teamweek_unified.csv").write_text("\n".join(rows) + "\n")
+
+        season_dir = tmp_path / "data" / "seasons" / "2024"
+        write_teamweek(range(1, 4))
+        process_and_save_korm_season(2024, tmp_path)
+        assert [cp.week for cp in load_korm_checkpoints(season_dir / "korm_checkpoints.json")] == [
+            1, 2, 3
+        ]
+
+        previous = load_korm_season(season_dir)
+        resumed = process_korm_season(2024, scores, previous)
+        full = process_korm_season(2024, scores)
+        assert resumed.checkpoints[:3] == previous.checkpoints
+        assert generate_korm_json(resumed)["weeks"] == generate_korm_json(full)["weeks"]
+        assert (
+            generate_korm_json(resumed)["final_standings"]
+            == generate_korm_json(full)["final_standings"]
+        )
+
+        # A corrected week is reprocessed from that week on
+        corrected = {week: dict(s) for week, s in scores.items()}
+        corrected[2]["T0"] = 0.0
+        redone = process_korm_season(2024, corrected, previous)
+        assert redone.weeks[1].strikes_given == process_korm_season(
+            2024, corrected
+        ).weeks[1].strikes_given
+        assert "T0" in redone.weeks[1].strikes_given
+
+    def test_live_tracker_reads_checkpoints(self, tmp_path):
+        """Test the live tracker starts from the week before the live one."""
+        scores = self._scores(range(1, 15))
+        result = process_korm_season(2025, scores)
+        (tmp_path / "korm_checkpoints.json").write_text(
+            json.dumps(generate_korm_checkpoints_json(result))
+        )
+
+        tracker = load_historical_korm_state(tmp_path, week=4)
+
+        assert tracker.checkpoint_week == 3
+        state = result.checkpoints[2].teams
+        for code, team_state in state.items():
+            team = next(t for t in tracker.teams.values() if t.abbreviation == code)
+            assert team.strikes == team_state.strike_count
+            assert team.eliminated == (team_state.status == "eliminated")
+
+
+    @staticmethod
+    def _write_teamweek(repo_root, scores):
+        """Write a 2024 teamweek file for ``scores``; return the season directory."""
+        season_dir = repo_root / "data" / "seasons" / "2024"
+        (season_dir / "reports").mkdir(parents=True, exist_ok=True)
+        rows = ["season_year,week,team_code,team_actual_total"] + [
+            f"2024,{week},{team},{score}"
+            for week, week_scores in scores.items()
+            for team, score in week_scores.items()
+        ]
+        (season_dir / "reports" / "teamweek_unified.csv").write_text("\n".join(rows) + "\n")
+        return season_dir
+
+    def test_stale_checkpoints_are_reprocessed(self, tmp_path):
+        """Test saved checkpoints are checked against the scores and rules."""
+        scores = self._scores(range(1, 6))
+        season_dir = self._write_teamweek(tmp_path, scores)
+        process_and_save_korm_season(2024, tmp_path)
+        assert load_season_checkpoints(2024, tmp_path)[5] == (
+            process_korm_season(2024, scores).checkpoints[-1]
+        )
+
+        # A teamweek fix after the checkpoints were saved
+        scores[2]["T0"] = 0.0
+        self._write_teamweek(tmp_path, scores)
+        expected = {cp.week: cp for cp in process_korm_season(2024, scores).checkpoints}
+        assert 2 in expected[2].teams["T0"].strike_weeks
+        assert load_season_checkpoints(2024, tmp_path) == expected
+
+        # Checkpoints written under other rules are never reused
+        path = season_dir / "korm_checkpoints.json"
+        saved = json.loads(path.read_text())
+        saved["rules"] = "older-rules"
+        path.write_text(json.dumps(saved))
+        with pytest.raises(ValueError, match="rules"):
+            load_korm_checkpoints(path)
+        assert load_korm_season(season_dir) is None
+        assert load_season_checkpoints(2024, tmp_path) == expected
+
+    def test_live_tracker_reprocesses_stale_checkpoints(self, tmp_path):
+        """Test the live tracker validates checkpoints when the scores are present."""
+        scores = self._scores(range(1, 6))
+        self._write_teamweek(tmp_path, scores)
+        process_and_save_korm_season(2024, tmp_path)
+        scores[3]["T5"] = 200.0  # lifts T5 out of its saved week 3 strike
+        season_dir = self._write_teamweek(tmp_path, scores)
+
+        tracker = load_historical_korm_state(season_dir, week=4)
+
+        expected = process_korm_season(2024, scores).checkpoints[2].teams["T5"]
+        assert 3 not in expected.strike_weeks
+        assert tracker.checkpoint_week == 3
+        assert tracker.teams["T5"].strike_weeks == expected.strike_weeks
+
+    def test_current_checkpoints_are_read_not_recomputed(self, tmp_path, monkeypatch):
+        """Test a week's standings come straight from a matching saved checkpoint."""
+        scores = self._scores(range(1, 6))
+        self._write_teamweek(tmp_path, scores)
+        process_and_save_korm_season(2024, tmp_path)
+        expected = process_korm_season(2024, scores).checkpoints
+
+        def fail(*args, **kwargs):
+            raise AssertionError("season was reprocessed")
+
+        monkeypatch.setattr(korm_processor, "process_korm_season", fail)
+        assert load_season_checkpoints(2024, tmp_path, through_week=3) == {
+            cp.week: cp for cp in expected[:3]
+        }
+        # A week played after the checkpoints were saved is not yet covered
+        scores[6] = scores[5]
+        self._write_teamweek(tmp_path, scores)
+        assert load_season_checkpoints(2024, tmp_path, through_week=5)[5] == expected[4]
+        with pytest.raises(AssertionError, match="reprocessed"):
+            load_season_checkpoints(2024, tmp_path)
+
+    @pytest.mark.parametrize(
+        "checkpoints_path",
+        sorted(SEASONS_DIR.glob("*/korm_checkpoints.json")),
+        ids=lambda path: path.parent.name,
+    )
+    def test_committed_checkpoints_load(self, checkpoints_path, monkeypatch):
+        """Test the checkpoints shipped in data/seasons are current."""
+        checkpoints = load_korm_checkpoints(checkpoints_path)
+        assert checkpoints
+
+        def fail(*args, **kwargs):
+            raise AssertionError("season was reprocessed")
+
+        monkeypatch.setattr(korm_processor, "process_korm_season", fail)
+        year = int(checkpoints_path.parent.name)
+        assert load_season_checkpoints(year, SEASONS_DIR.parents[1]) == {
+            cp.week: cp for cp in checkpoints
+        }
+
+
+
 class TestKORMOutputGeneration:
     """Test output generation (markdown and JSON)."""
 
@@ -0,0 +1,149 @@
+"""Tests for the Monte Carlo KORM simulator."""
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from rffl.core.korm_processor import process_korm_season
+from rffl.core.korm_simulator import (
+    KORMState,
+    ScoreModel,
+    fit_score_model,
+    simulate_korm,
+    simulate_korm_season,
+    state_from_season,
+)
+from rffl.live.korm import KORMReportGenerator, KORMTracker, WeekScore, simulate_live_korm
+
+TEAMS = [f"T{i}" for i in range(6)]
+
+
+def _fresh_state(teams=TEAMS):
+    n = len(teams)
+    return KORMState(teams, np.zeros(n, int), np.zeros(n, int), np.zeros(n), 0)
+
+
+def _fixed_model(weekly_scores, teams=TEAMS):
+    """A zero-variance model that replays known scores."""
+    weeks = sorted(weekly_scores)
+    mean = np.array([[weekly_scores[w].get(t, 0.0) for t in teams] for w in weeks])
+    return ScoreModel(teams, weeks, mean, np.zeros_like(mean))
+
+
+class TestSimulateKORM:
+    """Batched trials follow the same rules as process_korm_season."""
+
+    def test_zero_variance_replays_processor(self):
+        rng = np.random.default_rng(3)
+        weekly_scores = {
+            week: {t: float(rng.integers(60, 140)) for t in TEAMS} for week in range(1, 15)
+        }
+        weekly_scores[2]["T0"] = weekly_scores[2]["T1"] = 10.0  # tie below the threshold
+
+        result = process_korm_season(2024, weekly_scores)
+        sim = simulate_korm(_fresh_state(), _fixed_model(weekly_scores), trials=4, seed=1)
+
+        for i, team in enumerate(TEAMS):
+            team_result = result.team_results[team]
+            assert sim.place[i, team_result.final_place - 1] == 1.0
+            assert sim.expected_strikes[i] == team_result.strike_count
+            assert sim.eliminated[i] == (team_result.status == "eliminated")
+
+    def test_continues_from_partial_season(self):
+        rng = np.random.default_rng(5)
+        weekly_scores = {
+            week: {t: float(rng.integers(60, 140)) for t in TEAMS} for week in range(1, 15)
+        }
+        played = {week: weekly_scores[week] for week in (1, 2, 3)}
+        state = state_from_season(process_korm_season(2024, played), played)
+        remaining = {week: weekly_scores[week] for week in range(4, 15)}
+
+        sim = simulate_korm(state, _fixed_model(remaining), trials=2)
+        final = process_korm_season(2024, weekly_scores)
+
+        assert state.week == 3
+        for i, team in enumerate(TEAMS):
+            assert sim.place[i, final.team_results[team].final_place - 1] == 1.0
+
+    def test_probabilities_are_consistent(self):
+        model = ScoreModel(TEAMS, [1, 2, 3], np.full((3, 6), 100.0), np.full((3, 6), 20.0))
+        sim = simulate_korm(_fresh_state(), model, trials=20_000, seed=7)
+
+        np.testing.assert_allclose(sim.place.sum(axis=0), 1.0)
+        np.testing.assert_allclose(sim.place.sum(axis=1), 1.0)
+        # Week 1 has six active teams, so exactly two strikes barring ties
+        assert sim.next_strike.sum() == pytest.approx(2.0, abs=0.01)
+        np.testing.assert_allclose(sim.win, 1 / 6, atol=0.02)
+        assert list(simulate_korm(_fresh_state(), model, trials=500, seed=1).place.ravel()) == (
+            list(simulate_korm(_fresh_state(), model, trials=500, seed=1).place.ravel())
+        )
+
+    def test_mismatched_teams_rejected(self):
+        model = ScoreModel(["A"], [1], np.zeros((1, 1)), np.zeros((1, 1)))
+        with pytest.raises(ValueError, match="teams"):
+            simulate_korm(_fresh_state(), model)
+
+
+class TestFitScoreModel:
+    """Team distributions are shrunk toward the league."""
+
+    def test_shrinkage_and_projections(self):
+        history = pd.DataFrame(
+            {
+                "team_code": ["A"] * 8 + ["B"] * 8,
+                "team_actual_total": [120.0, 130.0] * 4 + [80.0, 90.0] * 4,
+                "team_projected_total": [120.0] * 8 + [90.0] * 8,
+            }
+        )
+        model = fit_score_model(history, ["A", "B", "NEW"], [5, 6], projections={"B": 111.0})
+
+        assert model.mean.shape == (2, 3)
+        assert 105.0 < model.mean[1, 0] < 125.0
+        assert 85.0 < model.mean[1, 1] < 105.0
+        assert model.mean[1, 2] == pytest.approx(105.0)
+        assert model.mean[0, 1] == 111.0
+        assert model.std[0, 1] < model.std[1, 1]
+
+
+def _write_season(repo_root):
+    season_dir = repo_root / "data" / "seasons" / "2024" / "reports"
+    season_dir.mkdir(parents=True)
+    rng = np.random.default_rng(11)
+    rows = [
+        {"season_year": 2024, "week": week, "team_code": team, "team_actual_total": score}
+        for week in range(1, 6)
+        for team, score in zip(TEAMS, rng.normal(100, 15, len(TEAMS)).round(2))
+    ]
+    pd.DataFrame(rows).to_csv(season_dir / "teamweek_unified.csv", index=False)
+
+
+def test_simulate_season_and_live_table(tmp_path):
+    _write_season(tmp_path)
+
+    sim = simulate_korm_season(2024, tmp_path, after_week=5, trials=2_000, seed=2)
+    assert sim.weeks == list(range(6, 15))
+    assert sim.win.sum() == pytest.approx(1.0)
+
+    tracker = KORMTracker()
+    tracker.add_team("Team Zero", "T0", 1)
+    report = KORMReportGenerator(tracker, simulation=sim)._generate_scenarios([], [])
+    assert "Simulated Odds (Weeks 6-14, 2,000 trials)" in report
+    assert "| Team Zero |" in report
+
+
+def test_simulate_live_korm_uses_live_projections(tmp_path):
+    _write_season(tmp_path)
+    tracker = KORMTracker()
+    tracker.add_team("Team Zero", "T0", 1)
+    scores = [
+        WeekScore(name, 6, 0.0, projected, 100.0, 0.0, 9, 9, 540.0, abbrev)
+        for name, abbrev, projected in [("Team Zero", "ESPN0", 20.0)]
+        + [(f"Team {t}", t, 150.0) for t in TEAMS[1:]]
+    ]
+
+    sim = simulate_live_korm(2024, 6, scores, tmp_path, tracker=tracker, trials=2_000, seed=2)
+
+    assert sim.weeks[0] == 6
+    next_strike = dict(zip(sim.teams, sim.next_strike))
+    assert next_strike["T0"] > 0.99
+    assert max(next_strike[t] for t in TEAMS[1:]) < 0.5
@@ -0,0 +1,107 @@
+"""Tests for RFFL lineup validation."""
+
+import pandas as pd  # type: ignore[import-untyped]
+
+from rffl.core.lineup import validate_lineup_file, validate_rffl_lineup
+
+VALID_LINEUP = [
+    ("QB", "QB"),
+    ("RB", "RB"),
+    ("RB", "RB"),
+    ("WR", "WR"),
+    ("WR", "WR"),
+    ("TE", "TE"),
+    ("FLEX", "WR"),
+    ("D/ST", "D/ST"),
+    ("K", "K"),
+]
+
+
+def _lineup(week, matchup, team, slots=VALID_LINEUP):
+    return [
+        {
+            "week": week,
+            "matchup": matchup,
+            "team_code": team,
+            "slot_type": "starters",
+            "slot": slot,
+            "position": position,
+            "player_name": f"{team} {slot} {i}",
+        }
+        for i, (slot, position) in enumerate(slots)
+    ]
+
+
+class TestValidateRfflLineup:
+    """All rules report in a fixed order for a single lineup."""
+
+    def test_valid_lineup(self):
+        result = validate_rffl_lineup(pd.DataFrame(_lineup(1, 1, "AAA")))
+        assert result == {"is_valid": True, "issues": [], "total_issues": 0}
+
+    def test_issue_order_and_fields(self):
+        df = pd.DataFrame(_lineup(1, 1, "AAA"))
+        df.loc[0, "position"] = "RB"  # QB slot holding an RB
+        df.loc[6, "position"] = "QB"  # FLEX holding a QB
+        df.loc[5, "slot"] = "WR"  # one TE short, one WR over
+        df.loc[[1, 3, 4], "player_name"] = ["Twice", "Thrice", "Thrice"]
+        df.loc[2, "player_name"] = "Twice"
+        df.loc[7, "player_name"] = "Thrice"
+
+        result = validate_rffl_lineup(df)
+
+        assert [issue["type"] for issue in result["issues"]] == [
+            "count_mismatch",
+            "count_mismatch",
+            "flex_ineligible",
+            "duplicate_player",
+            "duplicate_player",
+            "invalid_position_in_slot",
+        ]
+        wr, te, flex, thrice, twice, qb = result["issues"]
+        assert wr == {
+            "type": "count_mismatch",
+            "position": "WR",
+            "required": 2,
+            "actual": 3,
+            "description": "Expected 2 WR, found 3",
+        }
+        assert te["description"] == "Expected 1 TE, found 0"
+        assert flex["description"] == "FLEX player AAA FLEX 6 pos QB not RB/WR/TE"
+        assert (thrice["player"], thrice["count"]) == ("Thrice", 3)
+        assert twice["description"] == "Player Twice appears 2 times in starters"
+        assert qb["description"] == "QB slot contains RB player AAA QB 0"
+        assert result["total_issues"] == 6
+
+    def test_empty_lineup_misses_every_slot(self):
+        result = validate_rffl_lineup(pd.DataFrame(_lineup(1, 1, "AAA")).iloc[:0])
+        assert [issue["actual"] for issue in result["issues"]] == [0] * 7
+
+
+def test_validate_lineup_file_checks_every_lineup(tmp_path):
+    rows = (
+        _lineup(2, 1, "BBB", VALID_LINEUP[:-1])  # no kicker
+        + _lineup(1, 1, "AAA")
+        + _lineup(1, 2, "CCC", [("K", "WR")] + VALID_LINEUP[1:])
+    )
+    rows.append({**rows[0], "slot_type": "bench", "slot": "Bench"})
+    csv_path = tmp_path / "boxscores.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+
+    result = validate_lineup_file(csv_path)
+
+    assert (result["total_lineups"], result["valid_lineups"], result["invalid_lineups"]) == (
+        3,
+        1,
+        2,
+    )
+    assert [(i["week"], i["team_code"], i["issue_type"]) for i in result["issues"]] == [
+        (1, "CCC", "count_mismatch"),
+        (1, "CCC", "count_mismatch"),
+        (1, "CCC", "invalid_position_in_slot"),
+        (2, "BBB", "count_mismatch"),
+    ]
+    assert result["report_path"] == tmp_path / "boxscores_lineup_validation_report.csv"
+    report = pd.read_csv(result["report_path"])
+    assert list(report.columns[:5]) == ["week", "matchup", "team_code", "issue_type", "description"]
+    assert report["description"].iloc[-1] == "Expected 1 K, found 0"
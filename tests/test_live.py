@@ -0,0 +1,495 @@
+"""Tests for live scoring clients."""
+
+import asyncio
+import json
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rffl.core.transport import configure_http_cache
+from rffl.live.korm import (
+    KORMReportGenerator,
+    KORMTracker,
+    fetch_korm_week_scores,
+    korm_week_scores,
+)
+from rffl.live.report import (
+    EventStatus,
+    EventStatusFetcher,
+    PlayerCard,
+    TeamReport,
+    configure_pro_schedule_cache,
+    load_pro_lookups,
+    scoring_period_event_ids,
+)
+from rffl.live.scheduler import AdaptivePollScheduler, kickoff_times
+from rffl.live.scores import (
+    AsyncLiveScoreClient,
+    LiveScoreClient,
+    LiveScoringError,
+    split_season_payload,
+)
+from rffl.live.watch import ScoreboardWatcher, run_watch
+
+
+def _fake_get(self, params, refresh=False):
+    params = list(params)
+    period = dict(params).get("scoringPeriodId")
+    if period == 3:
+        raise LiveScoringError("ESPN API returned status 500")
+    if period is None:
+        return {"status": {"currentScoringPeriod": 7}}
+    return {"scoringPeriodId": period}
+
+
+class TestAsyncLiveScoreClient:
+    """Tests for AsyncLiveScoreClient."""
+
+    def test_fetch_scoreboards_keeps_order_and_captures_errors(self):
+        client = AsyncLiveScoreClient(league_id=1, season=2024, max_concurrency=2)
+        with patch.object(LiveScoreClient, "_get", _fake_get):
+            results = asyncio.run(client.fetch_scoreboards([4, 3, 1]))
+
+        assert list(results) == [4, 3, 1]
+        assert results[4] == {"scoringPeriodId": 4}
+        assert results[1] == {"scoringPeriodId": 1}
+        assert isinstance(results[3], LiveScoringError)
+
+    def test_current_scoring_period(self):
+        client = AsyncLiveScoreClient(league_id=1, season=2024)
+        with patch.object(LiveScoreClient, "_get", _fake_get):
+            assert asyncio.run(client.get_current_scoring_period()) == 7
+
+
+def _season_side(team_id: int, key: str = "rosterForMatchupPeriod") -> dict:
+    return {"teamId": team_id, key: {"entries": [{"playerId": team_id * 10}]}}
+
+
+SEASON_PAYLOAD = {
+    "settings": {"scheduleSettings": {"matchupPeriods": {"1": [1], "2": [2], "16": [16, 17]}}},
+    "teams": [{"id": 1}, {"id": 2}],
+    "schedule": [
+        {"id": 1, "matchupPeriodId": 1, "home": _season_side(1), "away": _season_side(2)},
+        {
+            "id": 2,
+            "matchupPeriodId": 2,
+            "home": _season_side(1, "rosterForCurrentScoringPeriod"),
+            "away": _season_side(2, "rosterForCurrentScoringPeriod"),
+        },
+        {"id": 3, "matchupPeriodId": 16, "home": _season_side(1), "away": _season_side(2)},
+    ],
+}
+
+
+class TestSeasonScoreboards:
+    """Tests for the bulk season fetch and its per-week split."""
+
+    def test_split_attaches_matchup_period_lineups(self):
+        split = split_season_payload(SEASON_PAYLOAD, [1, 2, 16], include_boxscore=True)
+
+        # Week 2 only has a current-period roster and week 16 spans two scoring periods
+        assert list(split) == [1]
+        week = split[1]
+        assert week["scoringPeriodId"] == 1
+        assert [m["id"] for m in week["schedule"]] == [1]
+        assert week["schedule"][0]["home"]["rosterForCurrentScoringPeriod"]["entries"] == [
+            {"playerId": 10}
+        ]
+        assert week["teams"][1]["roster"]["entries"] == [{"playerId": 20}]
+
+    def test_split_without_boxscore_keeps_every_period(self):
+        split = split_season_payload(SEASON_PAYLOAD, [1, 2, 16, 5])
+        assert list(split) == [1, 2, 16]
+        assert [m["id"] for m in split[16]["schedule"]] == [3]
+
+    def test_split_maps_two_week_playoff_round_to_its_matchup_period(self):
+        # The season's last round spans scoring periods 16 and 17 as matchup period 15
+        payload = {
+            **SEASON_PAYLOAD,
+            "settings": {"scheduleSettings": {"matchupPeriods": {"14": [14], "15": [15, 16]}}},
+            "schedule": [
+                {"id": 1, "matchupPeriodId": 14, "home": _season_side(1)},
+                {"id": 2, "matchupPeriodId": 15, "home": _season_side(1)},
+                {"id": 3, "matchupPeriodId": 16, "home": _season_side(1)},
+            ],
+        }
+        split = split_season_payload(payload, [14, 15, 16])
+        assert {week: [m["id"] for m in p["schedule"]] for week, p in split.items()} == {
+            14: [1],
+            15: [2],
+            16: [2],
+        }
+        assert split[16]["scoringPeriodId"] == 16
+        assert list(split_season_payload(payload, [14, 15, 16], include_boxscore=True)) == [14]
+
+    def test_season_request_filters_on_matchup_period_ids(self):
+        filters = []
+
+        def fake_get(self, params, extra_headers=None):
+            filters.append(json.loads(extra_headers["x-fantasy-filter"]))
+            return SEASON_PAYLOAD
+
+        client = LiveScoreClient(league_id=1, season=2024)
+        with patch.object(LiveScoreClient, "_get", fake_get):
+            results = client.fetch_season_scoreboards([17])
+
+        assert [f["schedule"]["filterMatchupPeriodIds"]["value"] for f in filters] == [[17], [16]]
+        assert [m["id"] for m in results[17]["schedule"]] == [3]
+
+    def test_missing_weeks_fall_back_to_single_period_requests(self):
+        requests = []
+
+        def fake_get(self, params, extra_headers=None):
+            requests.append(dict(params).get("scoringPeriodId"))
+            if dict(params).get("scoringPeriodId") == 3:
+                raise LiveScoringError("boom")
+            return SEASON_PAYLOAD
+
+        client = LiveScoreClient(league_id=1, season=2024)
+        with patch.object(LiveScoreClient, "_get", fake_get):
+            results = client.fetch_season_scoreboards([3, 2, 1], include_boxscore=True)
+
+        assert requests == [None, 2, 3]
+        assert list(results) == [1, 2, 3]
+        assert results[1]["teams"][0]["roster"]["entries"] == [{"playerId": 10}]
+        # Single-period request: the current scoring period roster is trusted
+        assert results[2]["teams"][0]["roster"]["entries"] == [{"playerId": 10}]
+        assert isinstance(results[3], LiveScoringError)
+
+    def test_async_bulk_failure_falls_back_for_every_week(self):
+        def fake_get(self, params, extra_headers=None):
+            period = dict(params).get("scoringPeriodId")
+            if period is None:
+                raise LiveScoringError("bulk rejected")
+            return SEASON_PAYLOAD
+
+        client = AsyncLiveScoreClient(league_id=1, season=2024, max_concurrency=2)
+        with patch.object(LiveScoreClient, "_get", fake_get):
+            results = asyncio.run(client.fetch_season_scoreboards([2, 1]))
+
+        assert list(results) == [1, 2]
+        assert [m["id"] for m in results[2]["schedule"]] == [2]
+
+
+class TestEventStatusFetcher:
+    """Tests for EventStatusFetcher caching and prefetch."""
+
+    @staticmethod
+    def _status(state):
+        return EventStatus(
+            state=state, detail="", short_detail="", clock=None, period=None, start_time=None
+        )
+
+    def test_prefetch_dedupes_and_skips_cached(self):
+        fetcher = EventStatusFetcher(timeout=1.0)
+        calls = []
+
+        def fake_fetch(event_id):
+            calls.append(event_id)
+            return self._status("post")
+
+        with patch.object(fetcher, "_fetch_status", side_effect=fake_fetch):
+            fetcher.prefetch([1, 2, 2, None, 3])
+            fetcher.prefetch([1, 2, 3, 4])
+            assert fetcher.get(2).state == "post"
+
+        assert sorted(calls) == [1, 2, 3, 4]
+
+    def test_live_status_expires(self):
+        fetcher = EventStatusFetcher(timeout=1.0, ttl_by_state={"in": 0.0, "post": None})
+        with patch.object(
+            fetcher, "_fetch_status", side_effect=[self._status("in"), self._status("post")]
+        ) as fetch:
+            assert fetcher.get(9).state == "in"
+            assert fetcher.get(9).state == "post"
+            assert fetcher.get(9).state == "post"
+        assert fetch.call_count == 2
+
+    def test_live_status_skips_http_cache(self, tmp_path):
+        base = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/9"
+        payloads = {
+            base: [{"competitions": [{"$ref": f"{base}/competitions/9"}]}],
+            f"{base}/competitions/9": [{"status": {"$ref": f"{base}/competitions/9/status"}}],
+            f"{base}/competitions/9/status": [
+                {"type": {"state": "in"}, "period": 2},
+                {"type": {"state": "in"}, "period": 3},
+            ],
+        }
+
+        def fake_get(url, **kwargs):
+            body = payloads[url].pop(0) if len(payloads[url]) > 1 else payloads[url][0]
+            return MagicMock(status_code=200, url=url, content=json.dumps(body).encode())
+
+        session = MagicMock()
+        session.get.side_effect = fake_get
+        configure_http_cache(tmp_path, mode="on")
+        try:
+            fetcher = EventStatusFetcher(timeout=1.0, ttl_by_state={"in": 0.0})
+            with patch("rffl.core.transport._session", return_value=session):
+                periods = [fetcher.get(9).period, fetcher.get(9).period]
+        finally:
+            configure_http_cache(mode="off")
+
+        assert periods == [2, 3]
+        assert session.get.call_count == 4  # event and competition served from cache
+
+    def test_scoring_period_event_ids(self):
+        pro_games = {(1, 5): {"id": 401}, (2, 5): {"id": 401}, (3, 6): {"id": 402}, (4, 5): {}}
+        assert scoring_period_event_ids(pro_games, 5) == {401}
+
+
+PRO_PAYLOAD = {
+    "settings": {
+        "proTeams": [
+            {"id": 12, "abbrev": "kc", "proGamesByScoringPeriod": {"1": [{"id": 401, "date": 1}]}},
+        ]
+    }
+}
+
+
+class TestLoadProLookups:
+    """Tests for the persisted pro schedule lookups."""
+
+    @pytest.fixture(autouse=True)
+    def http_cache(self, tmp_path):
+        configure_http_cache(tmp_path, mode="on")
+        yield tmp_path
+        configure_http_cache(mode="off")
+
+    def test_second_load_served_from_file(self, http_cache):
+        season = date.today().year + 1
+        with patch("rffl.live.report.fetch_pro_team_data", return_value=PRO_PAYLOAD) as fetch:
+            first = load_pro_lookups(season, timeout=1.0)
+            second = load_pro_lookups(season, timeout=1.0)
+
+        assert fetch.call_count == 1
+        assert first == second == ({12: "KC"}, {(12, 1): {"id": 401, "date": 1}})
+        assert (http_cache / f"pro_schedule_{season}.json").exists()
+
+    def test_stale_file_is_revalidated(self):
+        season = date.today().year + 1
+        with patch("rffl.live.report.fetch_pro_team_data", return_value=PRO_PAYLOAD) as fetch:
+            load_pro_lookups(season, timeout=1.0)
+            load_pro_lookups(season, timeout=1.0, max_age=-1)
+        assert fetch.call_count == 2
+
+    def test_configured_max_age(self):
+        season = date.today().year + 1
+        with patch("rffl.live.report.fetch_pro_team_data", return_value=PRO_PAYLOAD) as fetch:
+            load_pro_lookups(season, timeout=1.0)
+            configure_pro_schedule_cache(-1)
+            try:
+                load_pro_lookups(season, timeout=1.0)
+            finally:
+                configure_pro_schedule_cache()
+            load_pro_lookups(season, timeout=1.0)
+        assert fetch.call_count == 2
+
+
+def _scoreboard(home_points: float, player_points: float) -> dict:
+    def side(team_id, total, points):
+        return {
+            "teamId": team_id,
+            "totalPoints": total,
+            "rosterForCurrentScoringPeriod": {
+                "entries": [
+                    {
+                        "playerId": team_id * 10,
+                        "lineupSlotId": 0,
+                        "playerPoolEntry": {
+                            "player": {
+                                "stats": [
+                                    {
+                                        "statSourceId": 0,
+                                        "scoringPeriodId": 5,
+                                        "appliedTotal": points,
+                                    }
+                                ]
+                            }
+                        },
+                    }
+                ]
+            },
+        }
+
+    return {
+        "schedule": [
+            {"id": 1, "matchupPeriodId": 5, "home": side(1, home_points, player_points),
+             "away": side(2, 50.0, 5.0)},
+            {"id": 2, "matchupPeriodId": 5, "home": side(3, 40.0, 4.0),
+             "away": side(4, 30.0, 3.0)},
+            {"id": 3, "matchupPeriodId": 4, "home": side(5, 1.0, 1.0), "away": side(6, 1.0, 1.0)},
+        ]
+    }
+
+
+class TestScoreboardWatcher:
+    """Tests for watch-mode change detection."""
+
+    def test_only_changed_matchups_reported(self):
+        client = MagicMock()
+        client.fetch_scoreboard.side_effect = [
+            _scoreboard(60.0, 6.0),
+            _scoreboard(60.0, 6.0),
+            _scoreboard(60.0, 8.0),
+        ]
+        watcher = ScoreboardWatcher(client, scoring_period=5)
+
+        _, first = watcher.poll()
+        _, second = watcher.poll()
+        _, third = watcher.poll()
+
+        assert [m["id"] for m in first] == [1, 2]
+        assert second == []
+        assert [m["id"] for m in third] == [1]
+
+    def test_polls_bypass_http_cache(self, tmp_path):
+        responses = []
+        for home_points, player_points in ((60.0, 6.0), (61.0, 7.0), (62.0, 8.0)):
+            response = MagicMock(status_code=200, url="https://example.test/league")
+            response.content = json.dumps(_scoreboard(home_points, player_points)).encode()
+            responses.append(response)
+        session = MagicMock()
+        session.get.side_effect = responses
+        configure_http_cache(tmp_path, mode="on")
+        try:
+            watcher = ScoreboardWatcher(LiveScoreClient(league_id=1, season=2024), 5)
+            with patch("rffl.core.transport._session", return_value=session):
+                polls = [watcher.poll()[1] for _ in range(3)]
+        finally:
+            configure_http_cache(mode="off")
+
+        assert session.get.call_count == 3
+        assert [[m["id"] for m in changed] for changed in polls] == [[1, 2], [1], [1]]
+        assert polls[2][0]["home"]["totalPoints"] == 62.0
+
+    def test_run_watch_stops_after_max_polls(self):
+        poll = MagicMock()
+        sleep = MagicMock()
+        run_watch(poll, interval=30.0, max_polls=3, sleep=sleep)
+        assert poll.call_count == 3
+        assert sleep.call_count == 2
+
+
+class TestAdaptivePollScheduler:
+    """Tests for the game-clock driven poll cadence."""
+
+    NOW = datetime(2025, 9, 14, 17, 0, tzinfo=timezone.utc)
+
+    @staticmethod
+    def _status(state, detail="", start_time=None):
+        return EventStatus(
+            state=state,
+            detail=detail,
+            short_detail=detail,
+            clock=None,
+            period=None,
+            start_time=start_time,
+        )
+
+    def _scheduler(self):
+        return AdaptivePollScheduler(MagicMock(), {}, 2, live_interval=15.0)
+
+    def test_live_game_polls_fast(self):
+        statuses = {1: self._status("in", "8:12 - 2nd"), 2: self._status("post")}
+        assert self._scheduler().delay_for(statuses, {}, self.NOW) == 15.0
+
+    def test_halftime_backs_off(self):
+        statuses = {1: self._status("in", "Halftime"), 2: self._status("pre")}
+        assert self._scheduler().delay_for(statuses, {}, self.NOW) == 120.0
+
+    def test_sleeps_until_next_kickoff(self):
+        kickoff = self.NOW + timedelta(minutes=25)
+        statuses = {1: self._status("post"), 2: self._status("pre", start_time=kickoff)}
+        assert self._scheduler().delay_for(statuses, {}, self.NOW) == 25 * 60
+
+    def test_long_gaps_are_capped_and_final_stops(self):
+        scheduler = self._scheduler()
+        kickoffs = {2: self.NOW + timedelta(days=1)}
+        assert scheduler.delay_for({2: None}, kickoffs, self.NOW) == 3600.0
+        assert scheduler.delay_for({1: self._status("post")}, {}, self.NOW) is None
+
+    def test_kickoff_times_from_pro_games(self):
+        epoch_ms = int(self.NOW.timestamp() * 1000)
+        pro_games = {(1, 2): {"id": 401, "date": epoch_ms}, (1, 3): {"id": 402, "date": 0}}
+        assert kickoff_times(pro_games, 2) == {401: self.NOW}
+
+
+def _player(minutes_remaining: float, baseline: float = 10.0, actual: float = 0.0) -> PlayerCard:
+    state = "post" if minutes_remaining == 0 else ("pre" if minutes_remaining == 60 else "in")
+    return PlayerCard(
+        slot_label="RB",
+        name="Player",
+        nfl_team="KC",
+        position="RB",
+        baseline=baseline,
+        actual=actual,
+        performance_pct=0.0,
+        time_played_pct=100.0 - minutes_remaining / 60.0 * 100.0,
+        minutes_remaining=minutes_remaining,
+        game_status="",
+        pace_indicator="",
+        game_state=state,
+    )
+
+
+def _team_report(name: str, abbrev: str, live_projection: float, minutes: list) -> TeamReport:
+    players = [_player(m) for m in minutes]
+    return TeamReport(
+        name=name,
+        actual_points=20.0,
+        live_projection=live_projection,
+        baseline_projection=sum(p.baseline for p in players),
+        minutes_remaining=sum(minutes),
+        players=players,
+        abbrev=abbrev,
+    )
+
+
+class TestLiveKORM:
+    """Tests for KORM scores built from the live report pipeline."""
+
+    def _reports(self):
+        return [
+            (
+                {"matchup_id": 1},
+                _team_report("Alpha", "AAA", 95.5, [0.0, 30.0, 60.0]),
+                _team_report("Bravo", "BBB", 0.0, [0.0, 0.0, 30.0]),
+            ),
+            ({"matchup_id": 2}, _team_report("Gone", "GON", 80.0, [0.0]), _team_report(
+                "Delta", "DDD", 70.0, [0.0, 0.0, 0.0]
+            )),
+        ]
+
+    def test_week_scores_use_live_projection_and_minutes(self):
+        tracker = KORMTracker()
+        tracker.add_team("Renamed Alpha", "AAA", 1)
+        tracker.add_team("Gone", "GON", 2)
+        tracker.record_strike("Gone", 1)
+        tracker.record_strike("Gone", 2)
+
+        scores = {s.team_name: s for s in korm_week_scores(self._reports(), 6, tracker)}
+
+        assert sorted(scores) == ["Alpha", "Bravo", "Delta"]
+        alpha = scores["Alpha"]
+        assert alpha.projected_score == 95.5
+        assert alpha.minutes_remaining == 90.0
+        assert (alpha.players_remaining, alpha.total_players) == (2, 3)
+        assert alpha.completion_pct == pytest.approx((540.0 - 90.0) / 540.0 * 100.0)
+        # No ESPN live projection: actual plus baselines scaled by time left
+        assert scores["Bravo"].projected_score == pytest.approx(25.0)
+        assert scores["Delta"].players_remaining == 0
+
+        report = KORMReportGenerator(tracker).generate_live_report(6, list(scores.values()))
+        assert "| Min Left |" in report
+        assert "**Alpha** | 20.00 | **95.5** | 83.3% | 90 | Active |" in report
+
+    def test_single_fetch(self):
+        with patch(
+            "rffl.live.korm.fetch_all_matchup_reports", return_value=(6, self._reports())
+        ) as fetch:
+            scores = fetch_korm_week_scores(league_id=1, season=2025, week=6)
+        assert fetch.call_count == 1
+        assert fetch.call_args.kwargs["scoring_period"] == 6
+        assert len(scores) == 4 and {s.week for s in scores} == {6}
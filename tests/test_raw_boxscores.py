@@ -0,0 +1,181 @@
+"""Tests for the raw-JSON boxscore engine."""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from espn_api.football.box_score import BoxScore
+
+from rffl.core.exceptions import RateLimitError
+from rffl.core.export import export_boxscores
+from rffl.core.raw_boxscores import SeasonStatus, iter_weeks_raw, parse_matchups
+from rffl.live.scores import LiveScoringError
+
+
+def _entry(player_id, name, slot, default_pos, eligible, pro_team, actual, projected, week=3):
+    return {
+        "lineupSlotId": slot,
+        "playerId": player_id,
+        "playerPoolEntry": {
+            "player": {
+                "id": player_id,
+                "fullName": name,
+                "defaultPositionId": default_pos,
+                "eligibleSlots": eligible,
+                "proTeamId": pro_team,
+                "stats": [
+                    {
+                        "seasonId": 2024,
+                        "scoringPeriodId": week,
+                        "statSourceId": 1,
+                        "statSplitTypeId": 1,
+                        "appliedTotal": projected,
+                    },
+                    {
+                        "seasonId": 2024,
+                        "scoringPeriodId": week,
+                        "statSourceId": 0,
+                        "statSplitTypeId": 1,
+                        "proTeamId": pro_team,
+                        "appliedTotal": actual,
+                    },
+                ],
+            }
+        },
+    }
+
+
+def _side(team_id, entries):
+    return {
+        "teamId": team_id,
+        "totalPoints": 100.0,
+        "rosterForCurrentScoringPeriod": {"entries": entries},
+    }
+
+
+PAYLOAD = {
+    "teams": [{"id": 1, "abbrev": "TEAM1"}, {"id": 2, "abbrev": "TEAM2"}],
+    "schedule": [
+        {
+            "matchupPeriodId": 3,
+            "home": _side(
+                1,
+                [
+                    _entry(11, "Patrick Mahomes", 0, 1, [0, 7, 20, 21], 12, 21.456, 19.2),
+                    _entry(12, "Travis Kelce", 23, 4, [5, 6, 23, 7, 20, 21], 12, 8.1, 11.0),
+                    _entry(13, "Chiefs D/ST", 16, 16, [16, 20, 21], 12, 4.0, 6.0),
+                    _entry(14, "Bench Guy", 20, 2, [2, 3, 23, 7, 20, 21], 28, 3.3, 5.5),
+                ],
+            ),
+            "away": _side(2, [_entry(21, "Josh Allen", 0, 1, [0, 7, 20, 21], 2, 30.0, 22.0)]),
+        }
+    ],
+}
+
+
+class TestParseMatchups:
+    """The raw parser must agree with espn_api's BoxScore/BoxPlayer."""
+
+    def test_matches_espn_api_box_players(self):
+        (sides,) = parse_matchups(PAYLOAD, week=3, year=2024)
+        reference = BoxScore(PAYLOAD["schedule"][0], {}, {}, 3, 2024)
+
+        assert [abbrev for abbrev, _ in sides] == ["TEAM1", "TEAM2"]
+        for (_, raw_lineup), espn_lineup in zip(
+            sides, (reference.home_lineup, reference.away_lineup)
+        ):
+            assert len(raw_lineup) == len(espn_lineup)
+            for raw, espn in zip(raw_lineup, espn_lineup):
+                assert raw.name == espn.name
+                assert raw.position == espn.position
+                assert raw.proTeam == espn.proTeam
+                assert raw.points == espn.points
+                assert raw.projected_points == espn.projected_points
+
+    def test_bye_side_has_no_team(self):
+        payload = {"teams": [], "schedule": [{"home": _side(9, [])}]}
+        (sides,) = parse_matchups(payload, week=3, year=2024)
+        assert sides == [("Unknown", []), (None, [])]
+
+
+class TestSeasonStatus:
+    """Week to matchup-period mapping mirrors League.box_scores."""
+
+    def test_periods_for(self):
+        status = SeasonStatus.from_settings(
+            {
+                "scoringPeriodId": 19,
+                "status": {"currentMatchupPeriod": 17, "finalScoringPeriod": 17},
+                "settings": {"scheduleSettings": {"matchupPeriods": {"1": [1], "16": [16, 17]}}},
+            },
+            2024,
+        )
+        assert status.periods_for(1) == (1, 1)
+        assert status.periods_for(17) == (17, 16)
+        assert status.periods_for(18) == (17, 17)
+
+    def test_last_completed_week(self):
+        in_season = {"scoringPeriodId": 6, "status": {"finalScoringPeriod": 17, "isActive": True}}
+        finished = {"scoringPeriodId": 17, "status": {"finalScoringPeriod": 17, "isActive": False}}
+        assert SeasonStatus.from_settings(in_season, 2024).last_completed_week == 5
+        assert SeasonStatus.from_settings(finished, 2024).last_completed_week == 17
+
+    def test_seasons_before_2019_yield_nothing(self):
+        client = MagicMock()
+        assert list(iter_weeks_raw(client, 2018, 1, 2)) == []
+        client.fetch_settings.assert_not_called()
+
+    def test_rate_limit_is_not_a_skipped_week(self):
+        client = MagicMock()
+        client.fetch_settings.return_value = {
+            "scoringPeriodId": 6,
+            "status": {"finalScoringPeriod": 17, "isActive": True},
+        }
+        rejected = LiveScoringError("ESPN returned 404")
+        rejected.__cause__ = None
+        limited = LiveScoringError("rate limited")
+        limited.__cause__ = RateLimitError("ESPN rate limit persisted after 3 retries")
+
+        client.fetch_boxscores.side_effect = rejected
+        assert list(iter_weeks_raw(client, 2024, 1, 2)) == []
+
+        client.fetch_boxscores.side_effect = limited
+        with pytest.raises(RateLimitError):
+            list(iter_weeks_raw(client, 2024, 1, 2))
+
+
+@pytest.fixture
+def repo_root(tmp_path):
+    teams_dir = tmp_path / "data" / "teams"
+    teams_dir.mkdir(parents=True)
+    (teams_dir / "alias_mapping.yaml").write_text("aliases: []\n")
+    (teams_dir / "canonical_teams.csv").write_text(
+        "season_year,team_code,team_full_name,is_co_owned,owner_code_1,owner_code_2\n"
+    )
+    return tmp_path
+
+
+def test_export_raw_engine_matches_espn_api_engine(repo_root, tmp_path):
+    """Both engines write byte-identical CSVs for the same league JSON."""
+    settings = {
+        "scoringPeriodId": 3,
+        "status": {"currentMatchupPeriod": 3, "finalScoringPeriod": 17},
+        "settings": {"scheduleSettings": {"matchupPeriods": {"3": [3]}}},
+    }
+    reference = BoxScore(PAYLOAD["schedule"][0], {}, {}, 3, 2024)
+    reference.home_team = MagicMock(team_abbrev="TEAM1", spec=["team_abbrev"])
+    reference.away_team = MagicMock(team_abbrev="TEAM2", spec=["team_abbrev"])
+
+    espn_out = tmp_path / "espn.csv"
+    with patch("rffl.core.export.ESPNClient") as mock_client:
+        mock_client.return_value.get_boxscores.return_value = [reference]
+        export_boxscores(323196, 2024, espn_out, 3, 3, repo_root=repo_root)
+
+    raw_out = tmp_path / "raw.csv"
+    with patch("rffl.live.scores.LiveScoreClient.fetch_settings", return_value=settings), patch(
+        "rffl.live.scores.LiveScoreClient.fetch_boxscores", return_value=PAYLOAD
+    ):
+        export_boxscores(323196, 2024, raw_out, 3, 3, repo_root=repo_root, engine="raw")
+
+    assert raw_out.read_text() == espn_out.read_text()
+    assert len(pd.read_csv(raw_out)) == 5
@@ -0,0 +1,61 @@
+"""Tests for the indexed team registry accessors."""
+
+from rffl.core import registry
+from rffl.core.registry import (
+    REGISTRY,
+    get_co_owned_teams,
+    get_owner_history,
+    get_team,
+    get_team_history,
+    get_teams_by_season,
+    get_unique_owners,
+    validate_registry,
+)
+from rffl.core.utils import load_canonical_meta
+
+
+class TestIndexedAccessors:
+    """Indexed lookups return exactly what a scan of REGISTRY would."""
+
+    def test_get_team(self):
+        for team in REGISTRY:
+            assert get_team(team.team_code, team.season_year) is team
+        assert get_team("PCX", 1999) is None
+
+    def test_season_and_team_history(self):
+        assert get_teams_by_season(2011) == [t for t in REGISTRY if t.season_year == 2011]
+        assert get_teams_by_season(1999) == []
+        history = get_team_history("PCX")
+        assert history == sorted(
+            (t for t in REGISTRY if t.team_code == "PCX"), key=lambda t: t.season_year
+        )
+
+    def test_owner_history_includes_co_owners(self):
+        for owner in get_unique_owners():
+            expected = sorted(
+                (t for t in REGISTRY if owner in (t.owner_code_1, t.owner_code_2)),
+                key=lambda t: t.season_year,
+            )
+            assert get_owner_history(owner) == expected
+        assert get_owner_history("NOBODY") == []
+
+    def test_co_owned(self):
+        assert get_co_owned_teams() == [t for t in REGISTRY if t.is_co_owned]
+        assert get_co_owned_teams(2025) == [
+            t for t in REGISTRY if t.is_co_owned and t.season_year == 2025
+        ]
+
+    def test_results_are_copies(self):
+        get_teams_by_season(2025).clear()
+        assert len(get_teams_by_season(2025)) == 12
+        assert isinstance(registry._BY_SEASON[2025], tuple)
+
+    def test_registry_still_validates(self):
+        assert validate_registry()["all_valid"]
+
+
+def test_canonical_meta_is_built_once():
+    meta = load_canonical_meta()
+    assert load_canonical_meta() is meta
+    assert meta[(2025, "GFM")]["is_co_owned"] == "Yes"
+    assert len(meta) == len(REGISTRY)
@@ -0,0 +1,176 @@
+"""Tests for stat-corrections scraping."""
+
+import asyncio
+from unittest.mock import patch
+
+import pandas as pd  # type: ignore[import-untyped]
+import requests  # type: ignore[import-untyped]
+
+from rffl.core import stat_corrections
+from rffl.core.stat_corrections import (
+    StatCorrectionRow,
+    _rows_from_table_html,
+    _scrape_weeks,
+    _should_block,
+    diff_boxscore_points,
+)
+
+
+def _row(week: int) -> StatCorrectionRow:
+    return StatCorrectionRow(
+        season_year=2024,
+        week=week,
+        player_id=None,
+        player_name="Player",
+        team_id=None,
+        team_code=None,
+        stat_id=None,
+        stat_name="Rushing Yards",
+        original_value="10",
+        corrected_value="12",
+        points_impact="0.2",
+        correction_date=None,
+    )
+
+
+class FakeBrowser:
+    """Stands in for StatCorrectionsBrowser; records how it was used."""
+
+    instances: list["FakeBrowser"] = []
+
+    def __init__(self, session, pages=4):
+        self.pages = pages
+        self.scraped: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        FakeBrowser.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def scrape(self, league_id, year, week):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        self.scraped.append(week)
+        if week == 3:
+            raise RuntimeError("page crashed")
+        return [] if week == 2 else [_row(week)]
+
+
+class TestScrapeWeeks:
+    """One browser per run, with the HTML scraper as per-week fallback."""
+
+    def test_shares_one_browser_and_falls_back_per_week(self):
+        FakeBrowser.instances = []
+        fallback_weeks = []
+
+        def fake_html(league_id, year, week, session):
+            fallback_weeks.append(week)
+            return [_row(week)]
+
+        with patch.object(stat_corrections, "PLAYWRIGHT_AVAILABLE", True), patch.object(
+            stat_corrections, "StatCorrectionsBrowser", FakeBrowser
+        ), patch.object(stat_corrections, "_scrape_stat_corrections_html", fake_html):
+            results = asyncio.run(_scrape_weeks(1, 2024, [1, 2, 3, 4], requests.Session()))
+
+        (browser,) = FakeBrowser.instances
+        assert sorted(browser.scraped) == [1, 2, 3, 4]
+        assert browser.max_in_flight > 1
+        assert sorted(fallback_weeks) == [2, 3]
+        assert list(results) == [1, 2, 3, 4]
+        assert all(rows[0].week == week for week, rows in results.items())
+
+    def test_without_playwright_uses_html_for_every_week(self):
+        with patch.object(stat_corrections, "PLAYWRIGHT_AVAILABLE", False), patch.object(
+            stat_corrections, "_scrape_stat_corrections_html", return_value=[]
+        ) as fake_html:
+            results = asyncio.run(_scrape_weeks(1, 2024, [5, 6], requests.Session()))
+
+        assert results == {5: [], 6: []}
+        assert fake_html.call_count == 2
+
+
+def test_should_block_assets_and_analytics():
+    assert _should_block("image", "https://a.espncdn.com/logo.png")
+    assert _should_block("font", "https://a.espncdn.com/font.woff2")
+    assert _should_block("script", "https://www.googletagmanager.com/gtm.js")
+    assert not _should_block("script", "https://fantasy.espn.com/_next/static/app.js")
+    assert not _should_block("fetch", "https://lm-api-reads.fantasy.espn.com/apis/v3")
+
+
+def test_rows_from_table_html_skips_header_and_short_rows():
+    html = (
+        "<tr><th>Player</th><th>Stat</th><th>Old</th><th>New</th><th>Pts</th></tr>"
+        "<tr><td>Josh Allen</td><td>Rushing Yards</td><td>40</td><td>44</td><td>0.4</td></tr>"
+        "<tr><td>only</td><td>two</td></tr>"
+    )
+    (row,) = _rows_from_table_html(f"<table>{html}</table>", 2024, 3)
+    assert (row.player_name, row.corrected_value, row.points_impact) == (
+        "Josh Allen",
+        "44",
+        "0.4",
+    )
+
+
+def _box(rows):
+    """Build boxscores.csv-shaped frame from (week, matchup, team, player, pts, starter)."""
+    records = []
+    for week, matchup, team, player, points, starter in rows:
+        records.append(
+            {
+                "week": week,
+                "matchup": matchup,
+                "team_code": team,
+                "player_name": player,
+                "is_placeholder": "No",
+                "slot_type": "starters" if starter else "bench",
+                "rs_actual_pf": points,
+            }
+        )
+    df = pd.DataFrame(records)
+    starters = df[df["slot_type"] == "starters"]
+    totals = starters.groupby(["week", "team_code"])["rs_actual_pf"].sum().round(2)
+    df["team_actual_total"] = [totals[(w, t)] for w, t in zip(df["week"], df["team_code"])]
+    return df
+
+
+class TestDiffBoxscorePoints:
+    """Diff mode turns point deltas into correction rows."""
+
+    STORED = [
+        (1, 1, "AAA", "Qb A", 20.0, True),
+        (1, 1, "AAA", "Bench A", 5.0, False),
+        (1, 1, "BBB", "Qb B", 21.0, True),
+        (2, 1, "AAA", "Qb A", 10.0, True),
+        (2, 1, "BBB", "Qb B", 9.0, True),
+    ]
+
+    def test_no_changes_no_rows(self):
+        assert diff_boxscore_points(_box(self.STORED), _box(self.STORED), 2024) == []
+
+    def test_player_team_and_result_impact(self):
+        current = list(self.STORED)
+        current[0] = (1, 1, "AAA", "Qb A", 22.5, True)  # flips week 1
+        current[1] = (1, 1, "AAA", "Bench A", 6.0, False)  # bench only
+
+        rows = diff_boxscore_points(_box(self.STORED), _box(current), 2024, "2024-09-20")
+
+        assert [(r.week, r.team_code, r.stat_id) for r in rows] == [
+            (1, "AAA", "fantasy_points"),
+            (1, "AAA", "fantasy_points"),
+            (1, "AAA", "team_total"),
+            (1, "AAA", "matchup_result"),
+            (1, "BBB", "matchup_result"),
+        ]
+        qb = rows[0]
+        assert (qb.player_name, qb.original_value, qb.corrected_value) == ("Qb A", "20.00", "22.50")
+        assert qb.points_impact == "+2.50"
+        assert (rows[2].original_value, rows[2].corrected_value) == ("20.00", "22.50")
+        assert (rows[3].original_value, rows[3].corrected_value) == ("L", "W")
+        assert (rows[4].original_value, rows[4].corrected_value) == ("W", "L")
+        assert {r.correction_date for r in rows} == {"2024-09-20"}
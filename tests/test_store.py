@@ -0,0 +1,147 @@
+"""Tests for the SQLite season store."""
+
+import os
+import sqlite3
+
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from rffl.core.store import SeasonStore, build_store
+
+
+def _teamweek(year: int, scores: dict[str, float]) -> pd.DataFrame:
+    (a, a_pts), (b, b_pts) = scores.items()
+    rows = []
+    for team, opp, pts, opp_pts in ((a, b, a_pts, b_pts), (b, a, b_pts, a_pts)):
+        rows.append(
+            {
+                "season_year": year,
+                "week": 1,
+                "matchup": 1,
+                "team_code": team,
+                "is_co_owned?": "No",
+                "team_owner_1": f"{team}_OWNER",
+                "team_owner_2": None,
+                "opponent_code": opp,
+                "opp_is_co_owned?": "No",
+                "opp_owner_1": f"{opp}_OWNER",
+                "opp_owner_2": None,
+                "team_projected_total": 100.0,
+                "team_actual_total": pts,
+                "opp_actual_total": opp_pts,
+                "result": "W" if pts > opp_pts else "L",
+                "margin": round(pts - opp_pts, 2),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def repo_root(tmp_path):
+    for year, scores in ((2023, {"AAA": 101.5, "BBB": 88.0}), (2024, {"AAA": 90.0, "BBB": 95.25})):
+        season_dir = tmp_path / "data" / "seasons" / str(year)
+        (season_dir / "reports").mkdir(parents=True)
+        _teamweek(year, scores).to_csv(season_dir / "reports" / "teamweek_unified.csv", index=False)
+        pd.DataFrame(
+            [
+                {
+                    "year": year,
+                    "round": 1,
+                    "round_pick": 1,
+                    "team_abbrev": "AAA",
+                    "player_id": 3918298,
+                    "player_name": "Josh Allen",
+                    "bid_amount": 0.0,
+                    "keeper": False,
+                    "nominating_team": None,
+                }
+            ]
+        ).to_csv(season_dir / "draft.csv", index=False)
+    return tmp_path
+
+
+class TestBuildStore:
+    """Building loads every season file once and only reloads changes."""
+
+    def test_loads_tables_and_indexes(self, repo_root, tmp_path):
+        db = tmp_path / "store.sqlite3"
+        loaded = build_store(repo_root, db)
+
+        assert loaded["teamweek"] == 4
+        assert loaded["draft"] == 2
+        assert loaded["boxscores"] == 0
+        assert loaded["registry"] > 0
+        conn = sqlite3.connect(db)
+        indexes = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        conn.close()
+        assert "idx_boxscores_season_year_week_team_code" in indexes
+        assert "idx_boxscores_player_name" in indexes
+        assert "idx_teamweek_season_year_week_team_code" in indexes
+
+    def test_rebuild_skips_unchanged_and_reloads_changed(self, repo_root, tmp_path):
+        db = tmp_path / "store.sqlite3"
+        build_store(repo_root, db)
+        assert build_store(repo_root, db)["teamweek"] == 0
+
+        path = repo_root / "data" / "seasons" / "2024" / "reports" / "teamweek_unified.csv"
+        _teamweek(2024, {"AAA": 120.0, "BBB": 95.25}).to_csv(path, index=False)
+        mtime = path.stat().st_mtime + 5
+        os.utime(path, (mtime, mtime))
+
+        assert build_store(repo_root, db)["teamweek"] == 2
+        with SeasonStore(db) as store:
+            assert store.weekly_scores(2024, 14) == {1: {"AAA": 120.0, "BBB": 95.25}}
+            assert len(store.team_weeks()) == 4
+
+    def test_removed_file_drops_season_rows(self, repo_root, tmp_path):
+        db = tmp_path / "store.sqlite3"
+        build_store(repo_root, db)
+        (repo_root / "data" / "seasons" / "2023" / "draft.csv").unlink()
+        build_store(repo_root, db)
+        with SeasonStore(db) as store:
+            assert store.draft()["season_year"].tolist() == [2024]
+
+
+class TestSeasonStore:
+    """Query helpers and read-only access."""
+
+    def test_lookups(self, repo_root, tmp_path):
+        db = tmp_path / "store.sqlite3"
+        build_store(repo_root, db)
+        with SeasonStore(db) as store:
+            assert store.seasons() == [2023, 2024]
+            team = store.team_weeks(team_code="AAA")
+            assert team["result"].tolist() == ["W", "L"]
+            assert "is_co_owned" in team.columns
+            assert store.draft(season=2023, team_code="AAA")["player_name"].tolist() == [
+                "Josh Allen"
+            ]
+            assert not store.registry(season=2024).empty
+
+    def test_weekly_scores_from_h2h_only_season(self, repo_root, tmp_path):
+        season_dir = repo_root / "data" / "seasons" / "2012"
+        season_dir.mkdir()
+        (season_dir / "h2h.csv").write_text(
+            "week,matchup,home_team,away_team,home_score,away_score,winner,margin\n"
+            "1,1,GOW,BBRS,112.0,119.0,BBRS,7.0\n"
+            "2,1,BBRS,GOW,98.5,101.0,GOW,2.5\n"
+        )
+        db = tmp_path / "store.sqlite3"
+        assert build_store(repo_root, db)["h2h"] == 2
+        with SeasonStore(db) as store:
+            assert store.h2h(season=2012, week=2)["winner"].tolist() == ["GOW"]
+            assert store.weekly_scores(2012, 1) == {1: {"BBRS": 119.0, "GOW": 112.0}}
+            assert store.weekly_scores(2012, 14)[2] == {"BBRS": 98.5, "GOW": 101.0}
+            assert store.weekly_scores(2023, 14) == {1: {"AAA": 101.5, "BBB": 88.0}}
+
+    def test_store_is_read_only(self, repo_root, tmp_path):
+        db = tmp_path / "store.sqlite3"
+        build_store(repo_root, db)
+        with SeasonStore(db) as store, pytest.raises(Exception, match="readonly"):
+            store.query("DELETE FROM teamweek")
+
+    def test_missing_store(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="rffl query build"):
+            SeasonStore(tmp_path / "missing.sqlite3")
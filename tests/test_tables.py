@@ -0,0 +1,103 @@
+"""Tests for CSV/Parquet season table helpers."""
+
+import os
+
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from rffl.core import tables
+from rffl.core.schemas import TEAMWEEK_SCHEMA
+from rffl.core.tables import read_table, resolve_table, table_exists, with_format, write_frame
+from rffl.core.teamweek import generate_teamweek_unified
+
+pytest.importorskip("pyarrow")
+
+
+def _teamweek_frame() -> pd.DataFrame:
+    row = {column: None for column in TEAMWEEK_SCHEMA}
+    row.update(
+        season_year=2024,
+        week=1,
+        matchup=1,
+        team_code="AAA",
+        team_projected_total=101.5,
+        team_actual_total=110.25,
+        opponent_code="BBB",
+        result="W",
+    )
+    return pd.DataFrame([row])
+
+
+class TestResolveTable:
+    """Parquet siblings are preferred only when they are current."""
+
+    def test_csv_only(self, tmp_path):
+        csv_path = tmp_path / "boxscores.csv"
+        csv_path.write_text("a\n1\n")
+        assert resolve_table(csv_path) == csv_path
+
+    def test_prefers_newer_parquet(self, tmp_path):
+        csv_path = tmp_path / "boxscores.csv"
+        csv_path.write_text("a\n1\n")
+        parquet_path = tmp_path / "boxscores.parquet"
+        pd.DataFrame({"a": [2]}).to_parquet(parquet_path)
+        assert resolve_table(csv_path) == parquet_path
+        assert read_table(csv_path)["a"].tolist() == [2]
+
+    def test_stale_parquet_is_ignored(self, tmp_path):
+        csv_path = tmp_path / "boxscores.csv"
+        csv_path.write_text("a\n1\n")
+        parquet_path = tmp_path / "boxscores.parquet"
+        pd.DataFrame({"a": [2]}).to_parquet(parquet_path)
+        mtime = csv_path.stat().st_mtime
+        os.utime(parquet_path, (mtime - 60, mtime - 60))
+        assert resolve_table(csv_path) == csv_path
+
+    def test_parquet_without_pyarrow_is_ignored(self, tmp_path, monkeypatch):
+        csv_path = tmp_path / "boxscores.csv"
+        pd.DataFrame({"a": [2]}).to_parquet(tmp_path / "boxscores.parquet")
+        monkeypatch.setattr(tables, "parquet_available", lambda: False)
+        assert not table_exists(csv_path)
+
+    def test_parquet_only_counts_as_existing(self, tmp_path):
+        csv_path = tmp_path / "boxscores.csv"
+        pd.DataFrame({"a": [2]}).to_parquet(tmp_path / "boxscores.parquet")
+        assert table_exists(csv_path)
+
+
+def test_write_frame_parquet_uses_schema_types(tmp_path):
+    path = write_frame(_teamweek_frame(), tmp_path / "teamweek.parquet", TEAMWEEK_SCHEMA)
+    df = pd.read_parquet(path)
+    assert list(df.columns) == list(TEAMWEEK_SCHEMA)
+    assert str(df["week"].dtype) == "int32"
+    assert df.loc[0, "team_actual_total"] == 110.25
+
+
+def test_teamweek_reads_parquet_boxscores(tmp_path):
+    csv_path = tmp_path / "boxscores.csv"
+    rows = []
+    for team, opp, actual in (("AAA", "BBB", 100.0), ("BBB", "AAA", 90.0)):
+        rows.append(
+            {
+                "season_year": 2024,
+                "week": 1,
+                "matchup": 1,
+                "team_code": team,
+                "is_co_owned?": "No",
+                "team_owner_1": team,
+                "team_owner_2": None,
+                "team_projected_total": 95.0,
+                "team_actual_total": actual,
+                "slot_type": "starters",
+                "slot": "QB",
+                "player_name": f"{team} QB",
+                "rs_projected_pf": 95.0,
+                "rs_actual_pf": actual,
+            }
+        )
+    pd.DataFrame(rows).to_parquet(with_format(csv_path, "parquet"))
+
+    out = generate_teamweek_unified(csv_path, tmp_path / "reports" / "teamweek_unified.parquet")
+    written = pd.read_parquet(tmp_path / "reports" / "teamweek_unified.parquet")
+    assert len(out) == len(written) == 2
+    assert dict(zip(written["team_code"], written["result"])) == {"AAA": "W", "BBB": "L"}
@@ -0,0 +1,73 @@
+"""Tests for teamweek_unified generation."""
+
+import pandas as pd  # type: ignore[import-untyped]
+
+from rffl.core.schemas import TEAMWEEK_SCHEMA
+from rffl.core.teamweek import build_teamweek, generate_teamweek_all
+
+
+def _boxscores(year: int, matchups: list[tuple[int, int, str, float]]) -> pd.DataFrame:
+    """Two player rows per (week, matchup, team, actual total)."""
+    rows = []
+    for week, matchup, team, actual in matchups:
+        for player in ("QB", "RB"):
+            rows.append(
+                {
+                    "season_year": year,
+                    "week": week,
+                    "matchup": matchup,
+                    "team_code": team,
+                    "is_co_owned?": "Yes" if team == "CCC" else "No",
+                    "team_owner_1": f"{team}_1",
+                    "team_owner_2": f"{team}_2" if team == "CCC" else None,
+                    "team_projected_total": 100.0,
+                    "team_actual_total": actual,
+                    "slot": player,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+class TestBuildTeamweek:
+    """Opponents are paired by self-merge with column-wise results."""
+
+    def test_pairs_opponents_and_results(self):
+        df = _boxscores(
+            2024,
+            [
+                (1, 1, "BBB", 90.5),
+                (1, 1, "AAA", 100.25),
+                (1, 2, "CCC", 80.0),
+                (1, 2, "DDD", 80.0),
+                (1, 3, "EEE", 70.0),  # no opponent
+            ],
+        )
+        result = build_teamweek(df)
+
+        assert list(result.columns) == list(TEAMWEEK_SCHEMA)
+        assert result["team_code"].tolist() == ["AAA", "BBB", "CCC", "DDD"]
+        assert result["opponent_code"].tolist() == ["BBB", "AAA", "DDD", "CCC"]
+        assert result["result"].tolist() == ["W", "L", "T", "T"]
+        assert result["margin"].tolist() == [9.75, -9.75, 0.0, 0.0]
+        ccc, ddd = result.iloc[2], result.iloc[3]
+        assert (ccc["team_owner_2"], ccc["opp_owner_2"]) == ("CCC_2", "")
+        assert (ddd["opp_is_co_owned?"], ddd["opp_owner_2"]) == ("Yes", "CCC_2")
+
+
+def test_generate_teamweek_all_splits_by_season(tmp_path):
+    for year in (2023, 2024):
+        season_dir = tmp_path / str(year)
+        season_dir.mkdir()
+        _boxscores(year, [(1, 1, "AAA", 100.0), (1, 1, "BBB", 90.0)]).to_csv(
+            season_dir / "boxscores.csv", index=False
+        )
+    (tmp_path / "2025").mkdir()  # no boxscores yet
+
+    written = generate_teamweek_all(tmp_path)
+
+    assert sorted(written) == [2023, 2024]
+    for year, path in written.items():
+        assert path == tmp_path / str(year) / "reports" / "teamweek_unified.csv"
+        assert pd.read_csv(path)["season_year"].unique().tolist() == [year]
+    assert generate_teamweek_all(tmp_path) == {}
+    assert sorted(generate_teamweek_all(tmp_path, seasons=[2024], force=True)) == [2024]
@@ -0,0 +1,189 @@
+"""Tests for the shared HTTP transport and response cache."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rffl.core.exceptions import CacheMissError, RateLimitError
+from rffl.core.transport import (
+    ResponseCache,
+    TokenBucket,
+    backoff_delay,
+    cache_key,
+    configure_http_cache,
+    configure_rate_limit,
+    http_get,
+    season_is_complete,
+    ttl_for,
+)
+
+
+@pytest.fixture
+def reset_transport():
+    """Restore the process-wide transport to its default (uncached) state."""
+    yield
+    configure_http_cache(mode="off")
+    configure_rate_limit()
+
+
+def _fake_response(body: bytes = b'{"ok": true}', status: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.url = "https://example.test/resource"
+    response.status_code = status
+    response.content = body
+    response.headers = {}
+    return response
+
+
+class TestCacheKey:
+    """Tests for cache key construction."""
+
+    def test_param_order_does_not_matter(self):
+        a = cache_key("https://x.test/a?view=mTeam", {"scoringPeriodId": 3})
+        b = cache_key("https://x.test/a", [("scoringPeriodId", "3"), ("view", "mTeam")])
+        assert a == b
+
+    def test_filter_header_and_cookies_change_key(self):
+        base = cache_key("https://x.test/a")
+        assert cache_key("https://x.test/a", headers={"X-Fantasy-Filter": "{}"}) != base
+        assert cache_key("https://x.test/a", cookies={"SWID": "abc"}) != base
+        assert cache_key("https://x.test/a", headers={"User-Agent": "rffl"}) == base
+
+
+class TestTTL:
+    """Tests for TTL selection."""
+
+    def test_season_is_complete(self):
+        assert season_is_complete(2024, today=date(2025, 3, 1))
+        assert not season_is_complete(2024, today=date(2025, 1, 15))
+
+    def test_completed_season_never_expires(self):
+        url = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons/2019"
+        assert ttl_for(url, {"view": "mLiveScoring"}) is None
+
+    def test_live_scoring_rule(self):
+        season = date.today().year + 1
+        url = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons/{season}"
+        assert ttl_for(url, {"view": "mLiveScoring"}) == 15.0
+        assert ttl_for(url, {"view": "mTeam"}) == 300.0
+
+
+class TestResponseCache:
+    """Tests for the SQLite response store."""
+
+    def test_store_and_lookup(self, tmp_path):
+        cache = ResponseCache(tmp_path / "c.sqlite3")
+        cache.store("k", "https://x.test", b"body", ttl=None)
+        assert cache.lookup("k") == b"body"
+        assert cache.lookup("missing") is None
+        cache.close()
+
+    def test_expired_entry_only_served_when_stale_allowed(self, tmp_path):
+        cache = ResponseCache(tmp_path / "c.sqlite3")
+        cache.store("k", "https://x.test", b"body", ttl=-1)
+        assert cache.lookup("k") is None
+        assert cache.lookup("k", allow_stale=True) == b"body"
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResponseCache(tmp_path / "c.sqlite3", max_bytes=10)
+        cache.store("a", "u", b"12345", ttl=None)
+        cache.store("b", "u", b"12345", ttl=None)
+        cache.lookup("a")
+        cache.store("c", "u", b"12345", ttl=None)
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") == b"12345"
+        assert cache.stats() == {"entries": 2, "bytes": 10}
+        cache.close()
+
+
+class TestHttpGet:
+    """Tests for http_get cache modes."""
+
+    def test_on_mode_records_and_serves(self, tmp_path, reset_transport):
+        configure_http_cache(tmp_path, mode="on")
+        session = MagicMock()
+        session.get.return_value = _fake_response()
+        with patch("rffl.core.transport._session", return_value=session):
+            first = http_get("https://example.test/resource", params={"view": "mTeam"})
+            second = http_get("https://example.test/resource", params={"view": "mTeam"})
+        assert session.get.call_count == 1
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.json() == {"ok": True}
+
+    def test_refresh_request_skips_cached_copy(self, tmp_path, reset_transport):
+        configure_http_cache(tmp_path, mode="on")
+        session = MagicMock()
+        session.get.side_effect = [_fake_response(b'{"n": 1}'), _fake_response(b'{"n": 2}')]
+        with patch("rffl.core.transport._session", return_value=session):
+            http_get("https://example.test/resource")
+            fresh = http_get("https://example.test/resource", refresh=True)
+            cached = http_get("https://example.test/resource")
+        assert session.get.call_count == 2
+        assert not fresh.from_cache and fresh.json() == {"n": 2}
+        assert cached.from_cache and cached.json() == {"n": 2}
+
+    def test_error_responses_not_recorded(self, tmp_path, reset_transport):
+        configure_http_cache(tmp_path, mode="on")
+        configure_rate_limit(max_retries=0)
+        session = MagicMock()
+        session.get.return_value = _fake_response(b"", status=500)
+        with patch("rffl.core.transport._session", return_value=session):
+            http_get("https://example.test/resource")
+            http_get("https://example.test/resource")
+        assert session.get.call_count == 2
+
+    def test_replay_miss_raises(self, tmp_path, reset_transport):
+        configure_http_cache(tmp_path, mode="replay")
+        with pytest.raises(CacheMissError):
+            http_get("https://example.test/never-recorded")
+
+    def test_invalid_mode_rejected(self, tmp_path, reset_transport):
+        with pytest.raises(ValueError):
+            configure_http_cache(tmp_path, mode="sometimes")  # type: ignore[arg-type]
+
+
+class TestRetryAndRateLimit:
+    """Tests for throttling and retry behaviour."""
+
+    def test_retries_server_errors_then_succeeds(self, reset_transport):
+        session = MagicMock()
+        session.get.side_effect = [_fake_response(status=503), _fake_response()]
+        with patch("rffl.core.transport._session", return_value=session), patch(
+            "rffl.core.transport.time.sleep"
+        ) as sleep:
+            response = http_get("https://example.test/resource")
+        assert response.status_code == 200
+        assert session.get.call_count == 2
+        assert sleep.call_count == 1
+
+    def test_persistent_429_raises_rate_limit_error(self, reset_transport):
+        configure_rate_limit(max_retries=2)
+        throttled = _fake_response(status=429)
+        throttled.headers = {"Retry-After": "3"}
+        session = MagicMock()
+        session.get.return_value = throttled
+        with patch("rffl.core.transport._session", return_value=session), patch(
+            "rffl.core.transport.time.sleep"
+        ) as sleep:
+            with pytest.raises(RateLimitError):
+                http_get("https://example.test/resource")
+        assert session.get.call_count == 3
+        assert [c.args[0] for c in sleep.call_args_list] == [3.0, 3.0]
+
+    def test_backoff_delay_is_bounded(self):
+        for attempt in range(10):
+            assert 0 <= backoff_delay(attempt) <= 30.0
+
+    def test_token_bucket_throttles_after_burst(self):
+        clock = [0.0, 0.0, 0.0, 0.0, 0.1]
+        with patch("rffl.core.transport.time.sleep") as sleep:
+            with patch("rffl.core.transport.time.monotonic", side_effect=clock):
+                bucket = TokenBucket(rate=10.0, capacity=2)
+                bucket.acquire()
+                bucket.acquire()
+                bucket.acquire()
+        assert sleep.call_count == 1
+        assert sleep.call_args.args[0] == pytest.approx(0.1)
@@ -0,0 +1,97 @@
+"""Tests for streaming export writers."""
+
+import io
+
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from rffl.core.exceptions import ValidationError
+from rffl.core.export import CleanCheck, Row, row_values
+from rffl.core.schemas import BOXSCORE_SCHEMA
+from rffl.core.writers import CsvRowWriter, RowWriter, open_row_writer
+
+COLUMNS = list(BOXSCORE_SCHEMA)
+
+
+def _row(slot="QB", slot_type="starters", proj=10.0, act=12.5, team_proj=10.0, team_act=12.5):
+    return Row(
+        season_year=2024,
+        week=1,
+        matchup=1,
+        team_code="TEAM1",
+        is_co_owned="No",
+        team_owner_1="OWNER",
+        team_owner_2="",
+        team_projected_total=team_proj,
+        team_actual_total=team_act,
+        slot_type=slot_type,
+        slot=slot,
+        player_name="Player, Jr.",
+        nfl_team=None,
+        position="QB",
+        is_placeholder="No",
+        issue_flag="",
+        rs_projected_pf=proj,
+        rs_actual_pf=act,
+    )
+
+
+class TestCsvRowWriter:
+    """CSV output must match pandas' to_csv byte for byte."""
+
+    def test_matches_pandas_to_csv(self, tmp_path):
+        rows = [row_values(_row()), row_values(_row(slot="BE", slot_type="bench", act=0.0))]
+        path = tmp_path / "out.csv"
+        with open_row_writer(path, COLUMNS) as writer:
+            for values in rows:
+                writer.write(values)
+
+        expected = io.StringIO()
+        pd.DataFrame(rows, columns=COLUMNS).to_csv(expected, index=False)
+        assert path.read_text() == expected.getvalue()
+        assert writer.rows_written == 2
+
+    def test_failure_keeps_existing_file(self, tmp_path):
+        path = tmp_path / "out.csv"
+        path.write_text("previous\n")
+        with pytest.raises(RuntimeError):
+            with CsvRowWriter(path, COLUMNS) as writer:
+                writer.write(row_values(_row()))
+                raise RuntimeError("fetch failed")
+
+        assert path.read_text() == "previous\n"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_base_writer_is_abstract(self, tmp_path):
+        with pytest.raises(TypeError, match="abstract"):
+            RowWriter(tmp_path / "out.csv", COLUMNS)  # type: ignore[abstract]
+
+
+def test_parquet_writer_round_trips_with_schema(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "out.parquet"
+    with open_row_writer(path, COLUMNS, schema=BOXSCORE_SCHEMA) as writer:
+        writer.write(row_values(_row()))
+
+    df = pd.read_parquet(path)
+    assert list(df.columns) == COLUMNS
+    assert str(df["week"].dtype) == "int32"
+    assert df.loc[0, "rs_actual_pf"] == 12.5
+
+
+class TestCleanCheck:
+    """The running check counts bad team-weeks like the old groupby did."""
+
+    def test_clean_team_week(self):
+        check = CleanCheck()
+        for _ in range(9):
+            check.add(_row(proj=1.0, act=2.0, team_proj=9.0, team_act=18.0))
+        check.add(_row(slot="BE", slot_type="bench", proj=50.0))
+        check.raise_if_unclean()
+
+    def test_counts_each_problem(self):
+        check = CleanCheck()
+        for _ in range(8):
+            check.add(_row(proj=1.0, act=2.0, team_proj=9.0, team_act=16.0))
+        with pytest.raises(ValidationError, match="proj=1, act=0, bad_count=1"):
+            check.raise_if_unclean()